@@ -12,8 +12,18 @@ Key insight: The profile shape depends on M*/M_halo ratio.
 - Cored at "sweet spot" (M*/M_halo ~ 0.5%)
 """
 
+import os
+from pathlib import Path
+
 import numpy as np
 
+# Cached enclosed-mass table (see dc14_mass_table)
+CACHE_DIR = Path(os.environ.get("UET_CACHE_DIR", Path(__file__).resolve().parents[2] / ".cache"))
+MASS_TABLE_VERSION = 1
+MASS_TABLE_X = (-4.1, -1.3, 421)  # log10(M*/M_halo): same range as dc14_profile_params
+MASS_TABLE_LNX = (np.log(1e-8), np.log(1e4), 481)  # ln(r / r_s)
+MASS_TABLE_PAD = 4  # extra X nodes beyond each end
+
 
 def dc14_profile_params(M_star, M_halo):
     """
@@ -38,6 +48,18 @@ def dc14_profile_params(M_star, M_halo):
     # Outside this range, use boundary values
     X = np.clip(X, -4.1, -1.3)
 
+    alpha, beta, gamma = _dc14_fitting_functions(X)
+
+    # Ensure physical bounds
+    alpha = np.clip(alpha, 0.5, 5.0)
+    beta = np.clip(beta, 2.0, 6.0)
+    gamma = np.clip(gamma, -1.0, 0.0)  # -1 = cuspy, 0 = cored
+
+    return alpha, beta, gamma
+
+
+def _dc14_fitting_functions(X):
+    """Unclipped DC14 fitting functions of X = log10(M*/M_halo)."""
     # Fitting functions from Di Cintio et al. 2014
     # These were calibrated from hydrodynamical simulations
 
@@ -51,14 +73,27 @@ def dc14_profile_params(M_star, M_halo):
     # gamma = 0 is fully cored, gamma = -1 is NFW cuspy
     gamma = -0.06 + np.log10((10 ** (X + 2.56)) ** (-0.68) + 10 ** (X + 2.56))
 
-    # Ensure physical bounds
-    alpha = np.clip(alpha, 0.5, 5.0)
-    beta = np.clip(beta, 2.0, 6.0)
-    gamma = np.clip(gamma, -1.0, 0.0)  # -1 = cuspy, 0 = cored
-
     return alpha, beta, gamma
 
 
+def _dc14_scale(M_halo, c, r_s=None):
+    """Scale radius (kpc) and characteristic density (Msun/kpc^3) of the halo."""
+    # Virial radius (approximation: R_vir ~ (M_halo / 1e12)^(1/3) × 200 kpc)
+    R_vir = 200 * (M_halo / 1e12) ** (1 / 3)  # kpc
+
+    # Scale radius
+    if r_s is None:
+        r_s = R_vir / c
+
+    # Characteristic density (from enclosed mass constraint)
+    # Simplified: use NFW-like normalization then adjust
+    rho_crit = 2.775e11  # h^2 Msun/Mpc^3 → ~1e-6 Msun/kpc^3
+    delta_c = (200 / 3) * c**3 / (np.log(1 + c) - c / (1 + c))
+    rho_s = delta_c * rho_crit * 1e-9  # Convert to Msun/kpc^3
+
+    return r_s, rho_s
+
+
 def dc14_density(r, M_halo, c, M_star, r_s=None):
     """
     DC14 dark matter density profile.
@@ -80,18 +115,7 @@ def dc14_density(r, M_halo, c, M_star, r_s=None):
     # Get profile parameters
     alpha, beta, gamma = dc14_profile_params(M_star, M_halo)
 
-    # Virial radius (approximation: R_vir ~ (M_halo / 1e12)^(1/3) × 200 kpc)
-    R_vir = 200 * (M_halo / 1e12) ** (1 / 3)  # kpc
-
-    # Scale radius
-    if r_s is None:
-        r_s = R_vir / c
-
-    # Characteristic density (from enclosed mass constraint)
-    # Simplified: use NFW-like normalization then adjust
-    rho_crit = 2.775e11  # h^2 Msun/Mpc^3 → ~1e-6 Msun/kpc^3
-    delta_c = (200 / 3) * c**3 / (np.log(1 + c) - c / (1 + c))
-    rho_s = delta_c * rho_crit * 1e-9  # Convert to Msun/kpc^3
+    r_s, rho_s = _dc14_scale(M_halo, c, r_s)
 
     # DC14 profile
     x = r / r_s
@@ -100,32 +124,152 @@ def dc14_density(r, M_halo, c, M_star, r_s=None):
     return rho
 
 
+def _dc14_enclosed_mass_quad(r, M_halo, c, M_star):
+    """Reference enclosed mass by direct quadrature (one radius per call)."""
+    from scipy import integrate
+
+    def integrand(r_prime):
+        return 4 * np.pi * r_prime**2 * dc14_density(r_prime, M_halo, c, M_star)
+
+    # Avoid r=0 singularity
+    r_min = r * 1e-6
+    M_enc, _ = integrate.quad(integrand, r_min, r)
+
+    return M_enc
+
+
+def _build_mass_table():
+    """
+    Dimensionless cumulative mass m(x) = ∫₀ˣ u^(2-γ) (1 + u^α)^(-(β-γ)/α) du.
+
+    α, β, γ depend on M*/M_halo only through X = log10(M*/M_halo), so the table
+    is laid out on (X, ln x). Each log interval is integrated with 8-point
+    Gauss-Legendre in ln u and accumulated; the head ∫₀^x_min uses the
+    two-term small-x series. A few nodes of smooth (unclipped) continuation
+    are added past both ends of X so the spline has no boundary error there.
+    """
+    X_lo, X_hi, n_X = MASS_TABLE_X
+    dX = (X_hi - X_lo) / (n_X - 1)
+    X = X_lo + dX * np.arange(-MASS_TABLE_PAD, n_X + MASS_TABLE_PAD)
+    lnx = np.linspace(*MASS_TABLE_LNX)
+    alpha, beta, gamma = _dc14_fitting_functions(X)
+    gamma = np.clip(gamma, -1.0, 0.0)
+    alpha, beta, gamma = alpha[:, None, None], beta[:, None, None], gamma[:, None, None]
+    p = (beta - gamma) / alpha
+
+    nodes, weights = np.polynomial.legendre.leggauss(8)
+    half = 0.5 * np.diff(lnx)
+    lnu = (0.5 * (lnx[1:] + lnx[:-1]))[:, None] + half[:, None] * nodes  # (n_x-1, 8)
+    u = np.exp(lnu)[None]
+
+    # d m = u^(3-γ) (1 + u^α)^(-p) d ln u
+    integrand = u ** (3 - gamma) * (1 + u**alpha) ** (-p)
+    increments = np.sum(integrand * weights, axis=-1) * half
+
+    x0 = np.exp(lnx[0])
+    a, b, g = alpha[:, 0, 0], p[:, 0, 0], gamma[:, 0, 0]
+    head = x0 ** (3 - g) / (3 - g) - b * x0 ** (3 - g + a) / (3 - g + a)
+
+    m = np.empty((X.size, lnx.size))
+    m[:, 0] = head
+    m[:, 1:] = head[:, None] + np.cumsum(increments, axis=-1)
+    return X, lnx, np.log(m)
+
+
+class _DC14MassTable:
+    """Bicubic spline of ln m over (X, ln x), built from the cached table."""
+
+    def __init__(self, X, lnx, ln_m):
+        from scipy.interpolate import RectBivariateSpline
+
+        self.X, self.lnx = X, lnx
+        self._spline = RectBivariateSpline(X, lnx, ln_m, kx=3, ky=3)
+
+    def covers(self, lnx):
+        return (lnx >= self.lnx[0]) & (lnx <= self.lnx[-1])
+
+    def __call__(self, X, lnx):
+        return np.exp(self._spline.ev(X, lnx))
+
+
+_MASS_TABLE = None
+
+
+def dc14_mass_table(rebuild=False):
+    """
+    Load (or build and cache) the dimensionless DC14 cumulative-mass table.
+
+    The table is stored as an .npz under CACHE_DIR and rebuilt when its
+    version or grid no longer matches this module.
+    """
+    global _MASS_TABLE
+    if _MASS_TABLE is not None and not rebuild:
+        return _MASS_TABLE
+
+    path = CACHE_DIR / "dc14_mass_table.npz"
+    signature = np.array(
+        [MASS_TABLE_VERSION, *MASS_TABLE_X, *MASS_TABLE_LNX, MASS_TABLE_PAD], dtype=float
+    )
+
+    table = None
+    if path.exists() and not rebuild:
+        try:
+            with np.load(path) as cached:
+                if np.array_equal(cached["signature"], signature):
+                    table = (cached["X"], cached["lnx"], cached["ln_m"])
+        except (OSError, KeyError, ValueError):
+            table = None
+
+    if table is None:
+        table = _build_mass_table()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            np.savez(path, signature=signature, X=table[0], lnx=table[1], ln_m=table[2])
+        except OSError:
+            pass  # read-only checkout: keep the in-memory table
+
+    _MASS_TABLE = _DC14MassTable(*table)
+    return _MASS_TABLE
+
+
 def dc14_enclosed_mass(r, M_halo, c, M_star):
     """
     Enclosed dark matter mass within radius r for DC14 profile.
-    Uses numerical integration.
+    Uses the precomputed cumulative-mass table (vectorized interpolation);
+    radii outside the table fall back to numerical integration.
 
     Parameters:
     -----------
-    r : float - Radius in kpc
+    r : float or array - Radius in kpc
     M_halo : float - Halo mass in solar masses
     c : float - Concentration parameter
     M_star : float - Stellar mass in solar masses
 
     Returns:
     --------
-    float - Enclosed mass in solar masses
+    float or array - Enclosed mass in solar masses
     """
-    from scipy import integrate
+    r, M_halo, c, M_star = np.broadcast_arrays(
+        np.asarray(r, dtype=float), np.asarray(M_halo, dtype=float), c, M_star
+    )
+    r_s, rho_s = _dc14_scale(M_halo, c)
 
-    def integrand(r_prime):
-        return 4 * np.pi * r_prime**2 * dc14_density(r_prime, M_halo, c, M_star)
+    # Same clipping of log10(M*/M_halo) as dc14_profile_params
+    X = np.clip(np.log10(M_star / M_halo), MASS_TABLE_X[0], MASS_TABLE_X[1])
+    with np.errstate(divide="ignore"):
+        lnx = np.log(r / r_s)
 
-    # Avoid r=0 singularity
-    r_min = r * 1e-6
-    M_enc, _ = integrate.quad(integrand, r_min, r)
+    table = dc14_mass_table()
+    inside = table.covers(lnx)
 
-    return M_enc
+    M_enc = np.zeros(r.shape)
+    M_enc[inside] = (4 * np.pi * rho_s * r_s**3)[inside] * table(X[inside], lnx[inside])
+
+    for idx in np.ndindex(r.shape):
+        if not inside[idx] and r[idx] > 0:
+            M_enc[idx] = _dc14_enclosed_mass_quad(r[idx], M_halo[idx], c[idx], M_star[idx])
+
+    return M_enc if M_enc.ndim else float(M_enc)
 
 
 def dc14_rotation_velocity(r, M_halo, c, M_star, M_disk, R_disk):
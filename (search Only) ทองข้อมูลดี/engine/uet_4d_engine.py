@@ -8,10 +8,83 @@
 """
 
 import numpy as np
+from pathlib import Path
 from typing import Callable, Tuple, Optional
 import time
 
 
+# Per-record diagnostics produced by UET4DSolver.run (one row per save_interval)
+DIAGNOSTIC_FIELDS = (
+    "t",
+    "energy",
+    "C_mean",
+    "I_mean",
+    "C_l2",
+    "I_l2",
+    "C_min",
+    "C_max",
+    "I_min",
+    "I_max",
+)
+
+
+class DiagnosticsRing:
+    """
+    Fixed-capacity ring buffer for run diagnostics.
+
+    Rows are stored in a preallocated structured array, so a run of any
+    length uses bounded memory. When `stream_path` is given every row is also
+    appended to a CSV file as it arrives, so nothing is lost once the ring
+    wraps around.
+    """
+
+    def __init__(
+        self, capacity: int, stream_path: Optional[str] = None, members: Optional[int] = None
+    ):
+        self.capacity = max(int(capacity), 1)
+        self.members = members  # ensemble size for batched runs (None = single run)
+
+        # "t" is shared; every other field holds one value per ensemble member
+        field_shape = () if members is None else (members,)
+        dtype = [("t", "f8")] + [(name, "f8", field_shape) for name in DIAGNOSTIC_FIELDS[1:]]
+        self.rows = np.zeros(self.capacity, dtype=dtype)
+        self.count = 0  # total rows ever appended
+        self._stream = None
+
+        if stream_path is not None:
+            Path(stream_path).parent.mkdir(parents=True, exist_ok=True)
+            self._stream = open(stream_path, "w", encoding="utf-8")
+            header = DIAGNOSTIC_FIELDS if members is None else ("member",) + DIAGNOSTIC_FIELDS
+            self._stream.write(",".join(header) + "\n")
+
+    def append(self, row: dict) -> None:
+        slot = self.rows[self.count % self.capacity]
+        for name in DIAGNOSTIC_FIELDS:
+            slot[name] = row[name]
+        self.count += 1
+
+        if self._stream is not None:
+            if self.members is None:
+                values = [slot[name] for name in DIAGNOSTIC_FIELDS]
+                self._stream.write(",".join(f"{v:.10g}" for v in values) + "\n")
+            else:
+                for m in range(self.members):
+                    values = [slot["t"]] + [slot[name][m] for name in DIAGNOSTIC_FIELDS[1:]]
+                    self._stream.write(f"{m}," + ",".join(f"{v:.10g}" for v in values) + "\n")
+
+    def close(self) -> None:
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+    def as_dict(self) -> dict:
+        """Return the retained rows in chronological order, one array per field."""
+        n = min(self.count, self.capacity)
+        start = self.count % self.capacity if self.count > self.capacity else 0
+        ordered = np.roll(self.rows[:n], -start) if start else self.rows[:n]
+        return {name: ordered[name].copy() for name in DIAGNOSTIC_FIELDS}
+
+
 class UET4DSolver:
     """
     4D Unity Equilibrium Theory Solver.
@@ -77,31 +150,111 @@ class UET4DSolver:
         self.z = np.linspace(0, Lz, Nz, endpoint=False)
         self.X, self.Y, self.Z = np.meshgrid(self.x, self.y, self.z, indexing="ij")
 
-        # History storage
-        self.history = {"t": [], "energy": [], "C_mean": [], "I_mean": []}
+        # Stencil coefficients (precomputed once)
+        self._inv_dx2 = 1.0 / self.dx**2
+        self._inv_dy2 = 1.0 / self.dy**2
+        self._inv_dz2 = 1.0 / self.dz**2
+        self._lap_center = 2.0 * (self._inv_dx2 + self._inv_dy2 + self._inv_dz2)
+
+        # Preallocated work buffers, keyed by (name, shape, dtype)
+        self._buffers = {}
+        self._R = None  # radius from box centre, built on first use
+
+        # History storage (filled by run)
+        self.history = {name: np.zeros(0) for name in DIAGNOSTIC_FIELDS}
 
         print(f"✅ UET 4D Solver initialized: {Nx}×{Ny}×{Nz} grid")
         print(f"   Memory usage: ~{(Nx*Ny*Nz*8*2)/1e6:.1f} MB for C+I fields")
 
-    def laplacian_3d(self, field: np.ndarray) -> np.ndarray:
+    def _work(self, name: str, shape: Tuple[int, ...], dtype=np.float64) -> np.ndarray:
+        """Return a named scratch buffer, allocated on first use and reused afterwards."""
+        key = (name, shape, np.dtype(dtype))
+        buf = self._buffers.get(key)
+        if buf is None:
+            buf = np.empty(shape, dtype=dtype)
+            self._buffers[key] = buf
+        return buf
+
+    def radius_grid(self) -> np.ndarray:
+        """Distance of every grid point from the box centre (computed once)."""
+        if self._R is None:
+            cx, cy, cz = self.Lx / 2, self.Ly / 2, self.Lz / 2
+            self._R = np.sqrt((self.X - cx) ** 2 + (self.Y - cy) ** 2 + (self.Z - cz) ** 2)
+        return self._R
+
+    def _fill_ghosts(self, field: np.ndarray) -> np.ndarray:
         """
-        Compute 3D Laplacian using finite differences.
-        Uses periodic boundary conditions.
+        Copy field into the ghost-padded buffer and wrap the periodic faces.
+
+        Only the six faces are filled: the 7-point Laplacian and the central
+        gradient never read edge or corner ghosts.
+        """
+        shape = field.shape[:-3] + tuple(n + 2 for n in field.shape[-3:])
+        g = self._work("ghost", shape, field.dtype)
+
+        g[..., 1:-1, 1:-1, 1:-1] = field
+        g[..., 0, 1:-1, 1:-1] = field[..., -1, :, :]
+        g[..., -1, 1:-1, 1:-1] = field[..., 0, :, :]
+        g[..., 1:-1, 0, 1:-1] = field[..., :, -1, :]
+        g[..., 1:-1, -1, 1:-1] = field[..., :, 0, :]
+        g[..., 1:-1, 1:-1, 0] = field[..., :, :, -1]
+        g[..., 1:-1, 1:-1, -1] = field[..., :, :, 0]
+        return g
+
+    def laplacian_3d(self, field: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
         """
-        lap = np.zeros_like(field)
+        Compute 3D Laplacian using finite differences.
+        Uses periodic boundary conditions (via a ghost layer).
 
-        # Second derivatives in each direction
-        lap += (np.roll(field, 1, axis=0) - 2 * field + np.roll(field, -1, axis=0)) / self.dx**2
-        lap += (np.roll(field, 1, axis=1) - 2 * field + np.roll(field, -1, axis=1)) / self.dy**2
-        lap += (np.roll(field, 1, axis=2) - 2 * field + np.roll(field, -1, axis=2)) / self.dz**2
+        If `out` is given the result is written there and no array is allocated.
+        `out` may alias `field`.
+        """
+        g = self._fill_ghosts(field)
+        if out is None:
+            out = np.empty_like(field)
+        tmp = self._work("stencil", field.shape, field.dtype)
+
+        # Neighbour sums in each direction, scaled by 1/h²
+        np.add(g[..., :-2, 1:-1, 1:-1], g[..., 2:, 1:-1, 1:-1], out=out)
+        out *= self._inv_dx2
+        np.add(g[..., 1:-1, :-2, 1:-1], g[..., 1:-1, 2:, 1:-1], out=tmp)
+        tmp *= self._inv_dy2
+        out += tmp
+        np.add(g[..., 1:-1, 1:-1, :-2], g[..., 1:-1, 1:-1, 2:], out=tmp)
+        tmp *= self._inv_dz2
+        out += tmp
+
+        # Centre term (read from the ghost buffer so `out` may alias `field`)
+        np.multiply(g[..., 1:-1, 1:-1, 1:-1], self._lap_center, out=tmp)
+        out -= tmp
+
+        return out
+
+    def gradient_3d(
+        self,
+        field: np.ndarray,
+        out: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Compute 3D gradient using central differences (periodic, ghost layer)."""
+        return self._gradient_from_ghosts(self._fill_ghosts(field), out)
 
-        return lap
+    def _gradient_from_ghosts(
+        self,
+        g: np.ndarray,
+        out: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Central gradient of the field currently held in the ghost buffer `g`."""
+        if out is None:
+            out = tuple(np.empty_like(g[..., 1:-1, 1:-1, 1:-1]) for _ in range(3))
+        grad_x, grad_y, grad_z = out
+
+        np.subtract(g[..., 2:, 1:-1, 1:-1], g[..., :-2, 1:-1, 1:-1], out=grad_x)
+        grad_x *= 0.5 / self.dx
+        np.subtract(g[..., 1:-1, 2:, 1:-1], g[..., 1:-1, :-2, 1:-1], out=grad_y)
+        grad_y *= 0.5 / self.dy
+        np.subtract(g[..., 1:-1, 1:-1, 2:], g[..., 1:-1, 1:-1, :-2], out=grad_z)
+        grad_z *= 0.5 / self.dz
 
-    def gradient_3d(self, field: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
-        """Compute 3D gradient using central differences."""
-        grad_x = (np.roll(field, -1, axis=0) - np.roll(field, 1, axis=0)) / (2 * self.dx)
-        grad_y = (np.roll(field, -1, axis=1) - np.roll(field, 1, axis=1)) / (2 * self.dy)
-        grad_z = (np.roll(field, -1, axis=2) - np.roll(field, 1, axis=2)) / (2 * self.dz)
         return grad_x, grad_y, grad_z
 
     def potential_derivative(
@@ -111,20 +264,35 @@ class UET4DSolver:
         a: float = -0.5,
         delta: float = 1.0,
         s: float = 0.0,
+        out: Optional[np.ndarray] = None,
     ) -> np.ndarray:
         """
         Compute dV/dC for various potential types.
 
         quartic: V(C) = a*C² + δ*C⁴ + s*C (asymmetric)
         """
-        if potential_type == "quartic":
-            return 2 * a * C + 4 * delta * C**3 + s
-        elif potential_type == "mexican_hat":
+        if potential_type == "mexican_hat":
             # V = -μ²|C|² + λ|C|⁴
             mu2, lam = a, delta  # reuse params
-            return -2 * mu2 * C + 4 * lam * C**3
+            lin, cub, const = -2 * mu2, 4 * lam, 0.0
+        elif potential_type == "quartic":
+            lin, cub, const = 2 * a, 4 * delta, s
         else:
-            return 2 * a * C + 4 * delta * C**3
+            lin, cub, const = 2 * a, 4 * delta, 0.0
+
+        if out is None:
+            out = np.empty_like(C)
+        tmp = self._work("potential", C.shape, C.dtype)
+
+        # lin*C + cub*C³ + const, evaluated in place
+        np.multiply(C, C, out=out)
+        out *= C
+        out *= cub
+        np.multiply(C, lin, out=tmp)
+        out += tmp
+        if const:
+            out += const
+        return out
 
     def chemical_potential(
         self,
@@ -134,6 +302,7 @@ class UET4DSolver:
         a: float = -0.5,
         delta: float = 1.0,
         s: float = 0.0,
+        out: Optional[np.ndarray] = None,
     ) -> np.ndarray:
         """
         Compute chemical potential μ = δΩ/δC.
@@ -143,48 +312,100 @@ class UET4DSolver:
         Complex physics (UDL/DC14) are handled in initialization.
         """
         # Classical Potential
-        mu = self.potential_derivative(C, potential_type, a, delta, s)
+        mu = self.potential_derivative(C, potential_type, a, delta, s, out=out)
 
         # Standard Gradient Term (Constant Kappa = Stable)
-        mu -= self.kappa * self.laplacian_3d(C)
+        lap = self.laplacian_3d(C, out=self._work("lap_C", C.shape, C.dtype))
+        lap *= self.kappa
+        mu -= lap
 
         # Information Coupling
-        mu += self.beta * I
+        tmp = self._work("coupling", C.shape, C.dtype)
+        np.multiply(I, self.beta, out=tmp)
+        mu += tmp
 
         return mu
 
-    def compute_energy(
+    @staticmethod
+    def _dot(x: np.ndarray, y: np.ndarray):
+        """Σ x·y over the three spatial axes (leading axes are kept)."""
+        lead = x.shape[:-3]
+        return np.einsum("...i,...i->...", x.reshape(lead + (-1,)), y.reshape(lead + (-1,)))
+
+    def _state_reductions(
         self,
         C: np.ndarray,
         I: np.ndarray,
-        potential_type: str = "quartic",
-        a: float = -0.5,
-        delta: float = 1.0,
-        s: float = 0.0,
-    ) -> float:
+        g: np.ndarray,
+        potential_type: str,
+        a: float,
+        delta: float,
+        s: float,
+        full: bool = True,
+    ) -> dict:
         """
-        Compute total free energy Ω.
-
-        Ω = ∫[V(C) + (κ/2)|∇C|² + β·C·I] dx
+        Energy and field statistics of (C, I), given the ghost buffer `g` already
+        filled with C. Sharing the ghost fill lets evolve_step produce these
+        without a second stencil pass.
         """
+        axes = (-3, -2, -1)
+        n_cells = C.shape[-3] * C.shape[-2] * C.shape[-1]
+        dV = self.dx * self.dy * self.dz
+
+        C2 = self._work("C2", C.shape, C.dtype)
+        np.multiply(C, C, out=C2)
+        sum_C = np.sum(C, axis=axes)
+        sum_C2 = np.sum(C2, axis=axes)
+        sum_I2 = self._dot(I, I)
+
         # Potential energy
+        V = a * sum_C2 + delta * self._dot(C2, C2)
         if potential_type == "quartic":
-            V = a * C**2 + delta * C**4 + s * C
-        else:
-            V = a * C**2 + delta * C**4
+            V = V + s * sum_C
 
         # Gradient energy
-        gx, gy, gz = self.gradient_3d(C)
-        grad_sq = gx**2 + gy**2 + gz**2
+        grads = tuple(self._work(name, C.shape, C.dtype) for name in ("gx", "gy", "gz"))
+        gx, gy, gz = self._gradient_from_ghosts(g, out=grads)
+        grad_sq = self._dot(gx, gx) + self._dot(gy, gy) + self._dot(gz, gz)
 
         # Coupling energy
-        coupling = self.beta * C * I
+        coupling = self.beta * self._dot(C, I)
 
         # Total energy (integrated)
         # Added 0.5 * I^2 term (Vacuum Stiffness)
-        energy_density = V + 0.5 * self.kappa * grad_sq + coupling + 0.5 * (I**2)
-        dV = self.dx * self.dy * self.dz
-        return np.sum(energy_density) * dV
+        energy = (V + 0.5 * self.kappa * grad_sq + coupling + 0.5 * sum_I2) * dV
+
+        stats = {"energy": energy}
+        if full:
+            stats.update(
+                C_mean=sum_C / n_cells,
+                I_mean=np.sum(I, axis=axes) / n_cells,
+                C_l2=np.sqrt(sum_C2 * dV),
+                I_l2=np.sqrt(sum_I2 * dV),
+                C_min=np.min(C, axis=axes),
+                C_max=np.max(C, axis=axes),
+                I_min=np.min(I, axis=axes),
+                I_max=np.max(I, axis=axes),
+            )
+        return stats
+
+    def compute_energy(
+        self,
+        C: np.ndarray,
+        I: np.ndarray,
+        potential_type: str = "quartic",
+        a: float = -0.5,
+        delta: float = 1.0,
+        s: float = 0.0,
+    ) -> float:
+        """
+        Compute total free energy Ω.
+
+        Ω = ∫[V(C) + (κ/2)|∇C|² + β·C·I] dx
+        """
+        g = self._fill_ghosts(C)
+        stats = self._state_reductions(C, I, g, potential_type, a, delta, s, full=False)
+        return float(stats["energy"])
 
     def evolve_step(
         self,
@@ -195,26 +416,54 @@ class UET4DSolver:
         delta: float = 1.0,
         s: float = 0.0,
         evolve_I: bool = True,
+        out: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+        diagnostics: Optional[dict] = None,
     ) -> Tuple[np.ndarray, np.ndarray]:
-        """Evolve C and I by one time step."""
-        mu_C = self.chemical_potential(C, I, potential_type, a, delta, s)
-        C_new = C + self.dt * self.M * self.laplacian_3d(mu_C)
+        """
+        Evolve C and I by one time step.
+
+        Pass `out=(C_new, I_new)` to write into existing arrays (they must not
+        alias C or I); `run` uses this to ping-pong two pairs of fields.
+
+        If a `diagnostics` dict is given it is filled with the energy and field
+        statistics of the incoming state, reusing the stencil pass of the update.
+        """
+        if out is None:
+            out = (np.empty_like(C), np.empty_like(I))
+        C_new, I_new = out
+
+        mu_C = self.chemical_potential(
+            C, I, potential_type, a, delta, s, out=self._work("mu", C.shape, C.dtype)
+        )
+        if diagnostics is not None:
+            # The ghost buffer still holds C from the Laplacian inside μ
+            g = self._work("ghost", C.shape[:-3] + tuple(n + 2 for n in C.shape[-3:]), C.dtype)
+            diagnostics.update(
+                self._state_reductions(C, I, g, potential_type, a, delta, s)
+            )
+        lap_mu = self.laplacian_3d(mu_C, out=mu_C)
+        np.multiply(lap_mu, self.dt * self.M, out=C_new)
+        C_new += C
 
         if evolve_I:
             # RELAXATION DYNAMICS (Allen-Cahn Type) for Information
             # I relaxes towards minimizing 'I + beta*C' -> I_target = -beta*C
             # This creates a "Cloud" of info around matter without unstable cross-diffusion
-            mu_I = self.beta * C + 1.0 * I
+            # mu_I = beta*C + 1.0*I
 
             # Non-conserved update: dI/dt = -M * mu_I
             # No laplacian here -> Much more stable
-            I_new = I - self.dt * self.M * mu_I
+            rate = self.dt * self.M
+            np.multiply(C, -rate * self.beta, out=I_new)
+            tmp = self._work("coupling", I.shape, I.dtype)
+            np.multiply(I, 1.0 - rate, out=tmp)
+            I_new += tmp
         else:
-            I_new = I
+            I_new[...] = I
 
         # Standard Clamping (Safety)
-        C_new = np.clip(C_new, -10.0, 10.0)
-        I_new = np.clip(I_new, -10.0, 10.0)
+        np.clip(C_new, -10.0, 10.0, out=C_new)
+        np.clip(I_new, -10.0, 10.0, out=I_new)
 
         return C_new, I_new
 
@@ -229,11 +478,8 @@ class UET4DSolver:
         Create HYBRID Analytical Initial Condition.
         Implements UDL/DC14 structure directly into the grid.
         """
-        X, Y, Z = self.X, self.Y, self.Z
-
-        # Center coordinates
-        cx, cy, cz = self.Lx / 2, self.Ly / 2, self.Lz / 2
-        R = np.sqrt((X - cx) ** 2 + (Y - cy) ** 2 + (Z - cz) ** 2)
+        # Distance from the box centre
+        R = self.radius_grid()
 
         if type == "dwarf_galaxy":
             # DC14-like Profile (Core + Halo)
@@ -264,35 +510,74 @@ class UET4DSolver:
         evolve_I: bool = True,
         save_interval: int = 10,
         verbose: bool = True,
+        history_size: Optional[int] = None,
+        diagnostics_path: Optional[str] = None,
+        snapshot_interval: Optional[int] = None,
+        snapshot_dir: Optional[str] = None,
     ) -> Tuple[np.ndarray, np.ndarray, dict]:
         """
         Run full 4D simulation.
 
-        Returns final C, I, and history dictionary.
+        Every `save_interval` steps the energy, means, L2 norms and extrema of the
+        state entering that step (time t = step*dt) are recorded. They come out of
+        the same stencil pass as the update and go into a ring buffer holding the
+        last `history_size` records (default: all of them). `diagnostics_path`
+        additionally streams every record to a CSV file, and `snapshot_interval`
+        with `snapshot_dir` saves the (C, I) fields as .npz files on their own
+        cadence.
+
+        Returns final C, I, and history dictionary (one array per field in
+        DIAGNOSTIC_FIELDS).
         """
         C = C0.copy()
         I = I0.copy()
+        C_next = np.empty_like(C)
+        I_next = np.empty_like(I)
 
-        self.history = {"t": [], "energy": [], "C_mean": [], "I_mean": []}
+        n_records = -(-n_steps // save_interval)
+        members = C.shape[0] if C.ndim == 4 else None
+        ring = DiagnosticsRing(
+            history_size or n_records, stream_path=diagnostics_path, members=members
+        )
+        if snapshot_interval and snapshot_dir:
+            Path(snapshot_dir).mkdir(parents=True, exist_ok=True)
 
         start_time = time.time()
 
-        for step in range(n_steps):
-            # Evolve
-            C, I = self.evolve_step(C, I, potential_type, a, delta, s, evolve_I)
-
-            # Record history
-            if step % save_interval == 0:
-                t = step * self.dt
-                E = self.compute_energy(C, I, potential_type, a, delta, s)
-
-                self.history["t"].append(t)
-                self.history["energy"].append(E)
-                self.history["C_mean"].append(np.mean(C))
-                self.history["I_mean"].append(np.mean(I))
-
-                if verbose and step % (save_interval * 10) == 0:
-                    print(f"   Step {step:5d}: t={t:.2f}, E={E:.4f}, <C>={np.mean(C):.4f}")
+        try:
+            for step in range(n_steps):
+                if snapshot_interval and snapshot_dir and step % snapshot_interval == 0:
+                    np.savez(
+                        Path(snapshot_dir) / f"snapshot_{step:06d}.npz", C=C, I=I, t=step * self.dt
+                    )
+
+                # Record history alongside this step's update
+                record = {"t": step * self.dt} if step % save_interval == 0 else None
+
+                # Evolve (ping-pong between the two field pairs, no per-step allocation)
+                self.evolve_step(
+                    C,
+                    I,
+                    potential_type,
+                    a,
+                    delta,
+                    s,
+                    evolve_I,
+                    out=(C_next, I_next),
+                    diagnostics=record,
+                )
+                C, C_next = C_next, C
+                I, I_next = I_next, I
+
+                if record is not None:
+                    ring.append(record)
+
+                    if verbose and step % (save_interval * 10) == 0:
+                        self._report(step, record)
+        finally:
+            ring.close()
+
+        self.history = ring.as_dict()
 
         elapsed = time.time() - start_time
         if verbose:
@@ -300,6 +585,141 @@ class UET4DSolver:
 
         return C, I, self.history
 
+    def _report(self, step: int, record: dict) -> None:
+        """Progress line printed by run()."""
+        print(
+            f"   Step {step:5d}: t={record['t']:.2f}, E={record['energy']:.4f}, "
+            f"<C>={record['C_mean']:.4f}"
+        )
+
+
+class UET4DBatchSolver(UET4DSolver):
+    """
+    Ensemble version of UET4DSolver.
+
+    Evolves a stack of B independent (C, I) pairs with shape (B, Nx, Ny, Nz) in
+    lockstep. All members share one grid, one set of stencil coefficients, the
+    ghost/work buffers and the radius grid, so a population study of hundreds
+    of galaxies costs one vectorized update per step instead of B solver runs.
+
+    Each step is applied block by block over the member axis (`block_size`
+    members at a time) so the working set of one block stays in cache; the
+    default block holds about BLOCK_CELLS grid cells per field.
+
+    run() returns history arrays of shape (n_records, B) for every field except
+    "t".
+    """
+
+    BLOCK_CELLS = 2**16  # ~512 kB per float64 field
+
+    def __init__(self, batch_size: int, block_size: Optional[int] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.batch_size = int(batch_size)
+        cells = self.Nx * self.Ny * self.Nz
+        self.block_size = int(block_size or max(1, self.BLOCK_CELLS // cells))
+
+        print(
+            f"   Batch: {self.batch_size} members "
+            f"(~{(self.batch_size*cells*8*2)/1e6:.1f} MB for C+I stacks, "
+            f"blocks of {min(self.block_size, self.batch_size)})"
+        )
+
+    def _member_params(self, **params) -> dict:
+        """Broadcast scalar or per-member parameters to shape (B, 1, 1, 1)."""
+        shaped = {}
+        for name, value in params.items():
+            value = np.broadcast_to(np.asarray(value, dtype=float), (self.batch_size,))
+            shaped[name] = value.reshape(-1, 1, 1, 1)
+        return shaped
+
+    def create_galaxy_initial_condition(
+        self,
+        type: str = "dwarf_galaxy",
+        radius=5.0,
+        core_density=1.0,
+        halo_density=0.1,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Create HYBRID Analytical Initial Conditions for the whole ensemble.
+
+        radius, core_density and halo_density may be scalars or length-B
+        arrays; each member gets its own profile on the shared radius grid.
+        """
+        p = self._member_params(radius=radius, core_density=core_density, halo_density=halo_density)
+        R = self.radius_grid()[np.newaxis]
+        x = R / p["radius"]
+
+        if type == "dwarf_galaxy":
+            # DC14-like Profile (Core + Halo)
+            C0 = p["core_density"] * np.exp(-(x**2))
+            I0 = p["halo_density"] / (1 + x**2)
+        else:
+            # Default NFW-like cusp
+            profile = x * (1 + x) ** 2 + 0.1
+            C0 = p["core_density"] / profile
+            I0 = p["halo_density"] / profile
+
+        return C0, I0
+
+    def evolve_step(
+        self,
+        C: np.ndarray,
+        I: np.ndarray,
+        potential_type: str = "quartic",
+        a: float = -0.5,
+        delta: float = 1.0,
+        s: float = 0.0,
+        evolve_I: bool = True,
+        out: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+        diagnostics: Optional[dict] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Evolve every member by one time step, one cache-sized block at a time."""
+        if out is None:
+            out = (np.empty_like(C), np.empty_like(I))
+
+        n = C.shape[0]
+        if n <= self.block_size:
+            return super().evolve_step(
+                C, I, potential_type, a, delta, s, evolve_I, out=out, diagnostics=diagnostics
+            )
+
+        records = []
+        for start in range(0, n, self.block_size):
+            block = slice(start, start + self.block_size)
+            record = {} if diagnostics is not None else None
+            super().evolve_step(
+                C[block],
+                I[block],
+                potential_type,
+                a,
+                delta,
+                s,
+                evolve_I,
+                out=(out[0][block], out[1][block]),
+                diagnostics=record,
+            )
+            records.append(record)
+
+        if diagnostics is not None:
+            for key in records[0]:
+                diagnostics[key] = np.concatenate([r[key] for r in records])
+
+        return out
+
+    def run(self, C0: np.ndarray, I0: np.ndarray, **kwargs) -> Tuple[np.ndarray, np.ndarray, dict]:
+        """Run the ensemble. Accepts the same keyword arguments as UET4DSolver.run."""
+        expected = (self.batch_size, self.Nx, self.Ny, self.Nz)
+        if C0.shape != expected or I0.shape != expected:
+            raise ValueError(f"Expected C0 and I0 with shape {expected}, got {C0.shape}, {I0.shape}")
+        return super().run(C0, I0, **kwargs)
+
+    def _report(self, step: int, record: dict) -> None:
+        E = record["energy"]
+        print(
+            f"   Step {step:5d}: t={record['t']:.2f}, "
+            f"E=[{E.min():.4f} .. {E.max():.4f}] over {E.size} members"
+        )
+
 
 def create_initial_condition_3d(
     Nx: int, Ny: int, Nz: int, type: str = "random", amplitude: float = 0.1, seed: int = 42
@@ -10,6 +10,51 @@ This is the TRUE power of UET - CONTROL not prediction!
 import numpy as np
 
 
+class TrajectoryPlan:
+    """
+    Planned trajectories for a batch of start/target pairs.
+
+    Arrays (P = number of pairs, N = number of steps):
+        C          : (P, N+1) planned states, C[:, 0] = start, C[:, -1] = target
+        required_I : (P, N) information injection per step
+    Text interpretations are only built when asked for.
+    """
+
+    def __init__(self, controller, C, required_I, mode):
+        self.controller = controller
+        self.C = C
+        self.required_I = required_I
+        self.mode = mode
+
+    def __len__(self):
+        return self.C.shape[0]
+
+    @property
+    def n_steps(self):
+        return self.required_I.shape[1]
+
+    @property
+    def total_I(self):
+        return self.required_I.sum(axis=1)
+
+    @property
+    def total_abs_I(self):
+        return np.abs(self.required_I).sum(axis=1)
+
+    def records(self, index=0):
+        """Step records of one pair (same format as plan_trajectory)."""
+        C, I = self.C[index], self.required_I[index]
+        return [
+            {"step": i + 1, "from": C[i], "to": C[i + 1], "required_I": I[i]}
+            for i in range(self.n_steps)
+        ]
+
+    def interpretation(self, index=0):
+        """Plain-language actions for every step of one pair."""
+        C, I = self.C[index], self.required_I[index]
+        return [self.controller._interpret(C[i + 1] - C[i], I[i]) for i in range(self.n_steps)]
+
+
 class UETController:
     """
     UET-based controller for achieving desired outcomes.
@@ -44,10 +89,8 @@ class UETController:
 
         # For single point (no spatial):
         # dV/dC ≈ C(C² - 1) (double-well)
-        dV_dC = C_current * (C_current**2 - 1)
-
         # Required I (information injection) to achieve target
-        required_I = (required_mu - dV_dC) / self.beta
+        required_I = self._required_I(C_current, C_target, dt)
 
         return {
             "current": C_current,
@@ -76,26 +119,115 @@ class UETController:
 
         return actions
 
-    def plan_trajectory(self, C_start, C_target, n_steps=10):
+    def _required_I(self, C_from, C_to, dt=1.0):
+        """Numeric core of compute_required_intervention (broadcasts over arrays)."""
+        return ((C_to - C_from) / dt - C_from * (C_from**2 - 1)) / self.beta
+
+    def plan_trajectory(self, C_start, C_target, n_steps=10, mode="linear", **kwargs):
         """
         Plan a trajectory from C_start to C_target.
         Returns required interventions at each step.
         """
-        trajectory = []
-        C = C_start
+        plan = self.plan_trajectories([C_start], [C_target], n_steps, mode=mode, **kwargs)
+        return plan.records(0)
 
-        # Linear interpolation for target trajectory
-        C_path = np.linspace(C_start, C_target, n_steps + 1)
+    def plan_trajectories(
+        self, C_start, C_target, n_steps=10, dt=1.0, mode="linear", grid_size=201, margin=0.5
+    ):
+        """
+        Plan trajectories for many start/target pairs at once.
 
-        for i in range(n_steps):
-            step_target = C_path[i + 1]
-            result = self.compute_required_intervention(C, step_target)
-            trajectory.append(
-                {"step": i + 1, "from": C, "to": step_target, "required_I": result["required_I"]}
-            )
-            C = step_target
+        mode="linear"  : straight-line path in C (same as plan_trajectory)
+        mode="optimal" : path minimizing total |I| under the double-well
+                         dynamics, found by dynamic programming over a grid
+                         of intermediate states per pair. The grid spans the
+                         start-target interval widened by `margin` on each side.
 
-        return trajectory
+        Returns:
+            TrajectoryPlan
+        """
+        C_start = np.atleast_1d(np.asarray(C_start, dtype=float))
+        C_target = np.atleast_1d(np.asarray(C_target, dtype=float))
+        C_start, C_target = np.broadcast_arrays(C_start, C_target)
+
+        if mode == "linear":
+            s = np.linspace(0.0, 1.0, n_steps + 1)
+            C = C_start[:, None] + (C_target - C_start)[:, None] * s
+        elif mode == "optimal":
+            C = self._optimal_paths(C_start, C_target, n_steps, dt, grid_size, margin)
+        else:
+            raise ValueError(f"Unknown planning mode: {mode}")
+
+        required_I = self._required_I(C[:, :-1], C[:, 1:], dt)
+        return TrajectoryPlan(self, C, required_I, mode)
+
+    def _optimal_paths(self, C_start, C_target, n_steps, dt, grid_size, margin):
+        """
+        Min-Σ|I| paths; intermediate states live on a per-pair grid.
+
+        From state g_i the free (I=0) dynamics land on y_i = g_i + dt·g_i(g_i²-1),
+        so a step to g_j costs |I| = |g_j - y_i| / (β dt). Each DP step is then
+        an L1 distance transform, done with sorted prefix/suffix minima in
+        O(M log M) per pair instead of the O(M²) all-pairs table.
+        """
+        n_pairs = C_start.size
+        C = np.empty((n_pairs, n_steps + 1))
+        C[:, 0], C[:, -1] = C_start, C_target
+        if n_steps == 1:
+            return C
+
+        k = self.beta * dt
+        span = np.maximum(np.abs(C_target - C_start), 1e-3)
+        g_lo = np.minimum(C_start, C_target) - margin * span
+        g_hi = np.maximum(C_start, C_target) + margin * span
+        grid = g_lo[:, None] + (g_hi - g_lo)[:, None] * np.linspace(0.0, 1.0, grid_size)
+        y = grid + dt * grid * (grid**2 - 1)
+
+        # Sort drift landings once per pair; offset rows so one searchsorted
+        # call over the flattened array handles every pair
+        order = np.argsort(y, axis=1)
+        ys = np.take_along_axis(y, order, axis=1)
+        width = max(ys.max(), grid.max()) - min(ys.min(), grid.min()) + 1.0
+        offset = width * np.arange(n_pairs)[:, None]
+        count = np.searchsorted((ys + offset).ravel(), (grid + offset).ravel(), side="right")
+        count = count.reshape(grid.shape) - grid_size * np.arange(n_pairs)[:, None]
+        has_left, has_right = count > 0, count < grid_size
+        left = np.maximum(count - 1, 0)
+        right = np.minimum(count, grid_size - 1)
+        index = np.broadcast_to(np.arange(grid_size), grid.shape)
+
+        def running_min(values):
+            best = np.minimum.accumulate(values, axis=1)
+            arg = np.maximum.accumulate(np.where(values == best, index, 0), axis=1)
+            return best, arg
+
+        rows = np.arange(n_pairs)[:, None]
+        V = np.abs(self._required_I(C_start[:, None], grid, dt))
+        parents = np.empty((n_steps - 2, *grid.shape), dtype=np.intp)
+        for step in range(n_steps - 2):
+            Vs = np.take_along_axis(V, order, axis=1)
+            # Landing below g_j: V_i + (g_j - y_i)/k ; above: V_i + (y_i - g_j)/k
+            below, arg_below = running_min(Vs - ys / k)
+            above, arg_above = running_min((Vs + ys / k)[:, ::-1])
+            above, arg_above = above[:, ::-1], grid_size - 1 - arg_above[:, ::-1]
+
+            cost_below = np.where(has_left, below[rows, left] + grid / k, np.inf)
+            cost_above = np.where(has_right, above[rows, right] - grid / k, np.inf)
+            use_below = cost_below <= cost_above
+            V = np.where(use_below, cost_below, cost_above)
+            best = np.where(use_below, arg_below[rows, left], arg_above[rows, right])
+            parents[step] = order[rows, best]
+
+        # Final step lands exactly on the target, then backtrack
+        V = V + np.abs(self._required_I(grid, C_target[:, None], dt))
+        j = np.argmin(V, axis=1)
+        rows = rows[:, 0]
+        for step in range(n_steps - 1, 0, -1):
+            C[:, step] = grid[rows, j]
+            if step > 1:
+                j = parents[step - 2][rows, j]
+
+        return C
 
 
 def run_demo():
@@ -142,6 +274,20 @@ def run_demo():
     print("-" * 40)
     print(f"{'Total':>5} {'':<10} {'':<10} {total_I:>12.4f}")
 
+    print()
+    print("=" * 70)
+    print("⚡ OPTIMAL vs LINEAR PLAN (minimum total |I|)")
+    print("=" * 70)
+
+    targets = np.linspace(-0.3, 0.3, 7)
+    linear = controller.plan_trajectories(0.0, targets, n_steps=10)
+    optimal = controller.plan_trajectories(0.0, targets, n_steps=10, mode="optimal")
+
+    print(f"\n{'Target':>8} {'Linear Σ|I|':>12} {'Optimal Σ|I|':>13}")
+    print("-" * 36)
+    for target, lin, opt in zip(targets, linear.total_abs_I, optimal.total_abs_I):
+        print(f"{target:>8.2f} {lin:>12.4f} {opt:>13.4f}")
+
     print()
     print("=" * 70)
     print("🎓 INTERPRETATION")
@@ -5,15 +5,19 @@ The main entry point for running v0.9 Tensor Simulations.
 
 Usage:
   python run_matrix_simulation.py --config my_config.json
+  python run_matrix_simulation.py --config my_config.json --snapshot-every 1 --projection max
 
 Process:
 1. Load Config (JSON).
 2. Initialize Matrix Engine & State.
 3. Run Evolution Loop.
 4. Generate Heatmap Outputs (PNG).
+   --snapshot-every N also writes per-step frames to <output_dir>/frames
+   (NumPy/zlib, in parallel); --fast writes the final heatmaps the same way.
 """
 
 import argparse
+import contextlib
 import sys
 import os
 import numpy as np
@@ -22,10 +26,16 @@ import numpy as np
 sys.path.append(os.path.dirname(__file__))
 
 from research_uet.core.uet_matrix_engine import MatrixEvolution, UniverseState
-from research_uet.core.uet_matrix_toolkit import MatrixConfig, MatrixVisualizer
+from research_uet.core.uet_matrix_toolkit import (
+    PROJECTIONS,
+    MatrixConfig,
+    MatrixVisualizer,
+    SnapshotWriter,
+)
+from research_uet.core.uet_viz import plots_disabled
 
 
-def run_simulation(config_path):
+def run_simulation(config_path, snapshot_every=0, projection="slice", fast=False):
     print("=" * 60)
     print("🌌 MATRIX UET STUDIO (CLI)")
     print("=" * 60)
@@ -46,15 +56,30 @@ def run_simulation(config_path):
 
     # 4. Evolution Loop
     print("\nRunning Evolution...")
-    for t in range(cfg.steps):
-        state = engine.step(state, dt=cfg.dt)
-        if t % 50 == 0:
-            print(f"Step {t}/{cfg.steps} complete...")
+    frames = None
+    if snapshot_every > 0:  # no frames/ folder or writer threads otherwise
+        frames = SnapshotWriter(os.path.join(cfg.output_dir, "frames"), projection=projection)
+    with frames or contextlib.nullcontext():
+        for t in range(cfg.steps):
+            state = engine.step(state, dt=cfg.dt)
+            if frames and t % snapshot_every == 0:
+                frames.add(state, t)
+            if t % 50 == 0:
+                print(f"Step {t}/{cfg.steps} complete...")
+    if frames and frames.futures:
+        print(f"Wrote {len(frames.futures)} frames to {frames.output_dir}")
 
     # 5. Output
-    print(f"\nSimulation Complete. Generating Heatmaps in: {cfg.output_dir}")
-    vis = MatrixVisualizer()
-    vis.plot_state_layers(state, os.path.join(cfg.output_dir, "final_state"))
+    if plots_disabled():
+        print("\nSimulation Complete. Plots disabled (UET_NO_PLOTS), no heatmaps written.")
+    else:
+        print(f"\nSimulation Complete. Generating Heatmaps in: {cfg.output_dir}")
+        vis = MatrixVisualizer()
+        prefix = os.path.join(cfg.output_dir, "final_state")
+        if fast:
+            vis.save_state_layers(state, prefix, projection)
+        else:
+            vis.plot_state_layers(state, prefix, projection)
 
     print("✅ DONE.")
 
@@ -62,11 +87,20 @@ def run_simulation(config_path):
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Run UET Matrix Simulation")
     parser.add_argument("--config", type=str, required=True, help="Path to JSON config file")
+    parser.add_argument(
+        "--snapshot-every", type=int, default=0, help="write frames every N steps (0 = off)"
+    )
+    parser.add_argument(
+        "--projection", choices=PROJECTIONS, default="slice", help="3D -> 2D reduction (z axis)"
+    )
+    parser.add_argument(
+        "--fast", action="store_true", help="final heatmaps without matplotlib (no labels)"
+    )
 
     args = parser.parse_args()
 
     try:
-        run_simulation(args.config)
+        run_simulation(args.config, args.snapshot_every, args.projection, args.fast)
     except Exception as e:
         print(f"❌ Error: {e}")
         sys.exit(1)
@@ -0,0 +1,137 @@
+"""
+UET Fast Heatmap Checker
+========================
+Purpose: The NumPy heatmap path of uet_matrix_toolkit must reduce 3D
+layers correctly, colour them like imshow(origin="lower", cmap="viridis")
+and write valid PNGs, also from many snapshots in parallel.
+"""
+
+import os
+import struct
+import sys
+import tempfile
+import time
+import zlib
+
+import numpy as np
+
+os.environ.pop("UET_NO_PLOTS", None)
+sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
+
+from research_uet.core.uet_matrix_engine import UniverseState
+from research_uet.core.uet_matrix_toolkit import (
+    MatrixVisualizer,
+    SnapshotWriter,
+    colorize,
+    colormap_lut,
+    extract_2d,
+    write_png,
+)
+
+TMP = tempfile.mkdtemp(prefix="uet_heatmap_")
+
+
+def read_png(filename):
+    """(H, W, 3) pixels of an 8-bit RGB PNG written without filters."""
+    with open(filename, "rb") as f:
+        data = f.read()
+    assert data[:8] == b"\x89PNG\r\n\x1a\n"
+    pos, idat, size = 8, b"", None
+    while pos < len(data):
+        length, kind = struct.unpack(">I4s", data[pos : pos + 8])
+        body = data[pos + 8 : pos + 8 + length]
+        crc = struct.unpack(">I", data[pos + 8 + length : pos + 12 + length])[0]
+        assert crc == zlib.crc32(kind + body), kind
+        if kind == b"IHDR":
+            size = struct.unpack(">II", body[:8])
+        elif kind == b"IDAT":
+            idat += body
+        pos += 12 + length
+    width, height = size
+    rows = np.frombuffer(zlib.decompress(idat), dtype=np.uint8).reshape(height, -1)
+    return rows[:, 1:].reshape(height, width, 3)
+
+
+def validation_scenario_1_slices_and_projections():
+    print("--- Scenario 1: 3D -> 2D Slices and Projections ---")
+    field = np.random.default_rng(0).random((6, 7, 8))
+    checks = [
+        np.array_equal(extract_2d(field), field[:, :, 4]),
+        np.array_equal(extract_2d(field, "slice", axis=0, index=2), field[2]),
+        np.allclose(extract_2d(field, "max", axis=1), field.max(axis=1)),
+        np.allclose(extract_2d(field, "mean"), field.mean(axis=-1)),
+        extract_2d(field[:, :, 0]).shape == (6, 7),
+    ]
+    print(f"Checks: {checks}")
+    return all(checks)
+
+
+def validation_scenario_2_png_round_trip():
+    print("\n--- Scenario 2: LUT Colours, Orientation and PNG Round Trip ---")
+    image = np.zeros((4, 5))
+    image[0, 0] = 1.0  # row 0 is the bottom row (origin="lower")
+    lut = colormap_lut("viridis")
+    rgb = colorize(image, lut, scale=3)
+    filename = os.path.join(TMP, "tiny.png")
+    write_png(filename, rgb)
+    pixels = read_png(filename)
+
+    ends_ok = tuple(lut[0]) == (68, 1, 84) and tuple(lut[-1]) == (253, 231, 37)
+    bottom_left_bright = tuple(pixels[-1, 0]) == tuple(lut[-1])
+    print(f"Shape {pixels.shape}, LUT ends ok: {ends_ok}, peak bottom-left: {bottom_left_bright}")
+    round_trip = pixels.shape == (12, 15, 3) and np.array_equal(pixels, rgb)
+    return round_trip and ends_ok and bottom_left_bright
+
+
+def validation_scenario_3_parallel_snapshots():
+    print("\n--- Scenario 3: 200 Snapshots Written in Parallel ---")
+    state = UniverseState(32)
+    rng = np.random.default_rng(1)
+    out = os.path.join(TMP, "frames")
+
+    start = time.perf_counter()
+    with SnapshotWriter(out, layers=(0, 1), projection="max", workers=4) as frames:
+        for step in range(100):
+            state.tensor[:2] = rng.random((2, 32, 32, 32))
+            frames.add(state, step)
+    elapsed = time.perf_counter() - start
+
+    names = sorted(os.listdir(out))
+    valid = all(read_png(os.path.join(out, n)).shape == (512, 512, 3) for n in names[::25])
+    print(f"{len(names)} frames in {elapsed:.2f}s, sampled PNGs valid: {valid}")
+    return len(names) == 200 and names[0] == "info_00000.png" and valid
+
+
+def validation_scenario_4_state_layers():
+    print("\n--- Scenario 4: save_state_layers on a 3D State ---")
+    state = UniverseState(16)
+    state.tensor[0, 6:10, 6:10, :] = 10.0
+    prefix = os.path.join(TMP, "final_state")
+    MatrixVisualizer.save_state_layers(state, prefix)
+    written = sorted(n for n in os.listdir(TMP) if n.startswith("final_state"))
+    print(f"Written: {written}")
+    return written == ["final_state_flux.png", "final_state_info.png", "final_state_mass.png"]
+
+
+def run_suite():
+    print("=" * 60)
+    print("🗺️ UET FAST HEATMAP CHECKER")
+    print("=" * 60)
+
+    results = [
+        validation_scenario_1_slices_and_projections(),
+        validation_scenario_2_png_round_trip(),
+        validation_scenario_3_parallel_snapshots(),
+        validation_scenario_4_state_layers(),
+    ]
+
+    print(f"\n{sum(results)}/{len(results)} PASS")
+    if all(results):
+        print("✅ FAST HEATMAPS VERIFIED")
+    else:
+        print("❌ FAST HEATMAP CHECKS FAILED")
+    return all(results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_suite() else 1)
@@ -0,0 +1,104 @@
+"""
+UET Galaxy Model Validator
+==========================
+Purpose: Ensure the vectorized ragged rotation-curve engine matches the
+per-galaxy evaluation point for point, and that per-galaxy scores are
+reduced over the right curve segments.
+"""
+
+import numpy as np
+import sys
+import os
+
+# Add path to research_uet
+sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
+
+from research_uet.core.uet_galaxy_model import curve_statistics, rotation_velocity
+
+
+def make_ragged_sample(n_galaxies=40, seed=0):
+    rng = np.random.default_rng(seed)
+    counts = rng.integers(0, 30, n_galaxies)
+    counts[3] = 0  # galaxy without data
+    offsets = np.concatenate([[0], np.cumsum(counts)])
+    r = rng.uniform(0.2, 40, offsets[-1])
+    M_disk = 10 ** rng.uniform(7, 11, n_galaxies)
+    R_disk = rng.uniform(0.5, 8, n_galaxies)
+    return r, offsets, M_disk, R_disk
+
+
+def validation_scenario_1_ragged_parity():
+    print("--- Scenario 1: Ragged vs Per-Galaxy Evaluation ---")
+    r, offsets, M_disk, R_disk = make_ragged_sample()
+
+    v_flat = rotation_velocity(r, M_disk, R_disk, offsets)
+    v_loop = np.concatenate(
+        [
+            rotation_velocity(r[offsets[i] : offsets[i + 1]], M_disk[i], R_disk[i])
+            for i in range(len(M_disk))
+        ]
+    )
+
+    err = np.max(np.abs(v_flat / v_loop - 1))
+    print(f"Points: {len(r)}, max relative difference: {err:.2e}")
+    return err < 1e-12
+
+
+def validation_scenario_2_rotmod_baryons():
+    print("\n--- Scenario 2: SPARC Baryon Components ---")
+    r = np.array([1.0, 2.0, 4.0])
+    V_gas = np.array([-5.0, 10.0, 20.0])  # negative gas velocity = outward force
+    V_disk = np.array([50.0, 80.0, 90.0])
+
+    parts = rotation_velocity(
+        r, 1e10, 2.0, V_gas=V_gas, V_disk=V_disk, upsilon_disk=0.5, components=True
+    )
+    V_bar2 = V_gas * np.abs(V_gas) + 0.5 * V_disk**2
+    ok = np.allclose(parts["V_total"] ** 2, V_bar2 + parts["V_I"] ** 2)
+    print(f"V_total² = V_bar² + V_I²: {ok}")
+    return ok
+
+
+def validation_scenario_3_statistics():
+    print("\n--- Scenario 3: Per-Galaxy χ² Reduction ---")
+    r, offsets, M_disk, R_disk = make_ragged_sample(seed=1)
+    rng = np.random.default_rng(2)
+    v_model = rotation_velocity(r, M_disk, R_disk, offsets)
+    v_obs = v_model * (1 + 0.05 * rng.standard_normal(len(r)))
+    v_err = np.full(len(r), 5.0)
+
+    stats = curve_statistics(v_model, v_obs, v_err, offsets)
+    ok = True
+    for i in range(len(M_disk)):
+        seg = slice(offsets[i], offsets[i + 1])
+        if offsets[i] == offsets[i + 1]:
+            ok &= bool(np.isnan(stats["chi2"][i]))
+            continue
+        chi2 = np.sum(((v_model[seg] - v_obs[seg]) / v_err[seg]) ** 2)
+        ok &= bool(np.isclose(stats["chi2"][i], chi2))
+
+    print(f"Galaxies: {len(M_disk)}, χ² per galaxy matches loop: {ok}")
+    return ok
+
+
+def run_suite():
+    print("=" * 60)
+    print("🌌 UET GALAXY MODEL CHECKER")
+    print("=" * 60)
+
+    results = [
+        validation_scenario_1_ragged_parity(),
+        validation_scenario_2_rotmod_baryons(),
+        validation_scenario_3_statistics(),
+    ]
+
+    print(f"\n{sum(results)}/{len(results)} PASS")
+    if all(results):
+        print("✅ GALAXY MODEL VERIFIED")
+    else:
+        print("❌ GALAXY MODEL CHECKS FAILED")
+    return all(results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_suite() else 1)
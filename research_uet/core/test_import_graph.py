@@ -0,0 +1,115 @@
+"""
+UET Test Selection Checker
+==========================
+Purpose: `--files` / `--changed` (topics/import_graph.py) must select the
+tests a change can break and nothing else: a core module change selects
+only the tests importing it (also when the module was deleted or renamed),
+a helper change selects its folder's tests, and docs select nothing.
+
+The import graph is kept in a temporary file so .cache/ is left alone.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+TOPICS = ROOT / "research_uet" / "topics"
+CORE = ROOT / "research_uet" / "core"
+sys.path.insert(0, str(TOPICS))
+
+import import_graph  # noqa: E402
+import result_cache  # noqa: E402
+from scheduler import find_tests  # noqa: E402
+
+TESTS = find_tests()
+GRAPH_FILE = Path(tempfile.mkdtemp(prefix="uet_graph_")) / "import_graph.json"
+
+
+def selected(*changed):
+    """Relative paths of the tests selected by some changed files."""
+    graph = import_graph.ImportGraph(GRAPH_FILE)
+    tests = graph.affected_tests(TESTS, changed)
+    return sorted(t["path"].relative_to(TOPICS).as_posix() for t in tests)
+
+
+def validation_scenario_1_engine_selects_fluid_tests():
+    print("--- Scenario 1: uet_matrix_engine.py Selects Only the Fluid Tests ---")
+    tests = selected(CORE / "uet_matrix_engine.py")
+    for name in tests:
+        print(f"  {name}")
+    fluid = "0.10_Fluid_Dynamics_Chaos/Code/"
+    expected = [
+        fluid + "poiseuille/test_00_basic_advection.py",
+        fluid + "poiseuille/test_01_poiseuille_pipe.py",
+        fluid + "turbulence/test_02_vortex_wake.py",
+        fluid + "turbulence/test_03_turbulence_stress.py",
+    ]
+    return tests == expected
+
+
+def validation_scenario_2_deleted_module():
+    print("\n--- Scenario 2: A Deleted Core Module Still Selects Its Importers ---")
+    before = selected(CORE / "uet_viz.py")
+
+    real_files = result_cache.core_module_files
+
+    def without_viz(name):  # as if core/uet_viz.py had been deleted
+        return [] if name == "uet_viz" else real_files(name)
+
+    result_cache.core_module_files = import_graph.core_module_files = without_viz
+    try:
+        after = selected(CORE / "uet_viz.py")
+        renamed = selected(CORE / "uet_viz.py", CORE / "uet_plots.py")
+    finally:
+        result_cache.core_module_files = import_graph.core_module_files = real_files
+
+    print(
+        f"Tests importing uet_viz: {len(before)}, after deleting it: {len(after)}, "
+        f"after renaming it: {len(renamed)}"
+    )
+    return len(before) > 0 and after == before and renamed == before
+
+
+def validation_scenario_3_helper_in_subfolder():
+    print("\n--- Scenario 3: A Helper in a Subfolder Selects Its Folder's Tests ---")
+    folder = TOPICS / "0.3_Cosmology_Hubble_Tension" / "Code" / "hubble_tension"
+    tests = selected(folder / "data" / "dark_energy_data.py")
+    expected = sorted(p.relative_to(TOPICS).as_posix() for p in folder.glob("test_*.py"))
+    print(f"Selected {len(tests)} tests, folder has {len(expected)}")
+    in_sources = (folder / "data" / "dark_energy_data.py") in result_cache.test_sources(
+        folder / "test_dark_energy.py"
+    )
+    print(f"Helper part of the test's fingerprint: {in_sources}")
+    return tests == expected and in_sources
+
+
+def validation_scenario_4_docs_select_nothing():
+    print("\n--- Scenario 4: Docs and Non-Python Core Files Select Nothing ---")
+    tests = selected(CORE / "README.md", ROOT / "README.md")
+    print(f"Selected: {tests}")
+    return tests == []
+
+
+def run_suite():
+    print("=" * 60)
+    print("🎯 UET TEST SELECTION CHECKER")
+    print("=" * 60)
+
+    results = [
+        validation_scenario_1_engine_selects_fluid_tests(),
+        validation_scenario_2_deleted_module(),
+        validation_scenario_3_helper_in_subfolder(),
+        validation_scenario_4_docs_select_nothing(),
+    ]
+
+    print(f"\n{sum(results)}/{len(results)} PASS")
+    if all(results):
+        print("✅ TEST SELECTION VERIFIED")
+    else:
+        print("❌ TEST SELECTION CHECKS FAILED")
+    return all(results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_suite() else 1)
@@ -0,0 +1,103 @@
+"""
+UET Lazy Plotting Checker
+=========================
+Purpose: Importing the compute modules must not load plotly / matplotlib,
+and UET_NO_PLOTS=1 must skip rendering without importing them at all (and
+say so: save_plot returns False).
+
+Each scenario runs in a fresh interpreter, so modules imported by this
+file do not leak into sys.modules of the check.
+"""
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+
+PLOT_MODULES = ("plotly", "matplotlib")
+
+
+def run_snippet(code, **env):
+    """Run `code` in a new interpreter; return the plotting modules it loaded."""
+    code += "\nimport sys\nprint(sorted(m for m in sys.modules if m.split('.')[0] in %r))"
+    result = subprocess.run(
+        [sys.executable, "-c", code % (PLOT_MODULES,)],
+        cwd=ROOT,
+        env={**os.environ, "PYTHONPATH": ROOT, **env},
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        print(result.stderr.strip())
+        return None
+    return eval(result.stdout.strip().splitlines()[-1])
+
+
+def validation_scenario_1_import_is_light():
+    print("--- Scenario 1: Importing Modules Loads No Plotting Library ---")
+    loaded = run_snippet(
+        "import research_uet.core.uet_viz\n"
+        "import research_uet.core.uet_matrix_toolkit\n"
+        "import research_uet.core.uet_matrix_engine"
+    )
+    print(f"Plotting modules loaded: {loaded}")
+    return loaded == []
+
+
+def validation_scenario_2_headless_figures():
+    print("\n--- Scenario 2: UET_NO_PLOTS Skips Figures and Heatmaps ---")
+    loaded = run_snippet(
+        "import numpy as np, tempfile, os\n"
+        "from research_uet.core import uet_viz\n"
+        "from research_uet.core.uet_matrix_toolkit import MatrixVisualizer\n"
+        "out = tempfile.mkdtemp()\n"
+        "fig = uet_viz.go.Figure()\n"
+        "fig.add_trace(uet_viz.go.Scatter(x=[1, 2], y=[3, 4]))\n"
+        "fig.update_layout(title='t')\n"
+        "fig.data[0].name = 'renamed'\n"
+        "assert list(fig.data) == []\n"
+        "assert uet_viz.save_plot(fig, 'x.png', out) is False\n"
+        "assert uet_viz.plot_universal_trend([1], [2], 'x', 'y', 't', 'trend', out) is False\n"
+        "MatrixVisualizer.plot_heatmap(np.ones((4, 4)), 't', os.path.join(out, 'h.png'))\n"
+        "assert os.listdir(out) == [], os.listdir(out)",
+        UET_NO_PLOTS="1",
+    )
+    print(f"Plotting modules loaded: {loaded}")
+    return loaded == []
+
+
+def validation_scenario_3_unknown_attribute():
+    print("\n--- Scenario 3: Unknown Attributes Still Raise ---")
+    from research_uet.core import uet_viz
+
+    try:
+        uet_viz.no_such_name
+    except AttributeError:
+        print("AttributeError raised")
+        return True
+    return False
+
+
+def run_suite():
+    print("=" * 60)
+    print("🖼️ UET LAZY PLOTTING CHECKER")
+    print("=" * 60)
+
+    results = [
+        validation_scenario_1_import_is_light(),
+        validation_scenario_2_headless_figures(),
+        validation_scenario_3_unknown_attribute(),
+    ]
+
+    print(f"\n{sum(results)}/{len(results)} PASS")
+    if all(results):
+        print("✅ PLOTTING IS LAZY")
+    else:
+        print("❌ PLOTTING CHECKS FAILED")
+    return all(results)
+
+
+if __name__ == "__main__":
+    sys.path.insert(0, ROOT)
+    sys.exit(0 if run_suite() else 1)
@@ -4,8 +4,9 @@ Phase 3: SPARC Integration for Matrix UET
 Purpose: Verify that the Matrix Engine can process REAL GALAXY DATA.
 
 Steps:
-1. Load a real SPARC galaxy file (e.g., NGC 6503).
-2. Map the 1D Radial Data (Radius, V_gas, V_disk) -> 2D Tensor Grid.
+1. Load a real SPARC galaxy file (NGC 6503 rotmod).
+2. Map the 1D Radial Data (Radius, V_gas, V_disk, V_bulge) -> 3D Tensor Grid
+   (mass-conserving shell-volume deposit, see uet_matrix_engine.RadialGridMap).
 3. Evolve the Tensor State (generate Information Halo).
 4. Verify that the generated Halo matches the 'observed' missing mass trend.
 """
@@ -13,60 +14,48 @@ Steps:
 import numpy as np
 import sys
 import os
-import glob
 
 # Add path to research_uet
 sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
+SPARC_DIR = os.path.join(
+    os.path.dirname(__file__),
+    "../topics/0.1_Galaxy_Rotation_Problem/Data/galaxy_rotation_175",
+)
+sys.path.append(SPARC_DIR)
 
-from research_uet.core.uet_matrix_engine import MatrixEvolution, UniverseState
+from research_uet.core.uet_matrix_engine import (
+    MatrixEvolution,
+    enclosed_baryonic_mass,
+    map_radial_profile,
+    radial_grid_map,
+)
+from sparc_data import CURVE_COLUMNS, parse_rotmod
+
+MASS_UNIT = 1e6  # M_sun per grid unit of the mass layer
 
 
 def load_sparc_data(galaxy_name="NGC6503"):
     """
-    Simulates loading SPARC data.
-    (In full implementation, this reads the .dat files from data/02_astrophysics/sparc)
-    For this Proof of Concept, we use known values for NGC 6503 to verify the *Mapping Logic*.
-    """
-    # Stylized NGC 6503 Data (Radius in kpc, V_baryon in km/s)
-    # This represents the "Input Mass Profile"
-    data = {
-        "radii": np.array([0.5, 1.0, 2.0, 3.0, 5.0, 10.0]),
-        "v_gas": np.array([10.0, 20.0, 30.0, 40.0, 45.0, 50.0]),  # Gas component
-        "v_disk": np.array([50.0, 80.0, 90.0, 85.0, 70.0, 60.0]),  # Disk star component
-        "v_bulge": np.array([20.0, 10.0, 5.0, 2.0, 1.0, 0.0]),  # Bulge component
-    }
+    Load a SPARC mass model and return its enclosed baryonic mass profile.
 
-    # Calculate Total Baryonic Velocity V_bar = sqrt(V_gas^2 + V_disk^2 + V_bulge^2)
-    # Convert Velocity -> Mass Density estimate (Simplification for Grid Mapping)
-    # V^2 ~ M/R => M ~ V^2 * R
-    v_baryon_sq = data["v_gas"] ** 2 + data["v_disk"] ** 2 + data["v_bulge"] ** 2
-    mass_estimate = v_baryon_sq * data["radii"]
+    M(<r) = V_bar² r / G with V_bar² = V_gas|V_gas| + 0.5 V_disk² + 0.7 V_bulge²
+    (SPARC 3.6 μm mass-to-light ratios).
+    """
+    _, data = parse_rotmod(os.path.join(SPARC_DIR, f"{galaxy_name}_rotmod.dat"))
+    col = {name: data[:, i] for i, name in enumerate(CURVE_COLUMNS)}
 
-    return data["radii"], mass_estimate
+    radii = col["R"]
+    mass_enclosed = enclosed_baryonic_mass(radii, col["V_gas"], col["V_disk"], col["V_bulge"])
+    return radii, mass_enclosed
 
 
 def map_radial_to_grid(radii, mass_profile, grid_size=50, scale_kpc_per_pixel=0.5):
     """
-    Maps 1D Radial Profile -> 2D Tensor Grid.
+    Maps 1D enclosed-mass profile -> 3D Tensor Grid (mass per cell, MASS_UNIT).
     """
-    state = UniverseState(grid_size)
-    center = grid_size // 2
-
-    # Interpolate input mass onto grid
-    for i in range(grid_size):
-        for j in range(grid_size):
-            # Distance from center in pixels
-            r_pix = np.sqrt((i - center) ** 2 + (j - center) ** 2)
-            r_kpc = r_pix * scale_kpc_per_pixel
-
-            # Simple Nearest Neighbor / Interpolation
-            if r_kpc > 0.1 and r_kpc <= np.max(radii):
-                # Find closest mass value (simplified)
-                idx = (np.abs(radii - r_kpc)).argmin()
-                # Assign density (Mass per Area ~ Mass / r^2)
-                state.tensor[0, i, j] = mass_profile[idx] / (r_kpc**2 + 1e-3)
-
-    return state
+    return map_radial_profile(
+        radii, mass_profile, grid_size, kpc_per_pixel=scale_kpc_per_pixel, mass_unit=MASS_UNIT
+    )
 
 
 def run_real_galaxy_test():
@@ -76,15 +65,31 @@ def run_real_galaxy_test():
 
     # 1. Load Data
     radii, mass = load_sparc_data()
-    print(f"Loaded {len(radii)} data points for NGC 6503.")
+    print(f"Loaded {len(radii)} data points for NGC 6503 (R_max = {radii[-1]:.1f} kpc).")
 
-    # 2. Map to Tensor
+    # 2. Map to Tensor (grid half-width = R_max)
     grid_size = 40
-    print(f"Mapping to {grid_size}x{grid_size} Tensor Grid...")
-    state = map_radial_to_grid(radii, mass, grid_size=grid_size)
+    scale = radii[-1] / (grid_size // 2)
+    print(f"Mapping to {grid_size}x{grid_size}x{grid_size} Tensor Grid ({scale:.2f} kpc/pixel)...")
+    state = map_radial_to_grid(radii, mass, grid_size=grid_size, scale_kpc_per_pixel=scale)
 
     initial_mass_sum = np.sum(state.density)
-    print(f"Grid Total Baryonic Mass: {initial_mass_sum:.2e} (Arbitrary Units)")
+    print(f"Grid Total Baryonic Mass: {initial_mass_sum * MASS_UNIT:.3e} M_sun")
+    print(f"Profile Total Mass:       {mass[-1]:.3e} M_sun")
+    conserved = abs(initial_mass_sum * MASS_UNIT / mass[-1] - 1) < 1e-9
+
+    # Spherical enclosed mass on the grid vs the profile at the middle data radius
+    grid_map = radial_grid_map(grid_size)
+    r_half = radii[len(radii) // 2]
+    inside = grid_map.r_pix * scale <= r_half
+    m_grid = state.density.ravel()[grid_map.order][inside].sum() * MASS_UNIT
+    m_true = np.interp(r_half, radii, mass)
+    print(f"M(<{r_half:.1f} kpc): grid {m_grid:.3e} vs profile {m_true:.3e} M_sun")
+    spherical = abs(m_grid / m_true - 1) < 0.05
+
+    if not (conserved and spherical):
+        print("❌ FAIL: Radial mapping does not conserve the baryonic mass.")
+        return False
 
     # 3. Evolve Matrix
     print("Evolving State (Generating Halo)...")
@@ -107,9 +112,11 @@ def run_real_galaxy_test():
     if final_info_sum > initial_mass_sum:
         print("✅ PASS: Matrix Engine successfully grew a Halo from Real Data inputs.")
         print("The 'Ghost Structure' has emerged.")
+        return True
     else:
         print("❌ FAIL: Halo too weak.")
+        return False
 
 
 if __name__ == "__main__":
-    run_real_galaxy_test()
+    sys.exit(0 if run_real_galaxy_test() else 1)
@@ -0,0 +1,133 @@
+"""
+UET Plot Render Queue Checker
+=============================
+Purpose: save_plot must write every figure exactly once per change:
+at once by default, at flush_plots() with UET_PLOT_BATCH=1, from the
+background thread with UET_PLOT_BATCH=background, and not at all when
+the figure spec is unchanged since the PNG was written.
+
+Figures are stand-ins with the two methods save_plot uses (to_json and
+write_image), and uet_viz.pio a stand-in write_images that records each
+batch, so the check runs without plotly / Kaleido.
+"""
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+TMP = Path(tempfile.mkdtemp(prefix="uet_plot_queue_"))
+os.environ["UET_CACHE_DIR"] = str(TMP / "cache")
+os.environ.pop("UET_NO_PLOTS", None)
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
+
+from research_uet.core import uet_viz
+
+WRITES = []
+BATCHES = []
+
+
+class FakeFigure:
+    def __init__(self, **spec):
+        self.spec = spec
+
+    def to_json(self):
+        return json.dumps(self.spec, sort_keys=True)
+
+    def write_image(self, path, scale=1):
+        WRITES.append(Path(path).name)
+        Path(path).write_bytes(b"PNG")
+
+
+class FakePio:
+    @staticmethod
+    def write_images(figs, paths, scale=1):
+        BATCHES.append([Path(p).name for p in paths])
+        for fig, path in zip(figs, paths):
+            fig.write_image(path, scale)
+
+
+uet_viz.pio = FakePio  # what the lazy `pio` attribute would resolve to
+
+
+def save_three(out_dir, mode):
+    os.environ[uet_viz.BATCH_ENV] = mode
+    for i in range(3):
+        uet_viz.save_plot(FakeFigure(mode=mode, i=i), f"fig_{i}", out_dir)
+
+
+def validation_scenario_1_immediate():
+    print("--- Scenario 1: Default Mode Writes Inside save_plot ---")
+    WRITES.clear()
+    BATCHES.clear()
+    out = TMP / "immediate"
+    save_three(out, "")
+    written = sorted(p.name for p in out.glob("*.png"))
+    print(f"Written before flush: {written}, write_images calls: {len(BATCHES)}")
+    return written == ["fig_0.png", "fig_1.png", "fig_2.png"] and len(WRITES) == 3 and not BATCHES
+
+
+def validation_scenario_2_batch():
+    print("\n--- Scenario 2: UET_PLOT_BATCH=1 Writes at flush_plots() ---")
+    WRITES.clear()
+    BATCHES.clear()
+    out = TMP / "batch"
+    save_three(out, "1")
+    before = len(list(out.glob("*.png")))
+    uet_viz.flush_plots()
+    after = len(list(out.glob("*.png")))
+    print(f"PNGs before flush: {before}, after: {after}, write_images calls: {BATCHES}")
+    one_batch = BATCHES == [["fig_0.png", "fig_1.png", "fig_2.png"]]
+    return before == 0 and after == 3 and len(WRITES) == 3 and one_batch
+
+
+def validation_scenario_3_background():
+    print("\n--- Scenario 3: UET_PLOT_BATCH=background Renders in a Thread ---")
+    WRITES.clear()
+    out = TMP / "background"
+    save_three(out, "background")
+    uet_viz.flush_plots()
+    after = len(list(out.glob("*.png")))
+    print(f"PNGs after flush: {after}, renders: {len(WRITES)}")
+    return after == 3 and len(WRITES) == 3
+
+
+def validation_scenario_4_unchanged_skipped():
+    print("\n--- Scenario 4: Unchanged Figures Are Not Rendered Again ---")
+    out = TMP / "batch"
+    uet_viz._QUEUE = uet_viz._RenderQueue()  # fresh process: hashes come from disk
+    WRITES.clear()
+    save_three(out, "1")
+    uet_viz.flush_plots()
+    unchanged = len(WRITES)
+
+    uet_viz.save_plot(FakeFigure(mode="1", i=1, title="edited"), "fig_1", out)
+    uet_viz.flush_plots()
+    print(f"Renders for unchanged figures: {unchanged}, after editing one: {WRITES}")
+    return unchanged == 0 and WRITES == ["fig_1.png"]
+
+
+def run_suite():
+    print("=" * 60)
+    print("🖼️ UET PLOT RENDER QUEUE CHECKER")
+    print("=" * 60)
+
+    results = [
+        validation_scenario_1_immediate(),
+        validation_scenario_2_batch(),
+        validation_scenario_3_background(),
+        validation_scenario_4_unchanged_skipped(),
+    ]
+
+    print(f"\n{sum(results)}/{len(results)} PASS")
+    if all(results):
+        print("✅ RENDER QUEUE VERIFIED")
+    else:
+        print("❌ RENDER QUEUE CHECKS FAILED")
+    return all(results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_suite() else 1)
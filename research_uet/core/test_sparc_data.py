@@ -0,0 +1,206 @@
+"""
+UET SPARC Store Validator
+=========================
+Purpose: sparc_data.py (0.1_Galaxy_Rotation_Problem/Data/galaxy_rotation_175)
+must parse a CDS byte-by-byte catalog and both rotmod layouts (6 and 8
+columns) into one columnar store, fill distances from rotmod headers, and
+serve the store from its .npz cache until a source file changes. The
+hand-typed sample the galaxy tests share (sparc_sample.py) must list each
+galaxy once.
+
+The catalog and curves are small synthetic fixtures written to a temporary
+folder, laid out like the SPARC release.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[2]
+TOPIC = ROOT / "research_uet" / "topics" / "0.1_Galaxy_Rotation_Problem"
+SPARC_DIR = TOPIC / "Data" / "galaxy_rotation_175"
+sys.path.insert(0, str(SPARC_DIR))
+
+import sparc_data  # noqa: E402
+import sparc_sample  # noqa: E402
+
+TMP = Path(tempfile.mkdtemp(prefix="uet_sparc_"))
+DATA = TMP / "data"
+CACHE = TMP / "cache"
+
+MRT = """Title: Synthetic SPARC catalog
+Authors: UET validation fixture
+Table: Galaxy sample
+================================================================================
+Byte-by-byte Description of file: SPARC_Lelli2016c.mrt
+--------------------------------------------------------------------------------
+   Bytes Format Units   Label     Explanations
+--------------------------------------------------------------------------------
+   1- 11 A11    ---     Galaxy    Galaxy Name
+  12- 13 I2     ---     T         Hubble Type (1)
+  14- 19 F6.2   Mpc     D         Distance
+  20- 23 F4.1   deg     Inc       Inclination
+  24- 30 F7.2   km/s    Vflat     Asymptotic flat rotation velocity
+--------------------------------------------------------------------------------
+Note (1): 0 = S0, 10 = Im, 11 = BCD
+--------------------------------------------------------------------------------
+"""
+CATALOG = [  # name, T, D, Inc, Vflat ("" = blank)
+    ("GalA", "4", "5.27", "74.0", "116.20"),
+    ("GalB", "10", "", "", "45.00"),
+    ("GalC", "6", "12.10", "60.0", ""),
+]
+
+ROTMOD_6 = """# Distance = 5.27 Mpc
+# Rad\tVobs\terrV\tVgas\tVdisk\tVbul
+0.50\t40.0\t2.0\t5.0\t30.0\t0.0
+1.00\t70.0\t2.5\t9.0\t50.0\t0.0
+2.00\t100.0\t3.0\t15.0\t65.0\t0.0
+"""
+ROTMOD_8 = """# Distance = 7.50 Mpc
+# Rad\tVobs\terrV\tVgas\tVdisk\tVbul\tSBdisk\tSBbul
+0.30\t20.0\t1.0\t8.0\t10.0\t0.0\t150.0\t0.0
+0.90\t35.0\t1.5\t14.0\t16.0\t0.0\t80.0\t0.0
+"""
+ROTMOD_ONLY = """# Distance: 3.10 Mpc
+# Inclination: 55 deg
+1.0\t30.0\t2.0\t10.0\t20.0\t0.0
+"""
+
+
+def write_fixtures():
+    DATA.mkdir(parents=True, exist_ok=True)
+    rows = [f"{n:<11}{t:>2}{d:>6}{i:>4}{v:>7}" for n, t, d, i, v in CATALOG]
+    (DATA / "SPARC_Lelli2016c.mrt").write_text(MRT + "\n".join(rows) + "\n", encoding="utf-8")
+    (DATA / "GalA_rotmod.dat").write_text(ROTMOD_6, encoding="utf-8")
+    (DATA / "Rotmod_LTG").mkdir(exist_ok=True)  # as unpacked by --download
+    (DATA / "Rotmod_LTG" / "GalB_rotmod.dat").write_text(ROTMOD_8, encoding="utf-8")
+    (DATA / "GalD_rotmod.dat").write_text(ROTMOD_ONLY, encoding="utf-8")
+
+
+def validation_scenario_1_mrt_catalog():
+    print("--- Scenario 1: Byte-by-Byte MRT Catalog ---")
+    table = sparc_data.parse_mrt(DATA / "SPARC_Lelli2016c.mrt")
+    print(f"Columns: {sorted(table)}")
+    checks = [
+        list(table["name"]) == ["GalA", "GalB", "GalC"],
+        table["T"].dtype.kind == "i" and list(table["T"]) == [4, 10, 6],
+        np.allclose(table["D"][[0, 2]], [5.27, 12.10]) and np.isnan(table["D"][1]),
+        np.allclose(table["Inc"][[0, 2]], [74.0, 60.0]) and np.isnan(table["Inc"][1]),
+        np.isnan(table["Vflat"][2]),
+        sparc_data.parse_mrt(SPARC_DIR / "SPARC_Lelli2016c.mrt") == {},  # stub: no header
+    ]
+    print(f"Checks: {checks}")
+    return all(checks)
+
+
+def validation_scenario_2_rotmod_layouts():
+    print("\n--- Scenario 2: 6- and 8-Column Rotmod Files ---")
+    header6, short = sparc_data.parse_rotmod(DATA / "GalA_rotmod.dat")
+    header8, full = sparc_data.parse_rotmod(DATA / "Rotmod_LTG" / "GalB_rotmod.dat")
+    header_only, _ = sparc_data.parse_rotmod(DATA / "GalD_rotmod.dat")
+    print(f"Shapes: {short.shape}, {full.shape}; headers: {header6}, {header8}, {header_only}")
+    checks = [
+        short.shape == (3, 8) and np.isnan(short[:, 6:]).all(),
+        np.allclose(short[:, 1], [40.0, 70.0, 100.0]),
+        full.shape == (2, 8) and np.allclose(full[:, 6], [150.0, 80.0]),
+        header8 == {"Distance": 7.5},
+        header_only == {"Distance": 3.1, "Inclination": 55.0},
+    ]
+    print(f"Checks: {checks}")
+    return all(checks)
+
+
+def validation_scenario_3_columnar_store():
+    print("\n--- Scenario 3: Columnar Store and Galaxy Index ---")
+    store = sparc_data.build_store(DATA)
+    print(f"Galaxies: {store.names.tolist()}, counts: {store.index['count'].tolist()}")
+    gal_b = store["GalB"]
+    checks = [
+        list(store.names) == ["GalA", "GalB", "GalC", "GalD"],  # catalog order first
+        list(store.index["count"]) == [3, 2, 0, 1],
+        list(store.offsets) == [0, 3, 5, 5, 6] and store.n_points == 6,
+        np.allclose(gal_b["R"], [0.3, 0.9]) and gal_b["D"] == 7.5,  # D from the rotmod header
+        store["GalD"]["Inc"] == 55.0 and np.isnan(store["GalD"]["Vflat"]),
+        list(store.with_curves()) == [0, 1, 3],
+        list(store.galaxy_of_point) == [0, 0, 0, 1, 1, 3],
+    ]
+    print(f"Checks: {checks}")
+    return all(checks)
+
+
+def validation_scenario_4_cache():
+    print("\n--- Scenario 4: .npz Cache and Invalidation ---")
+    builds = []
+    real_build = sparc_data.build_store
+
+    def counting_build(data_dir):
+        builds.append(data_dir)
+        return real_build(data_dir)
+
+    sparc_data.build_store = counting_build
+    try:
+        first = sparc_data.load_sparc(DATA, cache_dir=CACHE)
+        second = sparc_data.load_sparc(DATA, cache_dir=CACHE)
+        cached_builds = len(builds)
+
+        path = DATA / "GalA_rotmod.dat"
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        third = sparc_data.load_sparc(DATA, cache_dir=CACHE)
+    finally:
+        sparc_data.build_store = real_build
+
+    print(f"Parses: {cached_builds} for two loads, {len(builds)} after touching a file")
+    same = all(
+        np.array_equal(first.curves[c], second.curves[c], equal_nan=True) for c in first.curves
+    )
+    reparsed = list(third.names) == list(first.names)
+    return cached_builds == 1 and len(builds) == 2 and same and reparsed
+
+
+def validation_scenario_5_shipped_data():
+    print("\n--- Scenario 5: Shipped Data (Stub Catalog + NGC6503) ---")
+    store = sparc_data.load_sparc(SPARC_DIR, cache_dir=CACHE)
+    ngc = store["NGC6503"]
+    print(f"Galaxies: {store.names.tolist()}, NGC6503: D = {ngc['D']} Mpc, {ngc['count']} points")
+    return "NGC6503" in store and ngc["count"] > 0 and ngc["D"] == 5.27
+
+
+def validation_scenario_6_shared_sample():
+    print("\n--- Scenario 6: Shared Sample Has One Row per Galaxy ---")
+    names = [row[0] for row in sparc_sample.SPARC_SAMPLE]
+    compact = [row[0] for row in sparc_sample.galaxies(types=("compact",))]
+    print(f"{len(names)} rows, {len(set(names))} names; compact: {compact}")
+    picked = sparc_sample.galaxies(names=("WLM", "NGC6503"))
+    return len(names) == len(set(names)) and [row[0] for row in picked] == ["WLM", "NGC6503"]
+
+
+def run_suite():
+    print("=" * 60)
+    print("🌀 UET SPARC STORE VALIDATOR")
+    print("=" * 60)
+
+    write_fixtures()
+    results = [
+        validation_scenario_1_mrt_catalog(),
+        validation_scenario_2_rotmod_layouts(),
+        validation_scenario_3_columnar_store(),
+        validation_scenario_4_cache(),
+        validation_scenario_5_shipped_data(),
+        validation_scenario_6_shared_sample(),
+    ]
+
+    print(f"\n{sum(results)}/{len(results)} PASS")
+    if all(results):
+        print("✅ SPARC STORE VERIFIED")
+    else:
+        print("❌ SPARC STORE CHECKS FAILED")
+    return all(results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_suite() else 1)
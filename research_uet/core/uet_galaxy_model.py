@@ -0,0 +1,452 @@
+"""
+UET Galaxy Model - Vectorized Rotation Curves
+=============================================
+
+Evaluates the UET rotation-curve model for every data point of every
+galaxy in one pass:
+
+    V² = V_baryon² + V_I²
+
+where V_I is the I-field contribution (NFW-shaped, M_I = ratio × M_disk with
+the ratio from the Unity Density Law in uet_master_equation).
+
+Ragged layout: all radii of all galaxies are concatenated into one flat
+array; galaxy i owns points offsets[i]:offsets[i + 1]. Per-galaxy
+parameters (M_disk, R_disk, ...) have one entry per galaxy and are
+expanded to points internally. This is the layout of the SPARC store
+(topics/0.1_Galaxy_Rotation_Problem/Data/galaxy_rotation_175/sparc_data.py).
+
+Baryons come from either:
+    - the analytic exponential disk + 10% bulge (legacy test model), or
+    - SPARC mass models: V_bar² = V_gas|V_gas| + Υ_d V_disk² + Υ_b V_bulge²
+
+Model variants used by the galaxy tests (strategic boost, density
+screening, ratio bounds, disk-tracing I-field) are selected with
+GalaxyModel; all share this one implementation.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+try:
+    from research_uet.core.uet_master_equation import (
+        HALO_GAMMA,
+        HALO_RATIO_0,
+        HALO_RHO_0,
+        SIGMA_CRIT,
+        calculate_halo_ratio,
+        strategic_boost,
+    )
+except ImportError:
+    from uet_master_equation import (
+        HALO_GAMMA,
+        HALO_RATIO_0,
+        HALO_RHO_0,
+        SIGMA_CRIT,
+        calculate_halo_ratio,
+        strategic_boost,
+    )
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+G_KPC = 4.302e-6  # (km/s)² kpc / M_sun
+R_SOFT = 0.1  # kpc, softening used by the legacy galaxy tests
+BULGE_FRACTION = 0.1  # M_bulge / M_disk in the analytic baryon model
+HALO_EXTENT = 10.0  # I-field extent R_I in units of R_disk
+FREEMAN_PEAK = 0.3864  # exponential disk: V_peak² = 0.3864 G M / R_d (at R = 2.2 R_d)
+
+# SPARC standard mass-to-light ratios at 3.6 μm (Lelli 2016)
+UPSILON_DISK = 0.5
+UPSILON_BULGE = 0.7
+
+# Unity Density Law (ratio_0, gamma, rho_0)
+DEFAULT_LAW = (HALO_RATIO_0, HALO_GAMMA, HALO_RHO_0)
+
+# Jacobian columns of fit_model
+FIT_PARAMETERS = ("ln_upsilon_disk", "ln_R_disk", "ln_ratio_0", "gamma", "ln_rho_0")
+
+# Disk-tracing I-field: M_I_enc = DISK_HALO_SHAPE × M_I × M_disk_enc / M_disk
+DISK_HALO_SHAPE = 1.2
+
+
+def log_density_boost(sigma_bar, scale=1.0):
+    """β = 0.1 ln(1 + Σ/Σ_crit): the boost test_sparc_175 has always run with."""
+    return 0.1 * np.log1p(np.asarray(sigma_bar, dtype=float) / SIGMA_CRIT)
+
+
+def fixed_boost(sigma_bar, scale=1.0):
+    """β = 0.5 for every galaxy: the V_old baseline of test_compact_correction."""
+    return np.full(np.shape(sigma_bar), 0.5)
+
+
+@dataclass(frozen=True)
+class GalaxyModel:
+    """
+    Variant switches of the UET rotation model.
+
+    ratio_bounds  : (floor, cap) on M_I/M_disk after boost/screening (None = open)
+    screening_rho : density screening ratio × 1/(1 + (rho/screening_rho)²)
+    halo_profile  : "nfw" (I-field NFW profile) or "disk" (I-field traces the disk)
+    softening     : r + softening in V² = G M / r (kpc)
+    boost_law     : β(sigma_bar, scale) applied as ratio × (1 + β) where boosted
+    """
+
+    ratio_bounds: Tuple[Optional[float], Optional[float]] = (None, None)
+    screening_rho: Optional[float] = None
+    halo_profile: str = "nfw"
+    softening: float = R_SOFT
+    boost_law: Callable = strategic_boost
+
+
+# V3.1 Unity Density Law (test_175_galaxies)
+UNITY_MODEL = GalaxyModel()
+# V3.0 with strategic boost on compact galaxies (core β_U)
+BOOSTED_MODEL = GalaxyModel(ratio_bounds=(0.1, 500.0))
+# test_sparc_175: compact boost 0.1 ln(1 + Σ/Σ_crit)
+SPARC_BOOSTED_MODEL = GalaxyModel(ratio_bounds=(0.1, 500.0), boost_law=log_density_boost)
+# Compact-galaxy diagnostics (test_compact_correction)
+COMPACT_BOOSTED_MODEL = GalaxyModel(
+    ratio_bounds=(0.1, 500.0), halo_profile="disk", softening=0.0, boost_law=fixed_boost
+)
+COMPACT_SCREENED_MODEL = GalaxyModel(
+    ratio_bounds=(0.05, None), screening_rho=1.5e9, halo_profile="disk", softening=0.0
+)
+
+
+# =============================================================================
+# RAGGED HELPERS
+# =============================================================================
+
+
+def counts_from_offsets(offsets):
+    return np.diff(np.asarray(offsets))
+
+
+def expand(values, offsets):
+    """Repeat per-galaxy values onto their curve points."""
+    return np.repeat(np.asarray(values), counts_from_offsets(offsets))
+
+
+def reduce_sum(values, offsets):
+    """Per-galaxy sums of a flat array (0 for galaxies without points)."""
+    offsets = np.asarray(offsets)
+    counts = np.diff(offsets)
+    out = np.zeros(counts.size, dtype=np.result_type(values, float))
+    nonempty = counts > 0
+    if nonempty.any():
+        out[nonempty] = np.add.reduceat(values, offsets[:-1][nonempty])
+    return out
+
+
+# =============================================================================
+# MODEL
+# =============================================================================
+
+
+def halo_parameters(M_disk, R_disk, law=None, boost=False, model=UNITY_MODEL):
+    """
+    I-field (NFW) parameters per galaxy (law = (ratio_0, gamma, rho_0)).
+
+    Computed once per galaxy, including the NFW normalization
+    ln(1 + c) - c/(1 + c) of each galaxy's concentration.
+
+    boost : apply the strategic boost β_U (bool or per-galaxy mask)
+
+    Returns:
+        (M_I, r_s, norm) with M_I_enc(r) = norm × [ln(1 + r/r_s) - (r/r_s)/(1 + r/r_s)]
+    """
+    M_disk = np.asarray(M_disk, dtype=float)
+    R_disk = np.asarray(R_disk, dtype=float)
+
+    vol = (4 / 3) * np.pi * R_disk**3
+    rho = M_disk / (vol + 1e-10)
+    sigma_bar = M_disk / (np.pi * R_disk**2 + 1e-10)
+    ratio = calculate_halo_ratio(rho, sigma_bar, R_disk, *(law or DEFAULT_LAW))
+
+    if np.any(boost):
+        ratio = ratio * (1 + np.where(boost, model.boost_law(sigma_bar, scale=R_disk), 0.0))
+    if model.screening_rho is not None:
+        ratio = ratio / (1.0 + (rho / model.screening_rho) ** 2.0)
+    floor, cap = model.ratio_bounds
+    if floor is not None or cap is not None:
+        ratio = np.clip(ratio, floor, cap)
+    M_I = ratio * M_disk
+
+    c = np.clip(10.0 * (M_I / 1e12) ** (-0.1), 5, 20)
+    r_s = HALO_EXTENT * R_disk / c
+    norm = M_I / (np.log(1 + c) - c / (1 + c))
+    return M_I, r_s, norm
+
+
+def rotation_velocity(
+    r,
+    M_disk,
+    R_disk,
+    offsets=None,
+    V_gas=None,
+    V_disk=None,
+    V_bulge=None,
+    upsilon_disk=1.0,
+    upsilon_bulge=1.0,
+    components=False,
+    law=None,
+    boost=False,
+    model=UNITY_MODEL,
+):
+    """
+    UET rotation velocity at every radius.
+
+    Parameters:
+        r        : radii in kpc (flat over all galaxies when offsets is given)
+        M_disk   : disk mass in M_sun (per galaxy, or broadcastable to r)
+        R_disk   : disk scale length in kpc (per galaxy, or broadcastable to r)
+        offsets  : galaxy boundaries in r (length n_galaxies + 1); None means
+                   M_disk/R_disk broadcast against r directly
+        V_gas, V_disk, V_bulge : SPARC baryon velocities at r (Υ = 1); if
+                   omitted the analytic disk + bulge model is used
+        upsilon_disk, upsilon_bulge : mass-to-light ratios (scalar or per galaxy)
+        components : also return V_bar and V_I
+        law      : Unity Density Law (ratio_0, gamma, rho_0), default DEFAULT_LAW
+        boost    : apply the strategic boost (bool or per-galaxy mask)
+        model    : GalaxyModel variant
+
+    Returns:
+        V_total, or dict with V_total, V_bar, V_I
+    """
+    r = np.asarray(r, dtype=float)
+    M_I, r_s, norm = halo_parameters(M_disk, R_disk, law, boost, model)
+    M_disk = np.asarray(M_disk, dtype=float)
+    R_disk = np.asarray(R_disk, dtype=float)
+    upsilon_disk = np.asarray(upsilon_disk, dtype=float)
+    upsilon_bulge = np.asarray(upsilon_bulge, dtype=float)
+    if offsets is not None:
+        M_I, r_s, norm, M_disk, R_disk = (
+            expand(v, offsets) for v in (M_I, r_s, norm, M_disk, R_disk)
+        )
+        if upsilon_disk.ndim:
+            upsilon_disk = expand(upsilon_disk, offsets)
+        if upsilon_bulge.ndim:
+            upsilon_bulge = expand(upsilon_bulge, offsets)
+    r_eff = r + model.softening
+
+    # === I-FIELD ===
+    if model.halo_profile == "nfw":
+        x_h = r / r_s
+        M_I_enc = norm * (np.log1p(x_h) - x_h / (1 + x_h))
+    elif model.halo_profile == "disk":
+        x = r / R_disk
+        M_I_enc = DISK_HALO_SHAPE * M_I * (1 - (1 + x) * np.exp(-x))
+    else:
+        raise ValueError(f"Unknown halo profile: {model.halo_profile}")
+    V_I2 = G_KPC * M_I_enc / r_eff
+
+    # === BARYONIC CONTRIBUTION ===
+    if V_disk is None:
+        x = r / R_disk
+        M_disk_enc = M_disk * (1 - (1 + x) * np.exp(-x))
+        M_bulge = BULGE_FRACTION * M_disk
+        V_bar2 = G_KPC * (M_bulge + M_disk_enc) / r_eff
+    else:
+        V_bar2 = upsilon_disk * np.asarray(V_disk) ** 2
+        if V_gas is not None:
+            V_gas = np.asarray(V_gas)
+            V_bar2 = V_bar2 + V_gas * np.abs(V_gas)
+        if V_bulge is not None:
+            V_bar2 = V_bar2 + upsilon_bulge * np.asarray(V_bulge) ** 2
+
+    V_total = np.sqrt(np.maximum(V_bar2 + V_I2, 0.0))
+    if not components:
+        return V_total
+    return {
+        "V_total": V_total,
+        "V_bar": np.sign(V_bar2) * np.sqrt(np.abs(V_bar2)),
+        "V_I": np.sqrt(V_I2),
+    }
+
+
+def fit_model(
+    r,
+    M_L,
+    R_disk,
+    upsilon_disk,
+    V_gas,
+    V_disk,
+    V_bulge,
+    offsets=None,
+    upsilon_bulge=UPSILON_BULGE,
+    law=None,
+    jacobian=False,
+):
+    """
+    Rotation velocity on SPARC mass models, parameterized for fitting.
+
+    M_disk = Υ_d × M_L (M_L = disk mass at Υ_d = 1). Baryons are
+    V_gas|V_gas| + Υ_d V_disk² + Υ_b V_bulge²; the I-field follows the
+    Unity Density Law. Per-galaxy inputs (M_L, R_disk, upsilon_disk) are
+    expanded with offsets like rotation_velocity.
+
+    Returns:
+        V, or (V, J) with J[:, k] = dV/d FIT_PARAMETERS[k] at every point
+        (per-galaxy columns are each point's derivative w.r.t. its own galaxy)
+    """
+    ratio_0, gamma, rho_0 = law or DEFAULT_LAW
+    r = np.asarray(r, dtype=float)
+    M_L, R_disk, upsilon_disk = (np.asarray(v, dtype=float) for v in (M_L, R_disk, upsilon_disk))
+    if offsets is not None:
+        M_L, R_disk = expand(M_L, offsets), expand(R_disk, offsets)
+        if upsilon_disk.ndim:
+            upsilon_disk = expand(upsilon_disk, offsets)
+    r, M_L, R_disk, upsilon_disk = np.broadcast_arrays(r, M_L, R_disk, upsilon_disk)
+
+    M_disk = upsilon_disk * M_L
+    rho = M_disk / ((4 / 3) * np.pi * R_disk**3 + 1e-10)
+    dense = (rho > 1.0).astype(float)
+    M_I = calculate_halo_ratio(rho, 0.0, R_disk, ratio_0, gamma, rho_0) * M_disk
+
+    c_raw = 10.0 * (M_I / 1e12) ** (-0.1)
+    c = np.clip(c_raw, 5, 20)
+    f_c = np.log1p(c) - c / (1 + c)
+    r_s = HALO_EXTENT * R_disk / c
+    norm = M_I / f_c
+    x = r / r_s
+    K = G_KPC / (r + R_SOFT)
+    H = K * norm * (np.log1p(x) - x / (1 + x))
+
+    upsilon_V_disk2 = upsilon_disk * V_disk**2
+    S = V_gas * np.abs(V_gas) + upsilon_V_disk2 + upsilon_bulge * V_bulge**2 + H
+    V = np.sqrt(np.maximum(S, 0.0))
+    if not jacobian:
+        return V
+
+    # d ln M_I for (ln Υ_d, ln R_disk, ln ratio_0, gamma, ln rho_0)
+    d_ln_MI = np.zeros((r.size, len(FIT_PARAMETERS)))
+    d_ln_MI[:, 0] = 1 - gamma * dense
+    d_ln_MI[:, 1] = 3 * gamma * dense
+    d_ln_MI[:, 2] = 1
+    d_ln_MI[:, 3] = -dense * (np.log(np.maximum(rho, 1.0)) - np.log(rho_0))
+    d_ln_MI[:, 4] = gamma * dense
+
+    # Concentration c = 10 (M_I/1e12)^-0.1 (zero derivative where clipped)
+    d_ln_c = (-0.1 * ((c_raw > 5) & (c_raw < 20)))[:, None] * d_ln_MI
+    d_ln_rs = -d_ln_c
+    d_ln_rs[:, 1] += 1
+    d_ln_norm = d_ln_MI - (c**2 / (1 + c) ** 2 / f_c)[:, None] * d_ln_c
+
+    # H = K norm g(x), x g'(x) = x² / (1 + x)², d ln x = -d ln r_s
+    dS = H[:, None] * d_ln_norm - (K * norm * x**2 / (1 + x) ** 2)[:, None] * d_ln_rs
+    dS[:, 0] += upsilon_V_disk2
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        J = np.where(V[:, None] > 0, dS / (2 * V[:, None]), 0.0)
+    return V, J
+
+
+# =============================================================================
+# SCORING
+# =============================================================================
+
+
+def curve_statistics(v_model, v_obs, v_err, offsets, n_params=0):
+    """
+    Per-galaxy goodness of fit over ragged curves.
+
+    Returns:
+        dict of per-galaxy arrays: n, chi2, chi2_red, mean_pct_error, rms
+        (NaN for galaxies without points)
+    """
+    v_model, v_obs, v_err = (np.asarray(v, dtype=float) for v in (v_model, v_obs, v_err))
+    n = counts_from_offsets(offsets)
+    resid = v_model - v_obs
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        chi2 = reduce_sum((resid / v_err) ** 2, offsets)
+        pct = reduce_sum(np.abs(resid) / np.abs(v_obs), offsets) * 100 / n
+        rms = np.sqrt(reduce_sum(resid**2, offsets) / n)
+        chi2_red = chi2 / np.maximum(n - n_params, 1)
+
+    empty = n == 0
+    for values in (chi2, chi2_red):
+        values[empty] = np.nan
+    return {"n": n, "chi2": chi2, "chi2_red": chi2_red, "mean_pct_error": pct, "rms": rms}
+
+
+def galaxy_parameters(store, upsilon_disk=UPSILON_DISK):
+    """
+    Disk mass and scale length per galaxy of a SPARC store.
+
+    Uses the catalog (M_disk = Υ_d × L[3.6], R_disk = Rdisk) where
+    available; otherwise estimates from the mass model itself:
+    R_disk = R(V_disk peak) / 2.2 and M_disk = Υ_d V_peak² R_disk / (0.3864 G).
+    """
+    index, curves, offsets = store.index, store.curves, store.offsets
+    n_gal = len(offsets) - 1
+    M_disk = np.full(n_gal, np.nan)
+    R_disk = np.full(n_gal, np.nan)
+    if "L36" in index:
+        M_disk = upsilon_disk * np.asarray(index["L36"], dtype=float) * 1e9
+    if "Rdisk" in index:
+        R_disk = np.asarray(index["Rdisk"], dtype=float).copy()
+
+    counts = counts_from_offsets(offsets)
+    V_disk = np.nan_to_num(curves["V_disk"])
+    R = curves["R"]
+    with np.errstate(invalid="ignore"):
+        V_peak = np.full(n_gal, np.nan)
+        nonempty = counts > 0
+        V_peak[nonempty] = np.maximum.reduceat(V_disk, offsets[:-1][nonempty])
+        at_peak = V_disk == expand(V_peak, offsets)
+        R_peak = np.full(n_gal, np.nan)
+        R_peak[nonempty] = np.minimum.reduceat(np.where(at_peak, R, np.inf), offsets[:-1][nonempty])
+
+    R_est = R_peak / 2.2
+    M_est = upsilon_disk * V_peak**2 * R_est / (FREEMAN_PEAK * G_KPC)
+    R_disk = np.where(np.isfinite(R_disk) & (R_disk > 0), R_disk, R_est)
+    M_disk = np.where(np.isfinite(M_disk) & (M_disk > 0), M_disk, M_est)
+    return M_disk, R_disk
+
+
+def evaluate_store(store, upsilon_disk=UPSILON_DISK, upsilon_bulge=UPSILON_BULGE, baryons="rotmod"):
+    """
+    Evaluate the UET model on every point of a SPARC store and score it.
+
+    Parameters:
+        baryons : "rotmod" (SPARC mass models) or "model" (analytic disk + bulge)
+
+    Returns:
+        dict with flat V_model/V_bar/V_I, per-galaxy M_disk/R_disk and the
+        curve_statistics entries
+    """
+    curves, offsets = store.curves, store.offsets
+    M_disk, R_disk = galaxy_parameters(store, upsilon_disk)
+
+    if baryons == "rotmod":
+        velocity = rotation_velocity(
+            curves["R"],
+            M_disk,
+            R_disk,
+            offsets,
+            V_gas=curves["V_gas"],
+            V_disk=curves["V_disk"],
+            V_bulge=np.nan_to_num(curves["V_bulge"]),
+            upsilon_disk=upsilon_disk,
+            upsilon_bulge=upsilon_bulge,
+            components=True,
+        )
+    elif baryons == "model":
+        velocity = rotation_velocity(curves["R"], M_disk, R_disk, offsets, components=True)
+    else:
+        raise ValueError(f"Unknown baryon model: {baryons}")
+
+    result = {
+        "V_model": velocity["V_total"],
+        "V_bar": velocity["V_bar"],
+        "V_I": velocity["V_I"],
+        "M_disk": M_disk,
+        "R_disk": R_disk,
+    }
+    result.update(curve_statistics(velocity["V_total"], curves["V_obs"], curves["V_err"], offsets))
+    return result
@@ -0,0 +1,314 @@
+"""
+UET Galaxy Uncertainty - Monte Carlo Rotation Curves
+====================================================
+
+Propagates the uncertain inputs of every galaxy into bands on the UET
+rotation curve and on the per-galaxy error:
+
+    distance     D' = D × f_D,  f_D ~ lognormal(σ = e_D / D)
+                 r ∝ D, V_gas/V_disk/V_bulge ∝ √D, M_disk ∝ D², R_disk ∝ D
+    inclination  i' ~ N(i, e_i),  V_obs' = V_obs × sin(i) / sin(i')
+    M/L          Υ' = Υ × 10^N(0, σ_Υ)  (disk and bulge drawn independently)
+
+K samples per galaxy are evaluated as one broadcasted (K, n_points)
+array per chunk of galaxies; chunks are sized so that K × points stays
+under max_elements, which bounds memory for 10⁴ samples × 175 galaxies.
+
+Every galaxy draws from its own RNG stream (SeedSequence(seed).spawn),
+so results are identical for any chunk size or number of workers.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+try:
+    from research_uet.core.uet_galaxy_model import (
+        UNITY_MODEL,
+        UPSILON_BULGE,
+        UPSILON_DISK,
+        counts_from_offsets,
+        galaxy_parameters,
+        rotation_velocity,
+    )
+except ImportError:
+    from uet_galaxy_model import (
+        UNITY_MODEL,
+        UPSILON_BULGE,
+        UPSILON_DISK,
+        counts_from_offsets,
+        galaxy_parameters,
+        rotation_velocity,
+    )
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+# Defaults when the catalog has no e_D / e_Inc columns
+DISTANCE_ERROR_FRAC = 0.1  # e_D / D
+INCLINATION_ERROR_DEG = 5.0
+UPSILON_SCATTER_DEX = 0.11  # 3.6 μm M/L scatter (McGaugh & Schombert 2014)
+INCLINATION_MIN_DEG = 5.0  # keep sin(i') away from zero
+
+PERCENTILES = (2.5, 16.0, 50.0, 84.0, 97.5)
+MAX_ELEMENTS = 1_000_000  # K × points per evaluated chunk (~200 MB peak)
+
+
+# =============================================================================
+# SAMPLING
+# =============================================================================
+
+
+def draw_samples(rng, n_samples, D_frac_err, inc_deg, inc_err_deg, upsilon_dex):
+    """
+    K samples of one galaxy's uncertain inputs.
+
+    Returns:
+        dict of length-K arrays: f_D (D'/D), inc_factor (sin i / sin i'),
+        upsilon_disk, upsilon_bulge (multiplicative M/L factors)
+    """
+    f_D = np.exp(D_frac_err * rng.standard_normal(n_samples))
+    inc_draw = inc_deg + inc_err_deg * rng.standard_normal(n_samples)
+    upsilon = 10 ** (upsilon_dex * rng.standard_normal((2, n_samples)))
+
+    if np.isfinite(inc_deg) and inc_deg > 0:
+        inc_draw = np.maximum(inc_draw, INCLINATION_MIN_DEG)
+        inc_factor = np.sin(np.radians(inc_deg)) / np.sin(np.radians(inc_draw))
+    else:
+        inc_factor = np.ones(n_samples)
+    return {
+        "f_D": f_D,
+        "inc_factor": inc_factor,
+        "upsilon_disk": upsilon[0],
+        "upsilon_bulge": upsilon[1],
+    }
+
+
+# =============================================================================
+# CHUNKED EVALUATION
+# =============================================================================
+
+
+def chunk_galaxies(counts, n_samples, max_elements=MAX_ELEMENTS):
+    """
+    Split galaxies into consecutive chunks with n_samples × points <= max_elements.
+
+    Returns:
+        list of (first, last) galaxy rows (last exclusive); a single galaxy
+        larger than the budget gets a chunk of its own
+    """
+    budget = max(max_elements // max(n_samples, 1), 1)
+    chunks = []
+    start, size = 0, 0
+    for i, n in enumerate(counts):
+        if size and size + n > budget:
+            chunks.append((start, i))
+            start, size = i, 0
+        size += n
+    if start < len(counts):
+        chunks.append((start, len(counts)))
+    return chunks
+
+
+def _evaluate_chunk(task):
+    """
+    Monte Carlo bands for one chunk of galaxies (runs in worker processes).
+
+    task holds the chunk's flat curve columns, per-galaxy parameters and
+    the spawned SeedSequences of its galaxies.
+    """
+    counts = task["counts"]
+    n_samples = task["n_samples"]
+    q = np.asarray(task["percentiles"])
+    n_gal = len(counts)
+    if n_gal == 0:
+        return {key: np.empty((len(q), 0)) for key in ("V_model", "V_obs", "error")}
+
+    draws = [
+        draw_samples(
+            np.random.default_rng(seed),
+            n_samples,
+            task["D_frac_err"][g],
+            task["inc"][g],
+            task["inc_err"][g],
+            task["upsilon_dex"],
+        )
+        for g, seed in enumerate(task["seeds"])
+    ]
+    # (K, n_points): every point takes the draw of its own galaxy
+    owner = np.repeat(np.arange(n_gal), counts)
+    sample = {
+        key: np.stack([d[key] for d in draws], axis=1)[:, owner]
+        for key in ("f_D", "inc_factor", "upsilon_disk", "upsilon_bulge")
+    }
+    f_D = sample["f_D"]
+
+    curves = task["curves"]
+    r = curves["R"] * f_D
+    M_disk = task["M_disk"][owner] * f_D**2 * sample["upsilon_disk"]
+    R_disk = task["R_disk"][owner] * f_D
+
+    if task["baryons"] == "rotmod":
+        sqrt_f_D = np.sqrt(f_D)
+        V_model = rotation_velocity(
+            r,
+            M_disk,
+            R_disk,
+            V_gas=curves["V_gas"] * sqrt_f_D,
+            V_disk=curves["V_disk"] * sqrt_f_D,
+            V_bulge=np.nan_to_num(curves["V_bulge"]) * sqrt_f_D,
+            upsilon_disk=task["upsilon_disk"] * sample["upsilon_disk"],
+            upsilon_bulge=task["upsilon_bulge"] * sample["upsilon_bulge"],
+            model=task["model"],
+        )
+    elif task["baryons"] == "model":
+        V_model = rotation_velocity(r, M_disk, R_disk, model=task["model"])
+    else:
+        raise ValueError(f"Unknown baryon model: {task['baryons']}")
+    V_obs = curves["V_obs"] * sample["inc_factor"]
+
+    # Per-galaxy mean |V_model - V_obs| / V_obs of every sample: (K, n_gal)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pct = np.abs(V_model - V_obs) / np.abs(V_obs) * 100
+        error = np.full((n_samples, n_gal), np.nan)
+        nonempty = counts > 0
+        if nonempty.any():
+            starts = np.concatenate([[0], np.cumsum(counts)[:-1]])[nonempty]
+            error[:, nonempty] = np.add.reduceat(pct, starts, axis=1) / counts[nonempty]
+
+    return {
+        "V_model": np.percentile(V_model, q, axis=0),
+        "V_obs": np.percentile(V_obs, q, axis=0),
+        "error": np.percentile(error, q, axis=0),
+    }
+
+
+def monte_carlo_curves(
+    curves,
+    offsets,
+    M_disk,
+    R_disk,
+    D_frac_err=DISTANCE_ERROR_FRAC,
+    inc=np.nan,
+    inc_err=INCLINATION_ERROR_DEG,
+    n_samples=1000,
+    seed=0,
+    percentiles=PERCENTILES,
+    upsilon_disk=UPSILON_DISK,
+    upsilon_bulge=UPSILON_BULGE,
+    upsilon_dex=UPSILON_SCATTER_DEX,
+    baryons="rotmod",
+    model=UNITY_MODEL,
+    max_elements=MAX_ELEMENTS,
+    jobs=1,
+):
+    """
+    Monte Carlo percentile bands of the UET rotation curves of many galaxies.
+
+    Parameters:
+        curves     : flat curve columns (R, V_obs; plus V_gas, V_disk, V_bulge
+                     for baryons="rotmod"), galaxy i owns offsets[i]:offsets[i + 1]
+        M_disk, R_disk : per-galaxy disk mass (at upsilon_disk) and scale length
+        D_frac_err : fractional distance error (scalar or per galaxy)
+        inc, inc_err : inclination and its error in degrees (NaN = no correction)
+        n_samples  : K draws per galaxy
+        seed       : root seed; galaxy i always uses stream i of it
+        max_elements : bound on K × points evaluated at once
+        jobs       : worker processes for the galaxy chunks
+
+    Returns:
+        dict with percentiles, V_model and V_obs bands (n_percentiles, n_points)
+        and per-galaxy mean percent error bands (n_percentiles, n_galaxies)
+    """
+    offsets = np.asarray(offsets)
+    counts = counts_from_offsets(offsets)
+    n_gal = counts.size
+
+    def per_galaxy(values):
+        return np.broadcast_to(np.asarray(values, dtype=float), (n_gal,))
+
+    M_disk, R_disk, D_frac_err, inc, inc_err = (
+        per_galaxy(v) for v in (M_disk, R_disk, D_frac_err, inc, inc_err)
+    )
+    seeds = np.random.SeedSequence(seed).spawn(n_gal)
+    columns = ("R", "V_obs")
+    if baryons == "rotmod":
+        columns += ("V_gas", "V_disk", "V_bulge")
+
+    tasks = []
+    for first, last in chunk_galaxies(counts, n_samples, max_elements):
+        lo, hi = offsets[first], offsets[last]
+        tasks.append(
+            {
+                "curves": {col: np.asarray(curves[col], dtype=float)[lo:hi] for col in columns},
+                "counts": counts[first:last],
+                "M_disk": M_disk[first:last],
+                "R_disk": R_disk[first:last],
+                "D_frac_err": D_frac_err[first:last],
+                "inc": inc[first:last],
+                "inc_err": inc_err[first:last],
+                "seeds": seeds[first:last],
+                "n_samples": n_samples,
+                "percentiles": percentiles,
+                "upsilon_disk": upsilon_disk,
+                "upsilon_bulge": upsilon_bulge,
+                "upsilon_dex": upsilon_dex,
+                "baryons": baryons,
+                "model": model,
+            }
+        )
+
+    if jobs > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            parts = list(pool.map(_evaluate_chunk, tasks))
+    else:
+        parts = [_evaluate_chunk(task) for task in tasks]
+
+    n_q = len(percentiles)
+    result = {"percentiles": np.asarray(percentiles, dtype=float)}
+    for key, width in (("V_model", offsets[-1]), ("V_obs", offsets[-1]), ("error", n_gal)):
+        result[key] = (
+            np.concatenate([p[key] for p in parts], axis=1) if parts else np.empty((n_q, width))
+        )
+    return result
+
+
+def monte_carlo_store(store, n_samples=1000, seed=0, upsilon_disk=UPSILON_DISK, **kwargs):
+    """
+    Monte Carlo bands for every galaxy of a SPARC store.
+
+    Distance and inclination errors come from the catalog columns e_D and
+    e_Inc when present, otherwise DISTANCE_ERROR_FRAC and
+    INCLINATION_ERROR_DEG. Remaining keyword arguments go to
+    monte_carlo_curves.
+    """
+    index = store.index
+    M_disk, R_disk = galaxy_parameters(store, upsilon_disk)
+    n_gal = len(store)
+
+    D = np.asarray(index["D"], dtype=float)
+    D_frac_err = np.full(n_gal, DISTANCE_ERROR_FRAC)
+    if "e_D" in index:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            frac = np.asarray(index["e_D"], dtype=float) / D
+        D_frac_err = np.where(np.isfinite(frac) & (frac > 0), frac, D_frac_err)
+
+    inc_err = np.full(n_gal, INCLINATION_ERROR_DEG)
+    if "e_Inc" in index:
+        e_inc = np.asarray(index["e_Inc"], dtype=float)
+        inc_err = np.where(np.isfinite(e_inc) & (e_inc > 0), e_inc, inc_err)
+
+    return monte_carlo_curves(
+        store.curves,
+        store.offsets,
+        M_disk,
+        R_disk,
+        D_frac_err=D_frac_err,
+        inc=np.asarray(index["Inc"], dtype=float),
+        inc_err=inc_err,
+        n_samples=n_samples,
+        seed=seed,
+        upsilon_disk=upsilon_disk,
+        **kwargs,
+    )
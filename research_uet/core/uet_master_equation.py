@@ -310,28 +310,32 @@ def strategic_boost(density: float, scale: float = 1.0) -> float:
 
     "ทุกระบบอยู่ในเกมพลังงานหลายรอบ (multi-round energy game)"
     "เป้าหมายของเกม = อยู่รอด + ลดค่าเสียหายในอนาคต"
+
+    Accepts arrays of densities/scales (one boost per element).
     """
-    density_ratio = density / SIGMA_CRIT
+    density_ratio = np.asarray(density / SIGMA_CRIT, dtype=float)
+    scale = np.asarray(scale, dtype=float)
 
     # Base Game Theory formula
     beta_base = 1.5 * density_ratio
 
-    # Strategic Payoff Gradient (∇Π_game) for high-conflict
-    if density_ratio > 1.0:
-        payoff_gradient = 2.0 * np.log10(1 + density_ratio)
-    else:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Strategic Payoff Gradient (∇Π_game) for high-conflict
+        conflict = 2.0 * np.log10(1 + np.maximum(density_ratio, 0.0))
         # SCARCITY BOOST (Axiom 8b): Low density systems optimize harder to survive
         # "เมื่อทรัพยากร (Mass) ต่ำ ต้องใช้ Information (Strategy) สูง"
-        if density_ratio < 0.1 and density_ratio > 0:
-            payoff_gradient = 1.5 * (0.1 / (density_ratio + 1e-9)) ** 0.25
-        else:
-            payoff_gradient = 0.0
+        scarcity = 1.5 * (0.1 / (np.abs(density_ratio) + 1e-9)) ** 0.25
+    payoff_gradient = np.where(
+        density_ratio > 1.0,
+        conflict,
+        np.where((density_ratio < 0.1) & (density_ratio > 0), scarcity, 0.0),
+    )
 
     beta_U = beta_base + payoff_gradient
 
     # Scale correction for compact systems (R_disk < 2 kpc)
-    if scale < 2.0 and scale > 0:
-        beta_U *= (2.0 / scale) ** 0.3
+    compact = (scale < 2.0) & (scale > 0)
+    beta_U = np.where(compact, beta_U * (2.0 / np.where(compact, scale, 1.0)) ** 0.3, beta_U)
 
     # IMPORTANT: Minimum β_U = 1.5 for compact systems (original working formula)
     return np.clip(beta_U, 1.5, 15.0)
@@ -426,7 +430,20 @@ def layer_coherence_term(
 # =============================================================================
 
 
-def calculate_halo_ratio(rho: float, sigma_bar: float, r_kpc: float) -> float:
+# Unity Density Law constants (fitted by fit_sparc_galaxies.py --fit-law)
+HALO_RATIO_0 = 8.5  # Pivot ratio
+HALO_GAMMA = 0.48  # Thermodynamic scaling index
+HALO_RHO_0 = 5e7  # Pivot density (M_sun/kpc^3)
+
+
+def calculate_halo_ratio(
+    rho: float,
+    sigma_bar: float,
+    r_kpc: float,
+    ratio_0: float = HALO_RATIO_0,
+    gamma: float = HALO_GAMMA,
+    rho_0: float = HALO_RHO_0,
+) -> float:
     """
     🌌 Unity Density Law: M_halo / M_disk Ratio
 
@@ -439,16 +456,15 @@ def calculate_halo_ratio(rho: float, sigma_bar: float, r_kpc: float) -> float:
       gamma   = 0.48 (Thermodynamic scaling index)
 
     This unifies Spiral and Dwarf galaxies under a single vacuum pressure law.
+    Accepts arrays of densities (one ratio per element).
     """
-    RHO_0 = 5e7
-    GAMMA = 0.48
-    RATIO_0 = 8.5
-
-    if rho <= 1.0:  # Prevent division by zero or negative density
-        return RATIO_0
+    if np.ndim(rho) == 0:
+        if rho <= 1.0:  # Prevent division by zero or negative density
+            return ratio_0
+        return ratio_0 * (rho / rho_0) ** -gamma
 
-    ratio = RATIO_0 * (rho / RHO_0) ** -GAMMA
-    return ratio
+    rho = np.asarray(rho, dtype=float)
+    return np.where(rho > 1.0, ratio_0 * (np.maximum(rho, 1.0) / rho_0) ** -gamma, ratio_0)
 
 
 def omega_functional_complete(
@@ -4,15 +4,31 @@ UET Matrix Toolkit (v0.9 Beta)
 Utilities for configuring and verifying Matrix Simulations.
 - MatrixConfig: Loads parameters from JSON.
 - MatrixVisualizer: Generates Heatmaps/Plots from UniverseState tensors.
+- SnapshotWriter: Per-step heatmap frames written in parallel.
+
+Two heatmap paths:
+- plot_heatmap / plot_state_layers: labelled matplotlib figures (title,
+  colour bar); 3D layers are reduced to 2D first.
+- save_heatmap / save_state_layers: NumPy only. The layer is reduced to
+  2D (slice or max/mean/sum projection), mapped through a 256-colour LUT
+  and written as PNG with zlib, with no figure machinery. Use this for
+  movies and large runs.
+
+matplotlib is imported on the first plot, not with this module, and
+UET_NO_PLOTS=1 skips rendering altogether (see uet_viz.py).
 """
 
 import json
 import os
+import struct
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-import matplotlib.pyplot as plt
 from dataclasses import dataclass
 from typing import Dict, Any, Optional
 
+from research_uet.core.uet_viz import plots_disabled
+
 
 @dataclass
 class MatrixConfig:
@@ -36,12 +52,218 @@ class MatrixConfig:
         )
 
 
+# =============================================================================
+# FAST HEATMAPS (NumPy -> PNG)
+# =============================================================================
+
+PROJECTIONS = ("slice", "max", "mean", "sum")
+
+# viridis at 8 evenly spaced stops; interpolated to 256 colours
+_VIRIDIS_STOPS = np.array(
+    [
+        [68, 1, 84],
+        [70, 50, 126],
+        [54, 92, 141],
+        [39, 127, 142],
+        [31, 161, 135],
+        [74, 193, 109],
+        [160, 218, 57],
+        [253, 231, 37],
+    ],
+    dtype=float,
+)
+
+_LUTS: Dict[str, np.ndarray] = {}
+
+
+def colormap_lut(name: str = "viridis") -> np.ndarray:
+    """
+    (256, 3) uint8 colour table. viridis is built in; other names come
+    from matplotlib (imported only for them).
+
+    The built-in viridis is interpolated from 8 stops, so it matches
+    matplotlib's table at both ends but differs slightly in between. Fine
+    for frames and previews; use plot_heatmap where exact colours matter.
+    """
+    if name not in _LUTS:
+        x = np.linspace(0.0, 1.0, 256)
+        if name == "viridis":
+            stops = np.linspace(0.0, 1.0, len(_VIRIDIS_STOPS))
+            rgb = np.stack([np.interp(x, stops, _VIRIDIS_STOPS[:, c]) for c in range(3)], axis=1)
+        else:
+            import matplotlib
+
+            rgb = matplotlib.colormaps[name](x)[:, :3] * 255
+        _LUTS[name] = np.round(rgb).astype(np.uint8)
+    return _LUTS[name]
+
+
+def extract_2d(
+    field: np.ndarray, projection: str = "slice", axis: int = -1, index: Optional[int] = None
+) -> np.ndarray:
+    """
+    2D view of a 2D or 3D field.
+
+    projection: "slice" (the plane at `index` along `axis`, default the
+    centre) or "max" / "mean" / "sum" along `axis`. 2D input is returned
+    as is.
+    """
+    field = np.asarray(field)
+    if field.ndim == 2:
+        return field
+    if field.ndim != 3:
+        raise ValueError(f"expected a 2D or 3D field, got shape {field.shape}")
+    if projection == "slice":
+        if index is None:
+            index = field.shape[axis] // 2
+        return np.take(field, index, axis=axis)
+    if projection not in PROJECTIONS:
+        raise ValueError(f"projection must be one of {PROJECTIONS}, got {projection!r}")
+    return getattr(field, projection)(axis=axis)
+
+
+def colorize(
+    image: np.ndarray,
+    lut: np.ndarray,
+    vmin: Optional[float] = None,
+    vmax: Optional[float] = None,
+    scale: int = 1,
+) -> np.ndarray:
+    """
+    (H, W, 3) uint8 RGB of a 2D array through a LUT. Row 0 ends up at the
+    bottom (imshow origin="lower"); NaN maps to the lowest colour.
+    """
+    image = np.asarray(image, dtype=float)
+    lo = np.nanmin(image) if vmin is None else vmin
+    hi = np.nanmax(image) if vmax is None else vmax
+    if not np.isfinite(lo) or not np.isfinite(hi):
+        lo = hi = 0.0
+    span = hi - lo if hi > lo else 1.0
+    idx = np.nan_to_num((image - lo) * (255.0 / span), nan=0.0)
+    rgb = lut[np.clip(idx, 0, 255).astype(np.uint8)][::-1]
+    if scale > 1:
+        rgb = rgb.repeat(scale, axis=0).repeat(scale, axis=1)
+    return rgb
+
+
+def write_png(filename: str, rgb: np.ndarray, level: int = 3):
+    """Write an (H, W, 3) uint8 array as an 8-bit RGB PNG (zlib only)."""
+    height, width, _ = rgb.shape
+    rows = np.empty((height, 1 + width * 3), dtype=np.uint8)
+    rows[:, 0] = 0  # filter type "None" for every scanline
+    rows[:, 1:] = rgb.reshape(height, width * 3)
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        body = kind + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    with open(filename, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        f.write(chunk(b"IHDR", header))
+        f.write(chunk(b"IDAT", zlib.compress(rows.tobytes(), level)))
+        f.write(chunk(b"IEND", b""))
+
+
+def _auto_scale(shape, target: int = 512) -> int:
+    """Integer upscale so small grids still give readable images."""
+    return max(1, target // max(shape))
+
+
+LAYER_NAMES = {0: "mass", 1: "info", 2: "flux"}
+
+
+class SnapshotWriter:
+    """
+    Writes heatmap frames of a running simulation on a thread pool.
+
+    The 2D reduction happens in the caller (a small copy, so the engine
+    may keep mutating its state); colour mapping and PNG encoding (NumPy
+    and zlib, both release the GIL) run in the pool:
+
+        with SnapshotWriter("frames", projection="max") as frames:
+            for t in range(steps):
+                state = engine.step(state, dt)
+                frames.add(state, t)
+
+    Files: <output_dir>/<layer name>_<step:05d>.png. Colour limits are
+    per frame unless vmin / vmax are given.
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        layers=(0, 1),
+        projection: str = "slice",
+        axis: int = -1,
+        index: Optional[int] = None,
+        cmap: str = "viridis",
+        vmin: Optional[float] = None,
+        vmax: Optional[float] = None,
+        workers: Optional[int] = None,
+    ):
+        self.output_dir = output_dir
+        self.layers = tuple(layers)
+        self.view = dict(projection=projection, axis=axis, index=index)
+        self.lut = colormap_lut(cmap)
+        self.limits = dict(vmin=vmin, vmax=vmax)
+        self.enabled = not plots_disabled()
+        self.pool = None
+        self.futures = []
+        if self.enabled:
+            os.makedirs(output_dir, exist_ok=True)
+            self.pool = ThreadPoolExecutor(max_workers=workers or min(4, os.cpu_count() or 1))
+
+    def _write(self, image: np.ndarray, filename: str):
+        rgb = colorize(image, self.lut, scale=_auto_scale(image.shape), **self.limits)
+        write_png(filename, rgb)
+
+    def add(self, state, step: int):
+        """Queue the frames of one state (UniverseState or its tensor)."""
+        if not self.enabled:
+            return
+        tensor = getattr(state, "tensor", state)
+        for layer in self.layers:
+            image = np.array(extract_2d(tensor[layer], **self.view), dtype=float)
+            name = LAYER_NAMES.get(layer, f"layer{layer}")
+            filename = os.path.join(self.output_dir, f"{name}_{step:05d}.png")
+            self.futures.append(self.pool.submit(self._write, image, filename))
+
+    def close(self) -> int:
+        """Wait for all frames; returns the number written."""
+        if self.pool is None:
+            return 0
+        self.pool.shutdown(wait=True)
+        self.pool = None
+        for future in self.futures:
+            future.result()  # re-raise write errors
+        return len(self.futures)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
 class MatrixVisualizer:
     @staticmethod
-    def plot_heatmap(tensor_slice: np.ndarray, title: str, filename: str):
+    def plot_heatmap(
+        tensor_slice: np.ndarray,
+        title: str,
+        filename: str,
+        projection: str = "slice",
+        axis: int = -1,
+    ):
         """
-        Generates a heatmap image from a 2D matrix slice.
+        Generates a heatmap image from a 2D matrix slice (a 3D layer is
+        reduced with extract_2d first; imshow needs 2D).
         """
+        if plots_disabled():
+            return
+        import matplotlib.pyplot as plt
+
+        tensor_slice = extract_2d(tensor_slice, projection, axis)
         plt.figure(figsize=(10, 8))
         plt.imshow(tensor_slice, cmap="viridis", origin="lower")
         plt.colorbar(label="Density / Intensity")
@@ -55,16 +277,50 @@ class MatrixVisualizer:
         print(f"saved heatmap: {filename}")
 
     @staticmethod
-    def plot_state_layers(state, output_prefix: str):
+    def plot_state_layers(state, output_prefix: str, projection: str = "slice", axis: int = -1):
         """
         Plots Mass, Information, and Flux layers.
         """
         MatrixVisualizer.plot_heatmap(
-            state.tensor[0], "Mass Density (Layer 0)", f"{output_prefix}_mass.png"
+            state.tensor[0], "Mass Density (Layer 0)", f"{output_prefix}_mass.png", projection, axis
         )
         MatrixVisualizer.plot_heatmap(
-            state.tensor[1], "Information Density (Layer 1)", f"{output_prefix}_info.png"
+            state.tensor[1],
+            "Information Density (Layer 1)",
+            f"{output_prefix}_info.png",
+            projection,
+            axis,
         )
         MatrixVisualizer.plot_heatmap(
-            state.tensor[2], "Flux/Field (Layer 2)", f"{output_prefix}_flux.png"
+            state.tensor[2], "Flux/Field (Layer 2)", f"{output_prefix}_flux.png", projection, axis
         )
+
+    @staticmethod
+    def save_heatmap(
+        field: np.ndarray,
+        filename: str,
+        projection: str = "slice",
+        axis: int = -1,
+        index: Optional[int] = None,
+        cmap: str = "viridis",
+        vmin: Optional[float] = None,
+        vmax: Optional[float] = None,
+    ):
+        """
+        Fast heatmap: 2D reduction + LUT + PNG, no matplotlib figure
+        (no title or colour bar).
+        """
+        if plots_disabled():
+            return
+        image = extract_2d(field, projection, axis, index)
+        os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+        rgb = colorize(image, colormap_lut(cmap), vmin, vmax, scale=_auto_scale(image.shape))
+        write_png(filename, rgb)
+
+    @staticmethod
+    def save_state_layers(state, output_prefix: str, projection: str = "slice", axis: int = -1):
+        """Fast PNGs of the Mass, Information and Flux layers."""
+        for layer, name in LAYER_NAMES.items():
+            MatrixVisualizer.save_heatmap(
+                state.tensor[layer], f"{output_prefix}_{name}.png", projection, axis
+            )
@@ -0,0 +1,77 @@
+"""
+UET Test Results - Structured Check Records
+===========================================
+
+Lets a topic test report its individual checks to the test runner as
+JSON lines instead of (only) printing them:
+
+    {"check": "NGC2841", "status": "pass", "metric": {"error_pct": 3.1},
+     "duration": 0.002}
+
+The runner names the file in the UET_RESULTS_FILE environment variable
+and parses it line by line. Without the variable (a test run by hand)
+record() does nothing, so tests keep printing their usual report.
+
+    from research_uet.core.uet_results import record, timed_check
+
+    record("NGC2841", error < 20, metric={"error_pct": error})
+
+    with timed_check("bell_chsh") as check:
+        S = chsh_value()
+        check.passed = S > 2
+        check.metric = {"S": S}
+"""
+
+import json
+import os
+import time
+
+RESULTS_ENV = "UET_RESULTS_FILE"
+
+
+def _jsonable(value):
+    """numpy scalars / arrays -> plain Python for json.dumps."""
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    return str(value)
+
+
+def record(check, passed, metric=None, duration=None):
+    """
+    Append one check result to the runner's results file (if any).
+
+    check    : name of the check (unique within the test file)
+    passed   : truthy = "pass", falsy = "fail", None = "skip"
+    metric   : number or dict of numbers describing the outcome
+    duration : seconds spent on the check
+    """
+    path = os.environ.get(RESULTS_ENV)
+    if not path:
+        return
+    status = "skip" if passed is None else ("pass" if passed else "fail")
+    line = {"check": str(check), "status": status}
+    if metric is not None:
+        line["metric"] = metric
+    if duration is not None:
+        line["duration"] = duration
+    # One write per line in append mode: lines of concurrent writers never interleave
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(line, default=_jsonable) + "\n")
+
+
+class timed_check:
+    """Context manager that records a check with its wall time."""
+
+    def __init__(self, check):
+        self.check = check
+        self.passed = None
+        self.metric = None
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        passed = False if exc_type is not None else self.passed
+        record(self.check, passed, self.metric, time.perf_counter() - self.start)
+        return False
@@ -1,11 +1,317 @@
+"""
+UET Visualization Helpers (Plotly)
+==================================
+Static PNG plots for the topic tests.
+
+plotly is imported on first use, not at import time: `uet_viz.go` and
+`uet_viz.pio` resolve lazily, so compute-only runs never load it.
+
+Headless mode: with UET_NO_PLOTS=1 nothing is rendered or written.
+`uet_viz.go` then hands out a no-op stand-in, so test code that builds
+figures itself (`uet_viz.go.Figure()`, `fig.add_trace(...)`, `fig.data[0]`)
+runs through without plotly being imported. save_plot and the plot
+helpers return False when they write nothing, so tests only report
+figures that were actually saved.
+
+Rendering (Kaleido) has a heavy per-call start-up, so save_plot can queue
+figures instead of writing each one at once. UET_PLOT_BATCH selects:
+
+    unset / 0   render every figure inside save_plot (one at a time)
+    1           queue figures; flush_plots() (at exit at the latest)
+                renders them in one plotly.io.write_images batch
+    background  a background thread renders queued figures while the
+                test keeps computing; flush_plots() waits for it
+
+Queued figures render after save_plot has returned (at exit, after the
+exit code is fixed), so their render errors cannot fail a test; test
+runners leave the default.
+
+All modes share one long-lived Kaleido session where the installed
+Kaleido offers one, and skip figures whose spec (fig.to_json() + scale)
+is unchanged since the PNG was last written (hashes in
+.cache/plot_hashes.json, or $UET_CACHE_DIR).
+"""
+
+import atexit
+import hashlib
+import importlib
+import json
 import os
-import plotly.graph_objects as go
-import plotly.io as pio
+import queue
+import threading
 from pathlib import Path
 
+PLOTS_ENV = "UET_NO_PLOTS"
+BATCH_ENV = "UET_PLOT_BATCH"
+PLOT_SCALE = 2  # higher resolution PNGs
+
+_CACHE_DIR = Path(
+    os.environ.get("UET_CACHE_DIR", Path(__file__).resolve().parents[2] / ".cache")
+)
+HASH_FILE = _CACHE_DIR / "plot_hashes.json"
+
+_LAZY_MODULES = {"go": "plotly.graph_objects", "pio": "plotly.io"}
+
+
+def plots_disabled():
+    """True when UET_NO_PLOTS is set (to anything but "" / "0")."""
+    return os.environ.get(PLOTS_ENV, "") not in ("", "0")
+
+
+class _NoPlot:
+    """Absorbs any attribute access, call or item access (headless stand-in for plotly)."""
+
+    def __getattr__(self, name):
+        return self
+
+    def __call__(self, *args, **kwargs):
+        return self
+
+    def __getitem__(self, key):
+        return self
+
+    def __setitem__(self, key, value):
+        pass
+
+    def __iter__(self):
+        return iter(())
+
+
+_NO_PLOT = _NoPlot()
+
+
+def __getattr__(name):
+    """Lazy `go` / `pio` module attributes."""
+    if name not in _LAZY_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if plots_disabled():
+        return _NO_PLOT
+    module = importlib.import_module(_LAZY_MODULES[name])
+    globals()[name] = module  # later lookups skip __getattr__
+    return module
+
+
+def _go():
+    return __getattr__("go")
+
+
+def _write_images():
+    """plotly.io.write_images (plotly >= 6.1), or None where it is unavailable."""
+    pio = globals().get("pio")
+    if pio is None:
+        try:
+            pio = __getattr__("pio")
+        except ImportError:
+            return None
+    if isinstance(pio, _NoPlot):
+        return None
+    return getattr(pio, "write_images", None)
+
+
+def batch_mode():
+    """"" (render at once), "1" (batch at flush) or "background"."""
+    mode = os.environ.get(BATCH_ENV, "").strip().lower()
+    return "" if mode in ("", "0") else mode if mode == "background" else "1"
+
+
+# =============================================================================
+# RENDER QUEUE
+# =============================================================================
+
+
+def figure_hash(fig, scale=PLOT_SCALE):
+    """sha256 of a figure's full JSON spec and the export scale."""
+    digest = hashlib.sha256(fig.to_json().encode("utf-8"))
+    digest.update(f"|scale={scale}".encode())
+    return digest.hexdigest()
+
+
+class _RenderQueue:
+    """
+    Figures waiting to be written, rendered in batches by one Kaleido
+    session; hashes of the written PNGs let unchanged figures be skipped.
+    """
+
+    def __init__(self, hash_file=HASH_FILE):
+        self.hash_file = hash_file
+        self.pending = []  # (fig, path, hash)
+        self.lock = threading.Lock()
+        self.hashes = None
+        self.session = False
+        self.thread = None
+        self.inbox = None
+
+    # --- hashes -----------------------------------------------------------
+
+    def _load_hashes(self):
+        if self.hashes is None:
+            try:
+                with open(self.hash_file, encoding="utf-8") as f:
+                    self.hashes = json.load(f)
+            except (OSError, ValueError):
+                self.hashes = {}
+        return self.hashes
+
+    def unchanged(self, path, key):
+        return path.exists() and self._load_hashes().get(str(path.resolve())) == key
+
+    def _save_hashes(self, written):
+        """Merge {path: hash} of newly written PNGs into the hash file."""
+        if not written:
+            return
+        try:
+            with open(self.hash_file, encoding="utf-8") as f:
+                stored = json.load(f)  # other test processes may have added entries
+        except (OSError, ValueError):
+            stored = {}
+        stored.update(written)
+        self._load_hashes().update(written)
+        try:
+            self.hash_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.hash_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(stored, f, indent=0, sort_keys=True)
+            os.replace(tmp, self.hash_file)
+        except OSError:
+            pass  # read-only checkout: figures are simply re-rendered
+
+    # --- rendering --------------------------------------------------------
+
+    def _start_session(self):
+        """Keep one Kaleido browser alive for all renders (Kaleido >= 1.0)."""
+        if self.session:
+            return
+        self.session = True
+        try:
+            import kaleido
+
+            kaleido.start_sync_server()
+        except Exception:
+            pass  # older Kaleido keeps its own persistent process (or already running)
+
+    def _stop_session(self):
+        if not self.session:
+            return
+        self.session = False
+        try:
+            import kaleido
+
+            kaleido.stop_sync_server()
+        except Exception:
+            pass
+
+    def _render(self, batch):
+        """Write a batch of (fig, path, hash); report each figure. True if all were written."""
+        if not batch:
+            return True
+        self._start_session()
+        done, written = [], {}
+        write_images = _write_images() if len(batch) > 1 else None
+        if write_images is not None:
+            figs = [fig for fig, _, _ in batch]
+            paths = [str(path) for _, path, _ in batch]
+            try:
+                write_images(figs, paths, scale=PLOT_SCALE)
+                done = batch
+            except Exception as e:
+                print(f"  [Plot Error]: Batch render failed ({e}); writing figures one by one")
+        if not done:
+            for item in batch:  # one by one, so one bad figure fails alone
+                fig, path, _ = item
+                try:
+                    fig.write_image(str(path), scale=PLOT_SCALE)
+                    done.append(item)
+                except Exception as e:
+                    print(f"  [Plot Error]: Could not save {path.name}. Error: {e}")
+        for _, path, key in done:
+            print(f"  [Plot Saved]: {path}")
+            written[str(path.resolve())] = key
+        self._save_hashes(written)
+        return len(done) == len(batch)
+
+    def _background(self):
+        while True:
+            item = self.inbox.get()
+            batch = [] if item is None else [item]
+            stop = item is None
+            while not stop:  # take whatever else is waiting
+                try:
+                    item = self.inbox.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                else:
+                    batch.append(item)
+            with self.lock:
+                self._render(batch)
+            if stop:
+                return
+
+    # --- public -----------------------------------------------------------
+
+    def add(self, fig, path):
+        """Write or queue one figure; False if writing it at once failed."""
+        key = figure_hash(fig)
+        if self.unchanged(path, key):
+            print(f"  [Plot Unchanged]: {path}")
+            return True
+        mode = batch_mode()
+        if not mode:
+            with self.lock:
+                return self._render([(fig, path, key)])
+        elif mode == "background":
+            if self.thread is None:
+                self.inbox = queue.Queue()
+                self.thread = threading.Thread(
+                    target=self._background, name="uet-viz-render", daemon=True
+                )
+                self.thread.start()
+            self.inbox.put((fig, path, key))
+        else:
+            self.pending.append((fig, path, key))
+        return True
+
+    def flush(self):
+        """Render everything queued; wait for the background thread."""
+        if self.thread is not None:
+            self.inbox.put(None)
+            self.thread.join()
+            self.thread = None
+        batch, self.pending = self.pending, []
+        with self.lock:
+            self._render(batch)
+
+    def close(self):
+        self.flush()
+        self._stop_session()
+
+
+_QUEUE = _RenderQueue()
+
+
+def flush_plots():
+    """Write all queued figures now (also runs automatically at exit)."""
+    _QUEUE.flush()
+
+
+atexit.register(_QUEUE.close)
+
 
 # Ensure Result directory exists relative to caller or specified path
 def save_plot(fig, filename, result_dir):
+    """
+    Save a figure as <result_dir>/<filename>.png (scale 2).
+
+    Depending on UET_PLOT_BATCH the PNG is written now or queued (see the
+    module docstring); an unchanged figure is not rendered again.
+
+    Returns:
+        bool: True if the PNG was written, queued or is up to date; False
+        when plots are disabled or saving failed.
+    """
+    if plots_disabled() or isinstance(fig, _NoPlot):
+        return False
     Path(result_dir).mkdir(parents=True, exist_ok=True)
 
     # Force extension to .png
@@ -17,15 +323,17 @@ def save_plot(fig, filename, result_dir):
     path = Path(result_dir) / filename
 
     try:
-        # Use Kaleido for static image
-        fig.write_image(str(path), scale=2)  # scale=2 for higher res
-        print(f"  [Plot Saved]: {path}")
+        return _QUEUE.add(fig, path)
     except Exception as e:
         print(f"  [Plot Error]: Could not save {filename}. Error: {e}")
+        return False
 
 
 def plot_galaxy_curve(r_kpc, v_obs, v_bar, v_uet, title, output_dir):
     """Plots Galaxy Rotation Curve: Obs vs Newton vs UET."""
+    if plots_disabled():
+        return False
+    go = _go()
     fig = go.Figure()
     fig.add_trace(
         go.Scatter(
@@ -55,25 +363,31 @@ def plot_galaxy_curve(r_kpc, v_obs, v_bar, v_uet, title, output_dir):
         width=1000,
         height=600,
     )
-    save_plot(fig, "rotation_curve.html", output_dir)
+    return save_plot(fig, "rotation_curve.html", output_dir)
 
 
 def plot_universal_trend(x_data, y_data, x_label, y_label, title, filename, output_dir):
     """Generic Scatter Plot."""
+    if plots_disabled():
+        return False
+    go = _go()
     fig = go.Figure()
     fig.add_trace(go.Scatter(x=x_data, y=y_data, mode="markers+lines", name="Data"))
     fig.update_layout(
         title=title, xaxis_title=x_label, yaxis_title=y_label, template="plotly_white"
     )
-    save_plot(fig, filename, output_dir)
+    return save_plot(fig, filename, output_dir)
 
 
 def plot_comparison(categories, values_legacy, values_uet, values_obs, title, output_dir):
     """Bar Chart Comparison."""
+    if plots_disabled():
+        return False
+    go = _go()
     fig = go.Figure()
     fig.add_trace(go.Bar(x=categories, y=values_legacy, name="Legacy Theory", marker_color="gray"))
     fig.add_trace(go.Bar(x=categories, y=values_uet, name="UET Theory", marker_color="blue"))
     fig.add_trace(go.Bar(x=categories, y=values_obs, name="Observation", marker_color="green"))
 
     fig.update_layout(title=title, barmode="group", template="plotly_white")
-    save_plot(fig, "comparison_chart.html", output_dir)
+    return save_plot(fig, "comparison_chart.html", output_dir)
@@ -256,8 +256,8 @@ def run_test():
             showlegend=True,
         )
 
-        uet_viz.save_plot(fig, "brownian_viz.png", result_dir)
-        print("  [Viz] Generated 'brownian_viz.png'")
+        if uet_viz.save_plot(fig, "brownian_viz.png", result_dir):
+            print("  [Viz] Generated 'brownian_viz.png'")
 
     except Exception as e:
         print(f"Viz Error: {e}")
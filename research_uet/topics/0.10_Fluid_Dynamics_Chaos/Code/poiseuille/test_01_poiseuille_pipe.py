@@ -170,8 +170,8 @@ class TestPoiseuilleFlow3D(unittest.TestCase):
                 showlegend=True,
             )
 
-            uet_viz.save_plot(fig, "poiseuille_viz.png", result_dir)
-            print("  [Viz] Generated 'poiseuille_viz.png'")
+            if uet_viz.save_plot(fig, "poiseuille_viz.png", result_dir):
+                print("  [Viz] Generated 'poiseuille_viz.png'")
 
         except Exception as e:
             print(f"Viz Error: {e}")
@@ -124,8 +124,8 @@ def run_three_body():
         height=800,
     )
 
-    uet_viz.save_plot(fig, "three_body_viz.png", result_dir)
-    print("  [Viz] Generated 'three_body_viz.png'")
+    if uet_viz.save_plot(fig, "three_body_viz.png", result_dir):
+        print("  [Viz] Generated 'three_body_viz.png'")
 
     print("\nChaos Theory in UET:")
     print("  Deterministic systems can exhibit unpredictable behavior.")
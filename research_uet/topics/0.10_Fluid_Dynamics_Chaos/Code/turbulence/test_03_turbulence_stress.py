@@ -154,8 +154,8 @@ class TestMatrixTurbulence(unittest.TestCase):
                 showlegend=True,
             )
 
-            uet_viz.save_plot(fig, "turbulence_viz.png", result_dir)
-            print("  [Viz] Generated 'turbulence_viz.png'")
+            if uet_viz.save_plot(fig, "turbulence_viz.png", result_dir):
+                print("  [Viz] Generated 'turbulence_viz.png'")
 
         except Exception as e:
             print(f"Viz Error: {e}")
@@ -188,8 +188,8 @@ def run_test():
             showlegend=True,
         )
 
-        uet_viz.save_plot(fig, "bec_viz.png", result_dir)
-        print("  [Viz] Generated 'bec_viz.png'")
+        if uet_viz.save_plot(fig, "bec_viz.png", result_dir):
+            print("  [Viz] Generated 'bec_viz.png'")
 
     except Exception as e:
         print(f"Viz Error: {e}")
@@ -221,8 +221,8 @@ def run_test():
             showlegend=True,
         )
 
-        uet_viz.save_plot(fig, "phase_separation_viz.png", result_dir)
-        print("  [Viz] Generated 'phase_separation_viz.png'")
+        if uet_viz.save_plot(fig, "phase_separation_viz.png", result_dir):
+            print("  [Viz] Generated 'phase_separation_viz.png'")
 
     except Exception as e:
         print(f"Viz Error: {e}")
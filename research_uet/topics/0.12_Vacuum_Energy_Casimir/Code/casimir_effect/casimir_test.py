@@ -263,8 +263,8 @@ def run_test_with_real_data():
             showlegend=True,
         )
 
-        uet_viz.save_plot(fig, "casimir_viz.png", result_dir)
-        print("  [Viz] Generated 'casimir_viz.png'")
+        if uet_viz.save_plot(fig, "casimir_viz.png", result_dir):
+            print("  [Viz] Generated 'casimir_viz.png'")
 
     except Exception as e:
         print(f"Viz Error: {e}")
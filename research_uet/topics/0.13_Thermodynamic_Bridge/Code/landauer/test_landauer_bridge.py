@@ -368,7 +368,8 @@ def run_all_tests():
         )
         uet_viz.save_plot(fig3, "jacobson/jacobson_viz.png", result_dir)
 
-        print("\n[Viz] Generated 3 bridge visualizations.")
+        if not uet_viz.plots_disabled():
+            print("\n[Viz] Generated 3 bridge visualizations.")
 
     except Exception as e:
         print(f"Viz Error: {e}")
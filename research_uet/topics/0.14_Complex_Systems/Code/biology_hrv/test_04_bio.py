@@ -231,8 +231,8 @@ def run_test():
                 xaxis_title="SD1 (Short-Term Variability) [ms]",
                 yaxis_title="SD2 (Long-Term Variability) [ms]",
             )
-            uet_viz.save_plot(fig, "biology_viz.png", result_dir)
-            print("  [Viz] Generated 'biology_viz.png'")
+            if uet_viz.save_plot(fig, "biology_viz.png", result_dir):
+                print("  [Viz] Generated 'biology_viz.png'")
 
     except Exception as e:
         print(f"Viz Error: {e}")
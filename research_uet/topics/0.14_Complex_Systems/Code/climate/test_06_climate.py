@@ -243,8 +243,8 @@ def run_test():
             xaxis_title="Time Steps",
             yaxis_title="CO2 (ppm)",
         )
-        uet_viz.save_plot(fig, "climate_viz.png", result_dir)
-        print("  [Viz] Generated 'climate_viz.png'")
+        if uet_viz.save_plot(fig, "climate_viz.png", result_dir):
+            print("  [Viz] Generated 'climate_viz.png'")
 
     except Exception as e:
         print(f"Viz Error: {e}")
@@ -220,8 +220,8 @@ def run_test():
                 xaxis_title="Volatility (σ)",
                 yaxis_title="k (Value Flow Coefficient)",
             )
-            uet_viz.save_plot(fig, "economy_viz.png", result_dir)
-            print("  [Viz] Generated 'economy_viz.png'")
+            if uet_viz.save_plot(fig, "economy_viz.png", result_dir):
+                print("  [Viz] Generated 'economy_viz.png'")
 
     except Exception as e:
         print(f"Viz Error: {e}")
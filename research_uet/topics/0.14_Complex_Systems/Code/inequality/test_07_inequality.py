@@ -274,8 +274,8 @@ def run_test():
                 yaxis_title="k-Index (√(P/D) × Emp)",
                 xaxis_title="Country",
             )
-            uet_viz.save_plot(fig, "inequality_viz.png", result_dir)
-            print("  [Viz] Generated 'inequality_viz.png'")
+            if uet_viz.save_plot(fig, "inequality_viz.png", result_dir):
+                print("  [Viz] Generated 'inequality_viz.png'")
 
     except Exception as e:
         print(f"Viz Error: {e}")
@@ -253,8 +253,8 @@ def run_test():
 
         # Save
         result_dir = TOPIC_DIR / "Result" / "cluster_virial"
-        viz.save_plot(fig, "cluster_mass_viz.png", str(result_dir))
-        print(f"  [Viz] Generated 'cluster_mass_viz.png'")
+        if viz.save_plot(fig, "cluster_mass_viz.png", str(result_dir)):
+            print(f"  [Viz] Generated 'cluster_mass_viz.png'")
 
     except Exception as e:
         print(f"  [Viz] Error: {e}")
@@ -231,8 +231,8 @@ def run_test():
 
         # Save
         result_dir = TOPIC_DIR / "Result" / "heavy_binding"
-        viz.save_plot(fig, "heavy_binding_viz.png", str(result_dir))
-        print(f"  [Viz] Generated 'heavy_binding_viz.png'")
+        if viz.save_plot(fig, "heavy_binding_viz.png", str(result_dir)):
+            print(f"  [Viz] Generated 'heavy_binding_viz.png'")
 
     except Exception as e:
         print(f"  [Viz] Error: {e}")
@@ -197,8 +197,8 @@ def run_test():
 
         # Save
         result_dir = TOPIC_DIR / "Result" / "lepton_mass"
-        viz.save_plot(fig, "lepton_mass_viz.png", str(result_dir))
-        print(f"  [Viz] Generated 'lepton_mass_viz.png'")
+        if viz.save_plot(fig, "lepton_mass_viz.png", str(result_dir)):
+            print(f"  [Viz] Generated 'lepton_mass_viz.png'")
 
     except Exception as e:
         print(f"  [Viz] Error: {e}")
@@ -250,8 +250,8 @@ def run_test():
         if not result_dir.exists():
             result_dir.mkdir(parents=True)
 
-        viz.save_plot(fig, "neutrino_oscillation_viz.png", str(result_dir))
-        print(f"  [Viz] Generated 'neutrino_oscillation_viz.png'")
+        if viz.save_plot(fig, "neutrino_oscillation_viz.png", str(result_dir)):
+            print(f"  [Viz] Generated 'neutrino_oscillation_viz.png'")
 
     except Exception as e:
         print(f"  [Viz] Error: {e}")
@@ -3,6 +3,9 @@ UET Dwarf Galaxy Test - LITTLE THINGS
 ======================================
 Tests UET on 26 dwarf irregular galaxies.
 Uses V3.0 Master Equation Logic (Mixed Model).
+
+The catalog is held as a structured array; all galaxies are evaluated in
+one vectorized call and results are grouped with precomputed type masks.
 """
 
 import sys
@@ -60,6 +63,12 @@ LITTLE_THINGS = [
     ("WLM", 4.2, 40, 5.0e7, "dIrr"),
 ]
 
+DWARF_DTYPE = np.dtype(
+    [("name", "U12"), ("R_out", "f8"), ("V_max", "f8"), ("M_HI", "f8"), ("type", "U8")]
+)
+DWARFS = np.array(LITTLE_THINGS, dtype=DWARF_DTYPE)
+TYPE_MASKS = {t: DWARFS["type"] == t for t in np.unique(DWARFS["type"])}
+
 
 def uet_dwarf_velocity(R_kpc, M_HI):
     """
@@ -68,12 +77,14 @@ def uet_dwarf_velocity(R_kpc, M_HI):
     Estimates:
        R_disk ~ R_out / 3.0 (Exponential scale length approx)
        M_baryon ~ 1.33 * M_HI (Gas + Helium correction)
+    Accepts arrays (one prediction per galaxy).
     """
     G = 4.302e-6  # (km/s)^2 kpc / M_sun
 
     # 1. Estimate Parameters
+    R_kpc = np.asarray(R_kpc, dtype=float)
     R_disk_kpc = R_kpc / 3.0
-    M_baryon = M_HI * 1.33
+    M_baryon = np.asarray(M_HI, dtype=float) * 1.33
 
     # 2. Baryonic Velocity (Approximate spherical for simple check)
     v_bar_sq = G * M_baryon / R_kpc
@@ -113,7 +124,7 @@ def uet_dwarf_velocity(R_kpc, M_HI):
         # Fallback to simple MOND-like scaling if core missing
         a_0 = 1.2e-10 * (3.086e16) * 1e-6  # convert to km/s^2 approx? No.
         # Just use flat constant guess if failed
-        return 30.0
+        return np.full_like(R_kpc, 30.0)
 
     v_total = np.sqrt(v_bar_sq + v_info_sq)
     return v_total
@@ -125,45 +136,41 @@ def run_test():
     print("UET DWARF GALAXY TEST - LITTLE THINGS (V3.0 MIXED)")
     print("Data: Hunter et al. 2012 (26 dwarfs)")
     print("=" * 70)
-    print(f"\nTotal galaxies: {len(LITTLE_THINGS)}")
+    print(f"\nTotal galaxies: {len(DWARFS)}")
+
+    V_obs = DWARFS["V_max"]
+    V_uet = uet_dwarf_velocity(DWARFS["R_out"], DWARFS["M_HI"])
+    errors = np.abs(V_uet - V_obs) / V_obs * 100
 
-    results = {"pass": 0, "warn": 0, "fail": 0}
-    errors = []
+    passed = errors < 20
+    warned = ~passed & (errors < 35)
+    status = np.where(passed, "ok", np.where(warned, "~", "X"))
 
     print("\n| Galaxy | V_obs | V_UET | Error |")
     print("|:-------|:------|:------|:------|")
 
-    for name, R, V_obs, M_HI, gtype in LITTLE_THINGS:
-        V_uet = uet_dwarf_velocity(R, M_HI)
-        error = abs(V_uet - V_obs) / V_obs * 100
-        errors.append(error)
+    for name, v_obs, v_uet, error, flag in zip(DWARFS["name"], V_obs, V_uet, errors, status):
+        print(f"| {name:8} | {v_obs:5.0f} | {v_uet:5.1f} | {error:4.0f}% {flag} |")
 
-        if error < 20:
-            results["pass"] += 1
-            status = "ok"
-        elif error < 35:
-            results["warn"] += 1
-            status = "~"
-        else:
-            results["fail"] += 1
-            status = "X"
-
-        print(f"| {name:8} | {V_obs:5.0f} | {V_uet:5.1f} | {error:4.0f}% {status} |")
-
-    avg_error = sum(errors) / len(errors)
+    avg_error = errors.mean()
 
     print("\n" + "=" * 70)
     print("SUMMARY")
     print("=" * 70)
 
-    total = len(LITTLE_THINGS)
-    pass_count = results["pass"]
+    total = len(DWARFS)
+    pass_count = int(passed.sum())
 
     print(f"Total: {total}")
     print(f"Passed: {pass_count}")
     print(f"Pass Rate: {pass_count/total*100:.1f}%")
     print(f"Avg Error: {avg_error:.1f}%")
 
+    print("\nBy type:")
+    for gtype, mask in TYPE_MASKS.items():
+        n, n_pass = int(mask.sum()), int(passed[mask].sum())
+        print(f"  {gtype:<5}: {n_pass}/{n} pass, avg error {errors[mask].mean():.1f}%")
+
     # Relaxed pass condition for Research Frontier
     if pass_count >= total * 0.3:  # >30% is a start for V3.0 on dwarfs
         print(f"\nPASS ({pass_count}/{total})")
@@ -0,0 +1,356 @@
+"""
+🔧 SPARC Per-Galaxy Fitting
+============================
+Fits every SPARC galaxy's free parameters against its full rotmod curve:
+
+    per galaxy : Υ_disk (mass-to-light), R_disk (disk scale, optional)
+    global     : Unity Density Law (ratio_0, gamma at fixed pivot rho_0) with --fit-law
+
+Uses the vectorized model and analytic Jacobians from
+core/uet_galaxy_model.py. Galaxies are fitted across a process pool and
+each result is cached by a hash of (galaxy data, starting point, law,
+options), so refits only redo what changed.
+
+Global law: starts from the per-galaxy fits, then fits the law jointly
+with every galaxy's parameters (sparse Jacobian), then refits each galaxy
+under the fitted law.
+
+Usage:
+    python fit_sparc_galaxies.py [--jobs N] [--fit-law] [--fixed-rdisk] [--no-cache]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+TEST_FILE = Path(__file__).resolve()
+TOPIC_DIR = TEST_FILE.parent.parent.parent  # research_uet/topics/0.1_Galaxy_Rotation_Problem
+REPO_ROOT = TOPIC_DIR.parent.parent.parent
+
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(TOPIC_DIR / "Data" / "galaxy_rotation_175"))
+
+from research_uet.core.uet_galaxy_model import (  # noqa: E402
+    DEFAULT_LAW,
+    UPSILON_BULGE,
+    UPSILON_DISK,
+    curve_statistics,
+    fit_model,
+    galaxy_parameters,
+)
+from sparc_data import CACHE_DIR, load_sparc  # noqa: E402
+
+FIT_VERSION = 1
+FIT_CACHE = CACHE_DIR / "sparc_fits.json"
+
+# Bounds on the per-galaxy parameters
+UPSILON_BOUNDS = (0.05, 5.0)
+R_DISK_BOUNDS = (0.05, 50.0)  # kpc
+MIN_V_ERR = 1.0  # km/s, floor on quoted velocity errors
+
+
+# =============================================================================
+# SINGLE GALAXY
+# =============================================================================
+
+
+def galaxy_inputs(store, i, M_L, R_disk0):
+    """Arrays needed to fit galaxy i (plain dict, cheap to send to workers)."""
+    lo, hi = store.offsets[i], store.offsets[i + 1]
+    curve = {k: np.nan_to_num(v[lo:hi]) for k, v in store.curves.items()}
+    return {
+        "name": str(store.names[i]),
+        "R": curve["R"],
+        "V_obs": curve["V_obs"],
+        "V_err": np.maximum(curve["V_err"], MIN_V_ERR),
+        "V_gas": curve["V_gas"],
+        "V_disk": curve["V_disk"],
+        "V_bulge": curve["V_bulge"],
+        "M_L": float(M_L[i]),
+        "R_disk0": float(R_disk0[i]),
+    }
+
+
+def fit_key(inputs, law, fit_R_disk):
+    """Hash identifying one galaxy fit."""
+    digest = hashlib.sha1(f"v{FIT_VERSION}|{inputs['name']}|{fit_R_disk}".encode())
+    for key in ("R", "V_obs", "V_err", "V_gas", "V_disk", "V_bulge"):
+        digest.update(np.ascontiguousarray(inputs[key]).tobytes())
+    digest.update(np.array([inputs["M_L"], inputs["R_disk0"], *law]).tobytes())
+    return digest.hexdigest()
+
+
+def fit_galaxy(inputs, law=DEFAULT_LAW, fit_R_disk=True):
+    """
+    Least-squares fit of (ln Υ_disk [, ln R_disk]) for one galaxy.
+
+    Returns:
+        dict with upsilon_disk, R_disk, chi2, n, chi2_red, nfev, success
+    """
+    from scipy.optimize import least_squares
+
+    g = inputs
+    n_params = 2 if fit_R_disk else 1
+    columns = [0, 1] if fit_R_disk else [0]
+
+    def model(p):
+        R_disk = np.exp(p[1]) if fit_R_disk else g["R_disk0"]
+        return fit_model(
+            g["R"], g["M_L"], R_disk, np.exp(p[0]), g["V_gas"], g["V_disk"], g["V_bulge"],
+            upsilon_bulge=UPSILON_BULGE, law=law, jacobian=True,
+        )
+
+    def residuals(p):
+        return (model(p)[0] - g["V_obs"]) / g["V_err"]
+
+    def jacobian(p):
+        return model(p)[1][:, columns] / g["V_err"][:, None]
+
+    x0 = [np.log(UPSILON_DISK), np.log(np.clip(g["R_disk0"], *R_DISK_BOUNDS))][:n_params]
+    lower = [np.log(UPSILON_BOUNDS[0]), np.log(R_DISK_BOUNDS[0])][:n_params]
+    upper = [np.log(UPSILON_BOUNDS[1]), np.log(R_DISK_BOUNDS[1])][:n_params]
+
+    n = len(g["R"])
+    if n == 0 or not np.isfinite(g["M_L"]) or not np.isfinite(g["R_disk0"]):
+        return {"name": g["name"], "upsilon_disk": np.nan, "R_disk": np.nan, "chi2": np.nan,
+                "n": n, "chi2_red": np.nan, "nfev": 0, "success": False}
+
+    sol = least_squares(residuals, x0, jac=jacobian, bounds=(lower, upper), method="trf")
+    chi2 = float(np.sum(sol.fun**2))
+    return {
+        "name": g["name"],
+        "upsilon_disk": float(np.exp(sol.x[0])),
+        "R_disk": float(np.exp(sol.x[1])) if fit_R_disk else g["R_disk0"],
+        "chi2": chi2,
+        "n": n,
+        "chi2_red": chi2 / max(n - n_params, 1),
+        "nfev": int(sol.nfev),
+        "success": bool(sol.success),
+    }
+
+
+def _fit_batch(batch, law, fit_R_disk):
+    return [fit_galaxy(inputs, law, fit_R_disk) for inputs in batch]
+
+
+# =============================================================================
+# ALL GALAXIES
+# =============================================================================
+
+
+def _load_cache(use_cache):
+    if use_cache and FIT_CACHE.exists():
+        try:
+            return json.loads(FIT_CACHE.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            pass
+    return {}
+
+
+def _save_cache(cache):
+    try:
+        FIT_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = FIT_CACHE.with_suffix(".tmp")
+        tmp.write_text(json.dumps(cache), encoding="utf-8")
+        os.replace(tmp, FIT_CACHE)
+    except OSError:
+        pass
+
+
+def fit_all(
+    store, law=DEFAULT_LAW, fit_R_disk=True, jobs=None, use_cache=True, M_L=None, R_disk0=None
+):
+    """
+    Fit every galaxy with a rotation curve.
+
+    Returns:
+        list of per-galaxy result dicts (store order, galaxies with curves only)
+    """
+    if M_L is None or R_disk0 is None:
+        M_L, R_disk0 = galaxy_parameters(store, upsilon_disk=1.0)
+    law = tuple(float(v) for v in law)
+    rows = store.with_curves()
+    inputs = [galaxy_inputs(store, i, M_L, R_disk0) for i in rows]
+    keys = [fit_key(g, law, fit_R_disk) for g in inputs]
+
+    cache = _load_cache(use_cache)
+    todo = [j for j, key in enumerate(keys) if key not in cache]
+
+    if todo:
+        jobs = jobs or os.cpu_count() or 1
+        batches = [todo[k::jobs] for k in range(jobs) if todo[k::jobs]]
+        if len(batches) > 1:
+            with ProcessPoolExecutor(max_workers=len(batches)) as pool:
+                futures = [
+                    (batch, pool.submit(_fit_batch, [inputs[j] for j in batch], law, fit_R_disk))
+                    for batch in batches
+                ]
+                for batch, future in futures:
+                    for j, result in zip(batch, future.result()):
+                        cache[keys[j]] = result
+        else:
+            for j, result in zip(todo, _fit_batch([inputs[j] for j in todo], law, fit_R_disk)):
+                cache[keys[j]] = result
+        if use_cache:
+            _save_cache(cache)
+
+    return [cache[key] for key in keys]
+
+
+def fit_law(store, fits, law=DEFAULT_LAW, fit_R_disk=True, M_L=None, R_disk0=None):
+    """
+    Joint fit of the law (ratio_0, gamma) and every galaxy's parameters.
+
+    Starts from the per-galaxy fits; the Jacobian is sparse (each point
+    depends on its own galaxy's columns plus the two law columns).
+    rho_0 is only the pivot density: the law depends on ratio_0 × rho_0^gamma,
+    so rho_0 stays at its given value.
+    """
+    from scipy.optimize import least_squares
+    from scipy.sparse import csr_matrix
+
+    if M_L is None or R_disk0 is None:
+        M_L, R_disk0 = galaxy_parameters(store, upsilon_disk=1.0)
+    rows = store.with_curves()
+    ok = np.array([f["success"] for f in fits], dtype=bool)
+    rows = rows[ok]
+    fits = [f for f, good in zip(fits, ok) if good]
+    n_gal = len(rows)
+    k = 2 if fit_R_disk else 1
+
+    counts = store.index["count"][rows]
+    offsets = np.concatenate([[0], np.cumsum(counts)])
+    take = np.concatenate([np.arange(store.offsets[i], store.offsets[i + 1]) for i in rows])
+    curves = {key: np.nan_to_num(v[take]) for key, v in store.curves.items()}
+    V_err = np.maximum(curves["V_err"], MIN_V_ERR)
+
+    # Sparsity pattern: point -> its galaxy's k columns, then the 2 law columns
+    n_points = len(take)
+    galaxy = np.repeat(np.arange(n_gal), counts)
+    own = galaxy[:, None] * k + np.arange(k)
+    shared = np.broadcast_to(n_gal * k + np.arange(2), (n_points, 2))
+    cols = np.concatenate([own, shared], axis=1)
+    indptr = np.arange(n_points + 1) * (k + 2)
+
+    def unpack(p):
+        upsilon = np.exp(p[0 : n_gal * k : k])
+        R_disk = np.exp(p[1 : n_gal * k : k]) if fit_R_disk else R_disk0[rows]
+        return upsilon, R_disk, (np.exp(p[-2]), p[-1], law[2])
+
+    def model(p):
+        upsilon, R_disk, p_law = unpack(p)
+        return fit_model(
+            curves["R"], M_L[rows], R_disk, upsilon, curves["V_gas"], curves["V_disk"],
+            curves["V_bulge"], offsets=offsets, upsilon_bulge=UPSILON_BULGE, law=p_law,
+            jacobian=True,
+        )
+
+    def jacobian(p):
+        J = model(p)[1][:, list(range(k)) + [2, 3]] / V_err[:, None]
+        return csr_matrix((J.ravel(), cols.ravel(), indptr), shape=(n_points, n_gal * k + 2))
+
+    x0 = np.empty(n_gal * k + 2)
+    x0[0 : n_gal * k : k] = np.log([f["upsilon_disk"] for f in fits])
+    if fit_R_disk:
+        x0[1 : n_gal * k : k] = np.log([f["R_disk"] for f in fits])
+    x0[-2:] = np.log(law[0]), law[1]
+
+    per_galaxy_lo = [np.log(UPSILON_BOUNDS[0]), np.log(R_DISK_BOUNDS[0])][:k]
+    per_galaxy_hi = [np.log(UPSILON_BOUNDS[1]), np.log(R_DISK_BOUNDS[1])][:k]
+    lower = np.concatenate([np.tile(per_galaxy_lo, n_gal), [np.log(0.01), 0.0]])
+    upper = np.concatenate([np.tile(per_galaxy_hi, n_gal), [np.log(1e4), 2.0]])
+
+    sol = least_squares(
+        lambda p: (model(p)[0] - curves["V_obs"]) / V_err,
+        np.clip(x0, lower, upper),
+        jac=jacobian,
+        bounds=(lower, upper),
+        method="trf",
+        tr_solver="lsmr",
+        x_scale="jac",
+    )
+    return unpack(sol.x)[2]
+
+
+def fit_sparc(store, fit_global_law=False, fit_R_disk=True, jobs=None, use_cache=True):
+    """
+    Full pipeline: per-galaxy fits, optionally followed by the joint law fit
+    and a per-galaxy refit under the fitted law.
+
+    Returns:
+        (law, fits)
+    """
+    M_L, R_disk0 = galaxy_parameters(store, upsilon_disk=1.0)
+    law = DEFAULT_LAW
+    fits = fit_all(store, law, fit_R_disk, jobs, use_cache, M_L, R_disk0)
+    if fit_global_law:
+        law = fit_law(store, fits, law, fit_R_disk, M_L, R_disk0)
+        fits = fit_all(store, law, fit_R_disk, jobs, use_cache, M_L, R_disk0)
+    return law, fits
+
+
+def run_fits(argv=None):
+    parser = argparse.ArgumentParser(description="Fit SPARC rotation curves with the UET model")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPUs)")
+    parser.add_argument("--fit-law", action="store_true", help="also fit the Unity Density Law")
+    parser.add_argument("--fixed-rdisk", action="store_true", help="keep catalog R_disk")
+    parser.add_argument("--no-cache", action="store_true", help="ignore cached fits")
+    parser.add_argument("--data-dir", type=Path, default=None, help="SPARC data directory")
+    args = parser.parse_args(argv)
+
+    print("=" * 70)
+    print("🔧 SPARC PER-GALAXY FITS")
+    print("=" * 70)
+
+    store = load_sparc(args.data_dir) if args.data_dir else load_sparc()
+    print(f"Galaxies with curves: {len(store.with_curves())}, points: {store.n_points}")
+
+    t0 = time.perf_counter()
+    law, fits = fit_sparc(
+        store,
+        fit_global_law=args.fit_law,
+        fit_R_disk=not args.fixed_rdisk,
+        jobs=args.jobs,
+        use_cache=not args.no_cache,
+    )
+    elapsed = time.perf_counter() - t0
+
+    print(f"\n{'Galaxy':<12} {'N':>4} {'Υ_disk':>8} {'R_disk':>8} {'χ²_red':>9}")
+    print("-" * 45)
+    for f in fits:
+        print(
+            f"{f['name']:<12} {f['n']:>4} {f['upsilon_disk']:>8.3f} "
+            f"{f['R_disk']:>8.2f} {f['chi2_red']:>9.2f}"
+        )
+
+    # Compare with the unfitted SPARC-standard Υ on the same points
+    M_L, R_disk0 = galaxy_parameters(store, upsilon_disk=1.0)
+    rows = store.with_curves()
+    chi2_red = np.array([f["chi2_red"] for f in fits])
+    curves = {k: np.nan_to_num(v) for k, v in store.curves.items()}
+    v_std = fit_model(
+        curves["R"], M_L, R_disk0, UPSILON_DISK, curves["V_gas"], curves["V_disk"],
+        curves["V_bulge"], offsets=store.offsets, law=DEFAULT_LAW,
+    )
+    V_err = np.maximum(curves["V_err"], MIN_V_ERR)
+    std = curve_statistics(v_std, curves["V_obs"], V_err, store.offsets)
+
+    print("-" * 45)
+    print(f"Law: ratio_0={law[0]:.3f}, gamma={law[1]:.3f}, rho_0={law[2]:.3e}")
+    print(
+        f"Median χ²_red: fitted {np.nanmedian(chi2_red):.2f} "
+        f"vs Υ=0.5 {np.nanmedian(std['chi2_red'][rows]):.2f}"
+    )
+    print(f"Fitted {len(fits)} galaxies in {elapsed:.2f}s")
+    return law, fits
+
+
+if __name__ == "__main__":
+    run_fits()
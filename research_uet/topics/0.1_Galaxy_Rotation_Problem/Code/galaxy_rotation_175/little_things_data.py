@@ -10,10 +10,18 @@ The LITTLE THINGS survey provides VLA HI observations of 41 dwarf irregular
 galaxies with 6" angular resolution and 2.6 km/s spectral resolution.
 
 Rotation curve data extracted from published tables.
+
+Besides the JSON-style dict, the catalog is exposed as a structured array
+(one row per galaxy) with precomputed per-type row masks:
+
+    from little_things_data import GALAXY_TABLE, TYPE_MASKS
+    bcd = GALAXY_TABLE[TYPE_MASKS["BCD"]]
 """
 
 import json
 import os
+from functools import lru_cache
+
 import numpy as np
 
 # LITTLE THINGS dwarf galaxy data
@@ -266,6 +274,39 @@ LITTLE_THINGS_GALAXIES = {
 }
 
 
+# =============================================================================
+# COLUMNAR VIEW
+# =============================================================================
+
+GALAXY_DTYPE = np.dtype(
+    [
+        ("name", "U16"),
+        ("D_Mpc", "f8"),
+        ("M_star", "f8"),
+        ("R_d", "f8"),
+        ("V_last", "f8"),
+        ("R_last", "f8"),
+        ("type", "U8"),
+    ]
+)
+
+
+def as_table(galaxies):
+    """Convert a list of galaxy dicts into a GALAXY_DTYPE structured array."""
+    rows = [tuple(g[field] for field in GALAXY_DTYPE.names) for g in galaxies]
+    return np.array(rows, dtype=GALAXY_DTYPE)
+
+
+def type_masks(table):
+    """Boolean row mask for every galaxy type in the table (sorted by type)."""
+    return {t: table["type"] == t for t in np.unique(table["type"])}
+
+
+GALAXY_TABLE = as_table(LITTLE_THINGS_GALAXIES["galaxies"])
+GALAXY_TABLE.flags.writeable = False
+TYPE_MASKS = type_masks(GALAXY_TABLE)
+
+
 def save_data():
     """Save LITTLE THINGS data to JSON."""
     data_dir = os.path.join(os.path.dirname(__file__), "little_things")
@@ -291,36 +332,41 @@ def load_data():
         return json.load(f)
 
 
+@lru_cache(maxsize=None)
+def load_table():
+    """Load the saved catalog once as a read-only structured array."""
+    table = as_table(load_data()["galaxies"])
+    table.flags.writeable = False
+    return table
+
+
 def get_summary():
     """Print summary of LITTLE THINGS data."""
     data = load_data()
-    galaxies = data["galaxies"]
+    table = load_table()
 
     print("=" * 60)
     print("📊 LITTLE THINGS DWARF GALAXY DATA")
     print("=" * 60)
     print(f"Source: {data['source']}")
-    print(f"Total galaxies: {len(galaxies)}")
+    print(f"Total galaxies: {len(table)}")
     print()
 
     # Count by type
-    types = {}
-    for g in galaxies:
-        t = g["type"]
-        types[t] = types.get(t, 0) + 1
+    counts = {t: int(mask.sum()) for t, mask in type_masks(table).items()}
 
     print("By type:")
-    for t, n in sorted(types.items(), key=lambda x: -x[1]):
+    for t, n in sorted(counts.items(), key=lambda x: -x[1]):
         print(f"  {t}: {n}")
 
     # Mass range
-    masses = [g["M_star"] for g in galaxies]
+    masses = table["M_star"]
     print()
-    print(f"Stellar mass range: {min(masses):.1e} - {max(masses):.1e} M☉")
+    print(f"Stellar mass range: {masses.min():.1e} - {masses.max():.1e} M☉")
 
     # Velocity range
-    vels = [g["V_last"] for g in galaxies]
-    print(f"Rotation velocity range: {min(vels)} - {max(vels)} km/s")
+    vels = table["V_last"]
+    print(f"Rotation velocity range: {vels.min():g} - {vels.max():g} km/s")
 
     return data
 
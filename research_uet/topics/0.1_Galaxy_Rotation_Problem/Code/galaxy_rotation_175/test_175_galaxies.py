@@ -7,7 +7,8 @@ Data source: http://astroweb.cwru.edu/SPARC/
 Uses UET V3.0 Master Equation:
     Ω = V(C) + κ|∇C|² + βCI + Game Theory (strategic_boost)
 
-Imports from: core/uet_master_equation.py
+Imports from: core/uet_galaxy_model.py (shared galaxy model),
+Data/galaxy_rotation_175/sparc_sample.py (galaxy table)
 """
 
 import numpy as np
@@ -26,250 +27,15 @@ REPO_ROOT = RESEARCH_UET.parent  # Lab_uet_harness...
 # Insert REPO_ROOT so "import research_uet.core" works
 sys.path.insert(0, str(REPO_ROOT))
 
-# Also fallback for core if needed
-if (RESEARCH_UET / "core").exists():
-    sys.path.insert(0, str(RESEARCH_UET / "core"))
-
-# Import from UET V3.0 Master Equation
-try:
-    from research_uet.core.uet_master_equation import (
-        SIGMA_CRIT,
-        strategic_boost,
-        UETParameters,
-        calculate_halo_ratio,
-    )
-except ImportError:
-    # Local fallback
-    try:
-        from uet_master_equation import (
-            SIGMA_CRIT,
-            strategic_boost,
-            UETParameters,
-            calculate_halo_ratio,
-        )
-    except ImportError as e:
-        print(f"❌ Core Import Failed: {e}")
-        print(f"   Sys Path: {sys.path}")
-        sys.exit(1)
-# Extended SPARC galaxy data (175 galaxies - representative sample)
+# Shared UET galaxy model (core/uet_galaxy_model.py)
+from research_uet.core.uet_galaxy_model import rotation_velocity  # noqa: E402
+
+# Shared SPARC sample (Data/galaxy_rotation_175/sparc_sample.py), one row per galaxy
 # Format: name, R_kpc, v_obs, M_disk_Msun, R_disk_kpc, type
-SPARC_GALAXIES = [
-    # ===== LARGE SPIRALS (M_disk > 5e10) =====
-    ("NGC2841", 40, 300, 1e11, 8, "spiral"),
-    ("NGC5055", 35, 200, 5e10, 6, "spiral"),
-    ("NGC7331", 25, 240, 4e10, 5, "spiral"),
-    ("NGC891", 25, 225, 4e10, 5, "spiral"),
-    ("NGC4565", 35, 255, 8e10, 7, "spiral"),
-    ("UGC2885", 60, 300, 1.5e11, 10, "spiral"),
-    ("NGC4157", 30, 220, 3e10, 5, "spiral"),
-    ("NGC4217", 25, 200, 2.5e10, 4, "spiral"),
-    ("NGC4013", 28, 210, 3e10, 4.5, "spiral"),
-    ("NGC4088", 22, 180, 2e10, 4, "spiral"),
-    ("NGC4100", 18, 170, 1.8e10, 3.5, "spiral"),
-    ("NGC4138", 15, 165, 1.5e10, 3, "spiral"),
-    ("NGC4183", 18, 115, 8e9, 4, "spiral"),
-    ("NGC4559", 25, 120, 1e10, 5, "spiral"),
-    ("NGC4631", 18, 140, 1.5e10, 4, "spiral"),
-    # ===== MEDIUM SPIRALS (1e10 < M_disk < 5e10) =====
-    ("NGC3198", 30, 150, 2e10, 5, "spiral"),
-    ("NGC2403", 18, 130, 1e10, 4, "spiral"),
-    ("NGC6503", 20, 115, 8e9, 3.5, "spiral"),
-    ("NGC925", 18, 110, 7e9, 4, "spiral"),
-    ("NGC6946", 15, 170, 2e10, 4, "spiral"),
-    ("NGC4826", 12, 150, 1.5e10, 3, "spiral"),
-    ("NGC5371", 25, 210, 3e10, 5, "spiral"),
-    ("NGC3521", 22, 215, 2.5e10, 4.5, "spiral"),
-    ("NGC3627", 18, 180, 1.8e10, 3.5, "spiral"),
-    ("NGC3628", 20, 175, 1.5e10, 4, "spiral"),
-    ("NGC4258", 28, 210, 2e10, 5, "spiral"),
-    ("NGC4725", 22, 200, 2.5e10, 4, "spiral"),
-    ("NGC5033", 30, 200, 2.5e10, 5, "spiral"),
-    ("NGC5907", 35, 230, 3e10, 6, "spiral"),
-    ("NGC660", 18, 140, 1.2e10, 3.5, "spiral"),
-    # ===== LSB (Low Surface Brightness) =====
-    ("UGC128", 15, 130, 5e9, 3, "lsb"),
-    ("NGC300", 12, 80, 3e9, 3, "lsb"),
-    ("NGC55", 15, 85, 4e9, 3, "lsb"),
-    ("NGC247", 14, 100, 5e9, 3, "lsb"),
-    ("NGC7793", 10, 100, 4e9, 2.5, "lsb"),
-    ("NGC3109", 10, 65, 2e9, 3, "lsb"),
-    ("UGC1281", 8, 55, 1e9, 2.5, "lsb"),
-    ("UGC1501", 12, 70, 2e9, 3, "lsb"),
-    ("UGC4325", 10, 90, 3e9, 2.5, "lsb"),
-    ("UGC5005", 15, 85, 2.5e9, 3.5, "lsb"),
-    ("UGC5750", 10, 75, 1.5e9, 2.5, "lsb"),
-    ("UGC6917", 12, 95, 3e9, 3, "lsb"),
-    ("UGC7089", 8, 60, 1.2e9, 2, "lsb"),
-    ("UGC7232", 10, 70, 1.8e9, 2.5, "lsb"),
-    ("UGC7323", 12, 85, 2.5e9, 3, "lsb"),
-    ("UGC7559", 8, 50, 8e8, 2, "lsb"),
-    ("UGC7603", 10, 75, 1.5e9, 2.5, "lsb"),
-    ("UGC7690", 6, 45, 5e8, 1.5, "lsb"),
-    ("UGC8286", 10, 80, 2e9, 2.5, "lsb"),
-    ("UGC8550", 8, 55, 1e9, 2, "lsb"),
-    ("F568-1", 12, 110, 4e9, 3, "lsb"),
-    ("F568-3", 15, 100, 3e9, 3.5, "lsb"),
-    ("F568-V1", 10, 80, 2e9, 2.5, "lsb"),
-    ("F571-8", 12, 90, 2.5e9, 3, "lsb"),
-    ("F574-1", 18, 115, 5e9, 4, "lsb"),
-    ("F583-1", 10, 85, 2e9, 2.5, "lsb"),
-    ("F583-4", 8, 60, 1e9, 2, "lsb"),
-    # ===== DWARFS =====
-    ("IC2574", 12, 65, 8e8, 3, "dwarf"),
-    ("WLM", 2, 30, 5e7, 1, "dwarf"),
-    ("DDO170", 6, 55, 2e8, 1.5, "dwarf"),
-    ("DDO50", 5, 40, 1.5e8, 1.5, "dwarf"),
-    ("DDO52", 4, 35, 1e8, 1.2, "dwarf"),
-    ("DDO53", 3, 30, 8e7, 1, "dwarf"),
-    ("DDO64", 6, 50, 2.5e8, 1.8, "dwarf"),
-    ("DDO87", 5, 45, 1.8e8, 1.5, "dwarf"),
-    ("DDO101", 4, 38, 1.2e8, 1.3, "dwarf"),
-    ("DDO126", 5, 42, 1.5e8, 1.4, "dwarf"),
-    ("DDO133", 4, 35, 1e8, 1.2, "dwarf"),
-    ("Haro36", 3, 32, 9e7, 1, "dwarf"),
-    ("NGC1569", 3, 40, 1.5e8, 1, "dwarf"),
-    ("NGC2366", 6, 52, 3e8, 2, "dwarf"),
-    ("NGC4163", 2, 28, 4e7, 0.8, "dwarf"),
-    ("NGC4214", 8, 70, 5e8, 2.5, "dwarf"),
-    ("NGC4449", 6, 65, 4e8, 2, "dwarf"),
-    ("NGC5204", 5, 55, 3e8, 1.8, "dwarf"),
-    ("SagDIG", 1.5, 20, 2e7, 0.5, "dwarf"),
-    ("SextansA", 2, 25, 3e7, 0.8, "dwarf"),
-    ("UGC4305", 5, 48, 2e8, 1.5, "dwarf"),
-    ("UGC8508", 2, 28, 5e7, 0.8, "dwarf"),
-    # ===== ULTRA-FAINT DWARFS =====
-    ("DDO154", 8, 50, 2e8, 2, "ultrafaint"),
-    ("DDO168", 5, 45, 1e8, 1.5, "ultrafaint"),
-    ("DDO87", 4, 38, 8e7, 1.2, "ultrafaint"),
-    ("CVnIdwA", 2, 22, 2e7, 0.6, "ultrafaint"),
-    ("LeoA", 1, 15, 1e7, 0.4, "ultrafaint"),
-    ("LeoT", 0.5, 10, 5e6, 0.2, "ultrafaint"),
-    ("Tucana", 2, 18, 1.5e7, 0.5, "ultrafaint"),
-    ("UGC4459", 3, 30, 6e7, 1, "ultrafaint"),
-    ("UGCA281", 2, 25, 4e7, 0.7, "ultrafaint"),
-    ("UGCA442", 3, 32, 7e7, 1, "ultrafaint"),
-    ("AndII", 1, 12, 8e6, 0.3, "ultrafaint"),
-    ("AndVI", 0.8, 10, 5e6, 0.25, "ultrafaint"),
-    ("PegDIG", 1.5, 18, 1.2e7, 0.4, "ultrafaint"),
-    ("Phoenix", 0.5, 8, 3e6, 0.2, "ultrafaint"),
-    # ===== COMPACT =====
-    ("NGC4736", 10, 160, 2e10, 2, "compact"),
-    ("NGC3310", 8, 145, 1.5e10, 1.8, "compact"),
-    ("NGC4449", 6, 70, 5e8, 1.5, "compact"),
-    ("NGC1705", 3, 60, 3e8, 0.8, "compact"),
-    ("NGC2537", 4, 80, 5e8, 1, "compact"),
-    # ===== ADDITIONAL SPIRALS =====
-    ("NGC2976", 5, 80, 5e9, 2, "spiral"),
-    ("NGC3031", 25, 220, 5e10, 5, "spiral"),
-    ("NGC3034", 8, 130, 1e10, 2, "spiral"),
-    ("NGC4244", 18, 95, 5e9, 4, "spiral"),
-    ("NGC4395", 15, 80, 3e9, 4, "spiral"),
-    ("NGC4455", 6, 50, 8e8, 1.5, "spiral"),
-    ("NGC4605", 8, 90, 3e9, 2, "spiral"),
-    ("NGC5023", 12, 85, 2e9, 3, "spiral"),
-    ("NGC5474", 10, 70, 1.5e9, 2.5, "spiral"),
-    ("NGC5585", 12, 90, 3e9, 3, "spiral"),
-    ("NGC6689", 8, 85, 2e9, 2, "spiral"),
-    ("NGC6822", 5, 55, 8e8, 1.5, "spiral"),
-    ("NGC7640", 18, 110, 5e9, 4, "spiral"),
-    ("NGC7678", 15, 150, 1.5e10, 3.5, "spiral"),
-    ("NGC7814", 12, 180, 2e10, 3, "spiral"),
-    # ===== MORE LSB =====
-    ("UGC2259", 8, 65, 1.5e9, 2, "lsb"),
-    ("UGC2455", 10, 75, 2e9, 2.5, "lsb"),
-    ("UGC3137", 15, 100, 4e9, 3.5, "lsb"),
-    ("UGC3371", 10, 80, 2e9, 2.5, "lsb"),
-    ("UGC3851", 8, 60, 1e9, 2, "lsb"),
-    ("UGC4278", 12, 90, 3e9, 3, "lsb"),
-    ("UGC4499", 10, 80, 2e9, 2.5, "lsb"),
-    ("UGC5414", 8, 55, 1e9, 2, "lsb"),
-    ("UGC5721", 6, 45, 6e8, 1.5, "lsb"),
-    ("UGC5829", 10, 65, 1.5e9, 2.5, "lsb"),
-    ("UGC5918", 8, 55, 1e9, 2, "lsb"),
-    ("UGC6399", 12, 85, 2.5e9, 3, "lsb"),
-    ("UGC6446", 10, 75, 2e9, 2.5, "lsb"),
-    ("UGC6614", 18, 110, 5e9, 4, "lsb"),
-    ("UGC6667", 8, 55, 1e9, 2, "lsb"),
-    ("UGC6818", 10, 70, 1.5e9, 2.5, "lsb"),
-    ("UGC6923", 6, 50, 8e8, 1.5, "lsb"),
-    ("UGC6930", 12, 90, 3e9, 3, "lsb"),
-    ("UGC6973", 8, 65, 1.2e9, 2, "lsb"),
-    ("UGC6983", 10, 80, 2e9, 2.5, "lsb"),
-    ("UGC7125", 15, 95, 3e9, 3.5, "lsb"),
-    ("UGC7151", 8, 65, 1.2e9, 2, "lsb"),
-    ("UGC7261", 6, 50, 7e8, 1.5, "lsb"),
-    ("UGC7399", 12, 85, 2.5e9, 3, "lsb"),
-    ("UGC7524", 10, 75, 2e9, 2.5, "lsb"),
-    ("UGC7577", 5, 40, 5e8, 1.2, "lsb"),
-    ("UGC7608", 8, 60, 1e9, 2, "lsb"),
-    ("UGC7866", 6, 45, 6e8, 1.5, "lsb"),
-    ("UGC8490", 10, 80, 2e9, 2.5, "lsb"),
-    ("UGC9211", 6, 50, 8e8, 1.5, "lsb"),
-    ("UGC11454", 15, 95, 3e9, 3.5, "lsb"),
-    ("UGC11557", 8, 55, 1e9, 2, "lsb"),
-    ("UGC11583", 5, 40, 5e8, 1.2, "lsb"),
-    ("UGC11616", 10, 70, 1.5e9, 2.5, "lsb"),
-    ("UGC11648", 12, 85, 2.5e9, 3, "lsb"),
-    ("UGC11707", 8, 60, 1e9, 2, "lsb"),
-    ("UGC11820", 6, 50, 7e8, 1.5, "lsb"),
-    ("UGC11861", 15, 100, 4e9, 3.5, "lsb"),
-    ("UGC11914", 18, 120, 6e9, 4, "lsb"),
-    ("UGC12632", 10, 75, 2e9, 2.5, "lsb"),
-    ("UGC12732", 8, 55, 1e9, 2, "lsb"),
-]
-
-
-def uet_rotation_velocity(r_kpc, M_disk_Msun, R_disk_kpc, galaxy_type):
-    """
-    UET Rotation Velocity - Information Field Implementation
-    =========================================================
-
-    THEORETICAL BASIS:
-    In UET, "dark matter halo" is reinterpreted as the INFORMATION FIELD (I-field).
-    The I-field arises from the Holographic Bound and couples to baryonic density:
-
-        V² = V_baryon² + V_I²
-
-    where V_I is the I-field contribution (equivalent to NFW halo in standard CDM).
-
-    PARAMETER DERIVATION:
-    - Σ_crit = 1.37×10⁹ Msun/kpc² (from Holographic Bound: Λ = 3/R_H²)
-    - M_I/M_baryon ratio scales with density via Information thermodynamics
-    - β_U provides additional boost for high-conflict systems (Compact)
-
-    Reference: UET_GAME_THEORY.md §III, PHASE_CII_RMG.md, PHASE_CVII_MLK.md
-    """
-    G = 4.302e-6  # (km/s)² kpc / M_sun
-
-    # === Σ_crit: FROM UET V3.0 MASTER EQUATION ===
-    # SIGMA_CRIT imported from core/uet_master_equation.py
-    sigma_bar = M_disk_Msun / (np.pi * R_disk_kpc**2 + 1e-10)
-
-    # === I-FIELD RATIO (UET V3.1 Centralized Logic) ===
-    # Calculates: Base Power Law * Gentle Screening * (1 + Saturated Boost)
-    # Handles both Normal (Spiral/Dwarf) and Saturated (Compact) regimes correctly.
-
-    vol = (4 / 3) * np.pi * R_disk_kpc**3
-    rho = M_disk_Msun / (vol + 1e-10)
-    sigma_bar = M_disk_Msun / (np.pi * R_disk_kpc**2 + 1e-10)
-
-    M_I_ratio = calculate_halo_ratio(rho=rho, sigma_bar=sigma_bar, r_kpc=R_disk_kpc)
-
-    # === BARYONIC CONTRIBUTION ===
-    M_bulge = 0.1 * M_disk_Msun
-    x = r_kpc / R_disk_kpc
-    M_disk_enc = M_disk_Msun * (1 - (1 + x) * np.exp(-x))
-
-    # === I-FIELD (NFW Profile) ===
-    M_I = M_I_ratio * M_disk_Msun
-    c = np.clip(10.0 * (M_I / 1e12) ** (-0.1), 5, 20)
-    R_I = 10 * R_disk_kpc
-    x_h = r_kpc / (R_I / c)
-    M_I_enc = M_I * (np.log(1 + x_h) - x_h / (1 + x_h)) / (np.log(1 + c) - c / (1 + c))
-
-    # === TOTAL VELOCITY ===
-    M_total = M_bulge + M_disk_enc + M_I_enc
-    return np.sqrt(G * M_total / (r_kpc + 0.1))
+sys.path.insert(0, str(TOPIC_DIR / "Data" / "galaxy_rotation_175"))
+from sparc_sample import SPARC_SAMPLE  # noqa: E402
+
+SPARC_GALAXIES = SPARC_SAMPLE
 
 
 def run_test():
@@ -290,13 +56,15 @@ def run_test():
         print(f"  {t}: {n}")
     print()
 
-    results = []
-    for name, R, v_obs, M_disk, R_disk, gtype in SPARC_GALAXIES:
-        v_uet = uet_rotation_velocity(R, M_disk, R_disk, gtype)
-        error = abs(v_uet - v_obs) / v_obs * 100
-        results.append(
-            {"name": name, "v_obs": v_obs, "v_uet": v_uet, "error": error, "type": gtype}
-        )
+    # One vectorized model evaluation for every galaxy
+    names, R, v_obs, M_disk, R_disk, gtypes = zip(*SPARC_GALAXIES)
+    v_uet = rotation_velocity(np.array(R), np.array(M_disk), np.array(R_disk))
+    errors = np.abs(v_uet - np.array(v_obs)) / np.array(v_obs) * 100
+
+    results = [
+        {"name": n, "v_obs": vo, "v_uet": vu, "error": e, "type": t}
+        for n, vo, vu, e, t in zip(names, v_obs, v_uet, errors, gtypes)
+    ]
 
     results.sort(key=lambda x: x["error"])
 
@@ -386,8 +154,8 @@ def run_test():
             yaxis_title="Average Error (%)",
             template="plotly_white",
         )
-        uet_viz.save_plot(fig, "galaxy_errors_by_type.png", result_dir)
-        print("  [Viz] Generated 'galaxy_errors_by_type.png'")
+        if uet_viz.save_plot(fig, "galaxy_errors_by_type.png", result_dir):
+            print("  [Viz] Generated 'galaxy_errors_by_type.png'")
 
         # --- Plot 2: Parity Plot (Obs vs UET) ---
         obs_vals = [r["v_obs"] for r in results]
@@ -418,8 +186,8 @@ def run_test():
             xaxis_title="Observed V (km/s)",
             yaxis_title="Predicted V (km/s)",
         )
-        uet_viz.save_plot(fig2, "galaxy_parity_plot.png", result_dir)
-        print("  [Viz] Generated 'galaxy_parity_plot.png'")
+        if uet_viz.save_plot(fig2, "galaxy_parity_plot.png", result_dir):
+            print("  [Viz] Generated 'galaxy_parity_plot.png'")
 
         # --- Plot 3: Detailed Curves for Representatives ---
         # Select one good example of each type
@@ -439,10 +207,8 @@ def run_test():
 
             # Generate Simulation Curve (0 to 3*R_eff)
             radii = np.linspace(0.1, R_eff * 3.5, 60)
-            v_uet_curve = []
-
-            for rr in radii:
-                v_uet_curve.append(uet_rotation_velocity(rr, M, R_d, gtype))
+            curve = rotation_velocity(radii, M, R_d, components=True)
+            v_uet_curve = curve["V_total"]
 
             fig3 = uet_viz.go.Figure()
             fig3.add_trace(
@@ -468,16 +234,8 @@ def run_test():
 
             # === NEW: Einstein/Newtonian Trace (Baryon Only) ===
             # What happens if we only use Static Mass (E=mc^2)?
-            v_newton_curve = []
-            for rr in radii:
-                # Calculate Baryon Only V = sqrt(G * M_baryon / r)
-                # Re-using logic from uet_rotation_velocity but stripping I-field
-                x = rr / R_d
-                M_disk_enc = M * (1 - (1 + x) * np.exp(-x))
-                M_bulge = 0.1 * M
-                M_total_bar = M_disk_enc + M_bulge
-                v_newton = np.sqrt(4.302e-6 * M_total_bar / (rr + 0.1))
-                v_newton_curve.append(v_newton)
+            # Baryon-only component of the same model (I-field stripped)
+            v_newton_curve = curve["V_bar"]
 
             fig3.add_trace(
                 uet_viz.go.Scatter(
@@ -495,8 +253,8 @@ def run_test():
                 yaxis_title="Velocity (km/s)",
             )
             safe_name = name.replace(" ", "_")
-            uet_viz.save_plot(fig3, f"galaxy_curve_{safe_name}.png", result_dir)
-            print(f"  [Viz] Generated 'galaxy_curve_{safe_name}.png'")
+            if uet_viz.save_plot(fig3, f"galaxy_curve_{safe_name}.png", result_dir):
+                print(f"  [Viz] Generated 'galaxy_curve_{safe_name}.png'")
 
     except Exception as e:
         print(f"Viz Error: {e}")
@@ -7,7 +7,7 @@ Hypothesis:
 At high baryon density (Compact Galaxies), the Information Field (Dark Matter)
 interaction saturates, deviating from the power-law scaling rho^-0.48.
 
-Data (Subset from test_175_galaxies.py):
+Data (compact galaxies of the shared SPARC sample):
 - NGC4736
 - NGC3310
 - NGC4449
@@ -20,118 +20,39 @@ import sys
 from pathlib import Path
 
 # Setup paths
-_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(_root))  # research_uet
+_root = Path(__file__).resolve().parents[5]  # project root (contains research_uet)
+sys.path.insert(0, str(_root))
 
-# Import core UET functions
-try:
-    from core.uet_master_equation import SIGMA_CRIT, strategic_boost
-except ImportError:
-    # Manual mock if import fails (standalone mode)
-    def strategic_boost(sigma, scale):
-        return 0.5
-
-    SIGMA_CRIT = 1.37e9
+# Shared UET galaxy model: both variants below are GalaxyModel settings
+from research_uet.core.uet_galaxy_model import (  # noqa: E402
+    COMPACT_BOOSTED_MODEL,
+    COMPACT_SCREENED_MODEL,
+    rotation_velocity,
+)
 
 # Compact Galaxy Data (Name, R_kpc, V_obs, M_disk, R_disk)
-# Source: SPARC via test_175_galaxies.py
-COMPACT_GALAXIES = [
-    ("NGC4736", 10, 160, 2e10, 2),
-    ("NGC3310", 8, 145, 1.5e10, 1.8),
-    ("NGC4449", 6, 70, 5e8, 1.5),
-    ("NGC1705", 3, 60, 3e8, 0.8),
-    ("NGC2537", 4, 80, 5e8, 1),
-]
-
-
-def uet_velocity_original(r_kpc, M_disk_Msun, R_disk_kpc):
-    """Original V3.0 Logic with 'Strategic Boost'"""
-    G = 4.302e-6
-
-    # 1. Density
-    vol = (4 / 3) * np.pi * R_disk_kpc**3
-    rho = M_disk_Msun / (vol + 1e-10)
-
-    # 2. I-Field Ratio (Power Law)
-    RHO_PIVOT = 5e7
-    RATIO_BASE = 8.5
-    GAMMA = 0.48
-    M_I_ratio = RATIO_BASE * (rho / RHO_PIVOT) ** (-GAMMA)
+# Source: the compact rows of the shared SPARC sample (Data/galaxy_rotation_175/sparc_sample.py)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "Data" / "galaxy_rotation_175"))
+from sparc_sample import galaxies  # noqa: E402
 
-    # 3. Strategic Boost (Original Fix Attempt)
-    sigma_bar = M_disk_Msun / (np.pi * R_disk_kpc**2)
-    beta_U = strategic_boost(sigma_bar, scale=R_disk_kpc)
-    M_I_ratio = M_I_ratio * (1 + beta_U)
-    M_I_ratio = max(0.1, min(M_I_ratio, 500.0))
+COMPACT_GALAXIES = [row[:5] for row in galaxies(types=("compact",))]
 
-    # 4. Integrate
-    M_bulge = 0.1 * M_disk_Msun
-    x = r_kpc / R_disk_kpc
-    M_disk_enc = M_disk_Msun * (1 - (1 + x) * np.exp(-x))
 
-    M_I = M_I_ratio * M_disk_Msun
-    # Simple encapsulation for I-field (NFW-like behavior integrated)
-    # Using simple ratio scaling for diagnostics
-    M_I_enc = M_I * (M_disk_enc / M_disk_Msun) * 1.2  # Approx profile match
-
-    M_total = M_bulge + M_disk_enc + M_I_enc
-    return np.sqrt(G * M_total / r_kpc)
+def uet_velocity_original(r_kpc, M_disk_Msun, R_disk_kpc):
+    """Original V3.0 Logic with 'Strategic Boost' (ratio × 1.5, kept in [0.1, 500])"""
+    return rotation_velocity(
+        r_kpc, M_disk_Msun, R_disk_kpc, boost=True, model=COMPACT_BOOSTED_MODEL
+    )
 
 
 def uet_velocity_saturated(r_kpc, M_disk_Msun, R_disk_kpc):
     """
     V3.1 Logic with 'Density Saturation'.
-    Replaces 'Strategic Boost' with Tanh Saturation.
+    Replaces 'Strategic Boost' with Gentle Screening of the highest densities:
+    ratio × 1/(1 + (rho/1.5e9)²), floored at 0.05.
+    (Calculated optimal rho_crit ~ 1.5e9 to get factor 0.86 for NGC4736.)
     """
-    G = 4.302e-6
-
-    # 1. Density
-    vol = (4 / 3) * np.pi * R_disk_kpc**3
-    rho = M_disk_Msun / (vol + 1e-10)
-
-    # 2. I-Field Ratio (Power Law) with SATURATION
-    RHO_PIVOT = 5e7
-    RATIO_BASE = 8.5
-    GAMMA = 0.48
-
-    # ORIGINAL: M_I_ratio = RATIO_BASE * (rho / RHO_PIVOT) ** (-GAMMA)
-
-    # NEW: Saturation Term (prevents ratio from dropping too fast or spiking)
-    # Effect: If rho is very high, Information Coupling saturates.
-    # Instead of dropping to 0.01, it hits a floor or follows a softer curve.
-
-    # Let's try Soft Tanh Cutoff for the density scaling
-    rho_eff = RHO_PIVOT * np.tanh(rho / RHO_PIVOT) + 1e-10
-    # No, we want the Ratio to saturate.
-
-    ratio_raw = RATIO_BASE * (rho / RHO_PIVOT) ** (-GAMMA)
-
-    # Hypothesis: For Compact Galaxies (High Rho), Ratio is suppressed too much by power law.
-    # Reality: Compact galaxies still have DM halos.
-    # Fix: Add a 'Floor' or 'Saturation' to the ratio.
-
-    # NEW: Gentle Screening [Hypothesis 3]
-    # Diagnosis: Base UET overshoots High Mass Compacts (NGC4736) but is okay/low for Low Mass.
-    # We need to screen ONLY the very highest densities (rho > 6e8).
-    # Calculated optimal rho_crit ~ 1.5e9 to get factor 0.86 for NGC4736.
-
-    rho_crit = 1.5e9
-    screening = 1.0 / (1.0 + (rho / rho_crit) ** 2.0)
-
-    ratio_saturated = ratio_raw * screening
-
-    M_I_ratio = max(0.05, ratio_saturated)
-
-    # 4. Integrate
-    M_bulge = 0.1 * M_disk_Msun
-    x = r_kpc / R_disk_kpc
-    M_disk_enc = M_disk_Msun * (1 - (1 + x) * np.exp(-x))
-
-    M_I = M_I_ratio * M_disk_Msun
-    M_I_enc = M_I * (M_disk_enc / M_disk_Msun) * 1.2
-
-    M_total = M_bulge + M_disk_enc + M_I_enc
-    return np.sqrt(G * M_total / r_kpc)
+    return rotation_velocity(r_kpc, M_disk_Msun, R_disk_kpc, model=COMPACT_SCREENED_MODEL)
 
 
 def run_test():
@@ -141,15 +62,13 @@ def run_test():
     print(f"{'Name':<10} {'V_obs':<8} {'V_old':<8} {'V_new':<8} {'Err_New':<8} {'Status':<5}")
     print("-" * 70)
 
-    new_errors = []
-
-    for name, R, v_obs, M, R_d in COMPACT_GALAXIES:
-        v_old = uet_velocity_original(R, M, R_d)  # Old V3.0 (Boosted)
-        v_new = uet_velocity_saturated(R, M, R_d)  # Gentle Screening
-
-        err_new = abs(v_new - v_obs) / v_obs * 100
-        new_errors.append(err_new)
+    names, R, v_obs_all, M, R_d = (np.array(col) for col in zip(*COMPACT_GALAXIES))
+    v_old_all = uet_velocity_original(R, M, R_d)  # Old V3.0 (Boosted)
+    v_new_all = uet_velocity_saturated(R, M, R_d)  # Gentle Screening
+    new_errors = np.abs(v_new_all - v_obs_all) / v_obs_all * 100
 
+    rows = zip(names, v_obs_all, v_old_all, v_new_all, new_errors)
+    for name, v_obs, v_old, v_new, err_new in rows:
         status = "✅" if err_new < 15 else "❌"
 
         print(f"{name:<10} {v_obs:<8.1f} {v_old:<8.1f} {v_new:<8.1f} {err_new:<8.1f} {status}")
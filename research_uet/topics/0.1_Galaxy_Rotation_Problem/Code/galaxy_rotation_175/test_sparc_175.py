@@ -7,7 +7,7 @@ Data source: http://astroweb.cwru.edu/SPARC/
 Uses UET V3.0 Master Equation:
     Omega = V(C) + kappa|grad C|^2 + beta*C*I + Game Theory (strategic_boost)
 
-Imports from: core/uet_master_equation.py
+Imports from: core/uet_master_equation.py, core/uet_galaxy_model.py
 """
 
 import numpy as np
@@ -15,116 +15,43 @@ import sys
 from pathlib import Path
 
 # Add parent paths for imports
-ROOT = Path(__file__).parent.parent.parent.parent.parent  # topics -> research_uet -> project
+ROOT = Path(__file__).resolve().parents[5]  # Code -> topic -> topics -> research_uet -> project
 sys.path.insert(0, str(ROOT))
 
-# Import from UET V3.0 Master Equation
-try:
-    from research_uet.core.uet_master_equation import SIGMA_CRIT, strategic_boost, UETParameters
-    from research_uet.theory.utility.universal_constants import G, M_sun, kpc
-except ImportError:
-    # Fallback
-    sys.path.insert(0, str(ROOT / "research_uet"))
-    try:
-        from core.uet_master_equation import SIGMA_CRIT, strategic_boost, UETParameters
-        from theory.utility.universal_constants import G, M_sun, kpc
-    except ImportError:
-        # Last resort: define locally
-        SIGMA_CRIT = 1.37e9
-
-        def strategic_boost(sigma, scale=1.0):
-            return 0.1 * np.log(1 + sigma / SIGMA_CRIT)
-
-        G = 6.67430e-11
-        M_sun = 1.989e30
-        kpc = 3.086e19
-
-# SPARC Galaxy Sample (from lab/02_astrophysics/galaxies/test_175_galaxies.py)
+# Import from UET V3.0 Master Equation and the shared galaxy model
+from research_uet.core.uet_master_equation import SIGMA_CRIT  # noqa: E402
+from research_uet.core.uet_galaxy_model import SPARC_BOOSTED_MODEL, rotation_velocity  # noqa: E402
+from research_uet.core.uet_results import record  # noqa: E402
+
+# SPARC Galaxy Sample: rows from the shared table (Data/galaxy_rotation_175/sparc_sample.py);
+# this test groups the faint DDO154 / DDO168 with the dwarfs
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "Data" / "galaxy_rotation_175"))
+from sparc_sample import galaxies  # noqa: E402
+
+SAMPLE_BY_TYPE = {
+    "spiral": (
+        "NGC2841",
+        "NGC5055",
+        "NGC7331",
+        "NGC891",
+        "NGC4565",
+        "UGC2885",
+        "NGC3198",
+        "NGC2403",
+        "NGC6503",
+        "NGC925",
+    ),
+    "lsb": ("UGC128", "NGC300", "NGC55", "F568-1", "F574-1"),
+    "dwarf": ("IC2574", "WLM", "DDO154", "DDO168", "NGC1569"),
+    "compact": ("NGC4736", "NGC3310"),
+}
 SPARC_GALAXIES = [
-    # ===== LARGE SPIRALS =====
-    ("NGC2841", 40, 300, 1e11, 8, "spiral"),
-    ("NGC5055", 35, 200, 5e10, 6, "spiral"),
-    ("NGC7331", 25, 240, 4e10, 5, "spiral"),
-    ("NGC891", 25, 225, 4e10, 5, "spiral"),
-    ("NGC4565", 35, 255, 8e10, 7, "spiral"),
-    ("UGC2885", 60, 300, 1.5e11, 10, "spiral"),
-    ("NGC3198", 30, 150, 2e10, 5, "spiral"),
-    ("NGC2403", 18, 130, 1e10, 4, "spiral"),
-    ("NGC6503", 20, 115, 8e9, 3.5, "spiral"),
-    ("NGC925", 18, 110, 7e9, 4, "spiral"),
-    # ===== LSB =====
-    ("UGC128", 15, 130, 5e9, 3, "lsb"),
-    ("NGC300", 12, 80, 3e9, 3, "lsb"),
-    ("NGC55", 15, 85, 4e9, 3, "lsb"),
-    ("F568-1", 12, 110, 4e9, 3, "lsb"),
-    ("F574-1", 18, 115, 5e9, 4, "lsb"),
-    # ===== DWARFS =====
-    ("IC2574", 12, 65, 8e8, 3, "dwarf"),
-    ("WLM", 2, 30, 5e7, 1, "dwarf"),
-    ("DDO154", 8, 50, 2e8, 2, "dwarf"),
-    ("DDO168", 5, 45, 1e8, 1.5, "dwarf"),
-    ("NGC1569", 3, 40, 1.5e8, 1, "dwarf"),
-    # ===== COMPACT =====
-    ("NGC4736", 10, 160, 2e10, 2, "compact"),
-    ("NGC3310", 8, 145, 1.5e10, 1.8, "compact"),
+    (*row[:5], gtype)
+    for gtype, names in SAMPLE_BY_TYPE.items()
+    for row in galaxies(names=names)
 ]
 
 
-def uet_rotation_velocity(r_kpc, M_disk_Msun, R_disk_kpc, galaxy_type):
-    """
-    UET Rotation Velocity - Information Field Implementation
-    =========================================================
-
-    From UET V3.0: "dark matter" is reinterpreted as Information Field.
-    The I-field arises from Holographic Bound and couples to baryonic density.
-
-    V^2 = V_baryon^2 + V_I^2
-
-    Parameters derived from UET theory (NOT hardcoded):
-    - SIGMA_CRIT from core/uet_master_equation.py
-    - strategic_boost for compact galaxies
-    """
-    G_kpc = 4.302e-6  # (km/s)^2 kpc / M_sun
-
-    # === Surface density ===
-    sigma_bar = M_disk_Msun / (np.pi * R_disk_kpc**2 + 1e-10)
-
-    # === I-FIELD RATIO (from UET thermodynamics) ===
-    RHO_PIVOT = 5e7  # M_sun/kpc^3
-    vol = (4 / 3) * np.pi * R_disk_kpc**3
-    rho = M_disk_Msun / (vol + 1e-10)
-
-    # Base ratio and scaling from UET
-    RATIO_BASE = 8.5
-    GAMMA = 0.48
-    M_I_ratio = RATIO_BASE * (rho / RHO_PIVOT) ** (-GAMMA)
-
-    # === Strategic boost for compact galaxies ===
-    if galaxy_type == "compact":
-        beta_U = strategic_boost(sigma_bar, scale=R_disk_kpc)
-    else:
-        beta_U = 0.0
-
-    M_I_ratio = M_I_ratio * (1 + beta_U)
-    M_I_ratio = max(0.1, min(M_I_ratio, 500.0))
-
-    # === Baryonic contribution ===
-    M_bulge = 0.1 * M_disk_Msun
-    x = r_kpc / R_disk_kpc
-    M_disk_enc = M_disk_Msun * (1 - (1 + x) * np.exp(-x))
-
-    # === I-field (NFW profile) ===
-    M_I = M_I_ratio * M_disk_Msun
-    c = np.clip(10.0 * (M_I / 1e12) ** (-0.1), 5, 20)
-    R_I = 10 * R_disk_kpc
-    x_h = r_kpc / (R_I / c)
-    M_I_enc = M_I * (np.log(1 + x_h) - x_h / (1 + x_h)) / (np.log(1 + c) - c / (1 + c))
-
-    # === Total velocity ===
-    M_total = M_bulge + M_disk_enc + M_I_enc
-    return np.sqrt(G_kpc * M_total / (r_kpc + 0.1))
-
-
 def run_test():
     """Run galaxy rotation tests."""
     print("=" * 70)
@@ -138,9 +65,19 @@ def run_test():
     results = {"pass": 0, "warn": 0, "fail": 0}
     type_results = {}
 
-    for name, R, v_obs, M_disk, R_disk, gtype in SPARC_GALAXIES:
-        v_uet = uet_rotation_velocity(R, M_disk, R_disk, gtype)
-        error = abs(v_uet - v_obs) / v_obs * 100
+    # V3.0 variant: 0.1 ln(1 + Σ/Σ_crit) boost on compact galaxies, ratio kept in [0.1, 500]
+    names, R, v_obs_all, M_disk, R_disk, gtypes = zip(*SPARC_GALAXIES)
+    v_uet_all = rotation_velocity(
+        np.array(R),
+        np.array(M_disk),
+        np.array(R_disk),
+        boost=np.array(gtypes) == "compact",
+        model=SPARC_BOOSTED_MODEL,
+    )
+    errors = np.abs(v_uet_all - np.array(v_obs_all)) / np.array(v_obs_all) * 100
+
+    for name, gtype, error in zip(names, gtypes, errors):
+        record(name, error < 20, metric={"error_pct": error})
 
         if gtype not in type_results:
             type_results[gtype] = {"pass": 0, "total": 0, "errors": []}
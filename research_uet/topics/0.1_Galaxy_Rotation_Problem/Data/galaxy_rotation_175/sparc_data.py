@@ -0,0 +1,321 @@
+"""
+SPARC Rotation Curves - Columnar Galaxy Store
+==============================================
+Source: Lelli, McGaugh & Schombert 2016, AJ 152, 157
+URL: http://astroweb.cwru.edu/SPARC/
+
+Parses the SPARC catalog (SPARC_Lelli2016c.mrt, CDS fixed-width format)
+and every per-galaxy mass model (*_rotmod.dat) into one columnar store:
+
+    index   : one row per galaxy (name, D, Inc, Rdisk, Vflat, ..., offset, count)
+    curves  : all rotation-curve points concatenated (R, V_obs, V_err, ...)
+              galaxy i owns rows offsets[i]:offsets[i + 1]
+
+The store is cached as .npz on first parse and rebuilt automatically when
+any source file changes (size / mtime fingerprint), so tests load all
+curves in milliseconds:
+
+    from sparc_data import load_sparc
+    sparc = load_sparc()
+    ngc = sparc["NGC6503"]          # dict of arrays for one galaxy
+    R = sparc.curves["R"]           # every radius of every galaxy
+
+Run `python sparc_data.py --download` to fetch the full 175-galaxy release.
+"""
+
+import hashlib
+import os
+import re
+import sys
+from pathlib import Path
+
+import numpy as np
+
+DATA_DIR = Path(__file__).parent
+MRT_FILE = DATA_DIR / "SPARC_Lelli2016c.mrt"
+ROTMOD_PATTERN = "*_rotmod.dat"
+
+SPARC_URL = "http://astroweb.cwru.edu/SPARC/"
+SPARC_FILES = ("SPARC_Lelli2016c.mrt", "Rotmod_LTG.zip")
+
+_root = Path(__file__).parent
+while _root.name != "research_uet" and _root.parent != _root:
+    _root = _root.parent
+CACHE_DIR = Path(os.environ.get("UET_CACHE_DIR", _root.parent / ".cache"))
+STORE_VERSION = 1
+
+# Rotmod columns (Lelli 2016): the last two are absent in short files
+CURVE_COLUMNS = ("R", "V_obs", "V_err", "V_gas", "V_disk", "V_bulge", "SB_disk", "SB_bulge")
+
+# Index columns always present, even when the catalog is missing
+INDEX_DEFAULTS = ("D", "Inc")
+
+
+# =============================================================================
+# PARSERS
+# =============================================================================
+
+
+_BYTE_SPEC = re.compile(r"^\s*(\d+)(?:\s*-\s*(\d+))?\s+([AIFE])[\d.]*\s+\S+\s+(\S+)")
+
+
+def parse_mrt(path=MRT_FILE):
+    """
+    Parse a CDS/AAS machine-readable table using its byte-by-byte header.
+
+    Returns:
+        dict label -> array (A columns as str, I as int with -1 for blank,
+        F/E as float with NaN for blank). Empty dict if the file has no
+        byte-by-byte description or no data rows.
+    """
+    path = Path(path)
+    if not path.exists():
+        return {}
+    lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
+
+    specs = []
+    in_description = False
+    for line in lines:
+        if line.startswith("Byte-by-byte Description"):
+            in_description = True
+            continue
+        if in_description:
+            match = _BYTE_SPEC.match(line)
+            if match:
+                start, end, fmt, label = match.groups()
+                end = end or start
+                label = "name" if label == "Galaxy" else re.sub(r"[^0-9A-Za-z_]", "", label)
+                specs.append((label, int(start) - 1, int(end), fmt))
+            elif specs and line.startswith("---"):
+                in_description = False
+    if not specs:
+        return {}
+
+    # Data rows follow the last separator line
+    separators = [i for i, line in enumerate(lines) if line.startswith("---")]
+    rows = [line for line in lines[separators[-1] + 1 :] if line.strip()]
+    if not rows:
+        return {}
+
+    table = {}
+    for label, start, end, fmt in specs:
+        cells = [row[start:end].strip() for row in rows]
+        if fmt == "A":
+            table[label] = np.array(cells)
+        elif fmt == "I":
+            table[label] = np.array([int(c) if c else -1 for c in cells], dtype=np.int64)
+        else:
+            table[label] = np.array([float(c) if c else np.nan for c in cells])
+    return table
+
+
+_HEADER_VALUE = re.compile(r"#\s*(Distance|Inclination)\s*[:=]\s*([-+\d.eE]+)", re.IGNORECASE)
+
+
+def parse_rotmod(path):
+    """
+    Parse one *_rotmod.dat mass model.
+
+    Returns:
+        (header, data) where header has 'Distance'/'Inclination' if given
+        and data is an (n_points, 8) float array in CURVE_COLUMNS order
+        (missing surface-brightness columns are NaN).
+    """
+    header = {}
+    rows = []
+    with open(path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            stripped = line.strip()
+            if not stripped:
+                continue
+            if stripped.startswith("#"):
+                match = _HEADER_VALUE.match(stripped)
+                if match:
+                    header[match.group(1).capitalize()] = float(match.group(2))
+                continue
+            rows.append([float(v) for v in stripped.split()])
+
+    data = np.full((len(rows), len(CURVE_COLUMNS)), np.nan)
+    for i, row in enumerate(rows):
+        n = min(len(row), len(CURVE_COLUMNS))
+        data[i, :n] = row[:n]
+    return header, data
+
+
+# =============================================================================
+# STORE
+# =============================================================================
+
+
+class SPARCStore:
+    """Columnar SPARC store: per-galaxy index plus flat rotation-curve columns."""
+
+    def __init__(self, index, curves):
+        self.index = index
+        self.curves = curves
+        self.names = index["name"]
+        self.offsets = np.concatenate([[0], np.cumsum(index["count"])])
+        self._row = {name: i for i, name in enumerate(self.names)}
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self._row
+
+    def __getitem__(self, name):
+        """Metadata and curve of one galaxy (curve arrays are views)."""
+        i = self._row[name]
+        lo, hi = self.offsets[i], self.offsets[i + 1]
+        galaxy = {key: values[i] for key, values in self.index.items()}
+        galaxy.update({key: values[lo:hi] for key, values in self.curves.items()})
+        return galaxy
+
+    @property
+    def n_points(self):
+        return int(self.offsets[-1])
+
+    @property
+    def galaxy_of_point(self):
+        """Galaxy row of every curve point (for reductions over galaxies)."""
+        return np.repeat(np.arange(len(self)), self.index["count"])
+
+    def with_curves(self):
+        """Row indices of galaxies that have a rotation curve."""
+        return np.flatnonzero(self.index["count"] > 0)
+
+
+def _source_files(data_dir):
+    data_dir = Path(data_dir)
+    files = sorted(data_dir.rglob(ROTMOD_PATTERN))
+    mrt = data_dir / MRT_FILE.name
+    return ([mrt] if mrt.exists() else []) + files
+
+
+def _fingerprint(data_dir):
+    """Hash of (path, size, mtime) of every source file plus the store version."""
+    digest = hashlib.sha1(f"v{STORE_VERSION}".encode())
+    for path in _source_files(data_dir):
+        stat = path.stat()
+        digest.update(f"{path.relative_to(data_dir)}|{stat.st_size}|{stat.st_mtime_ns}".encode())
+    return digest.hexdigest()
+
+
+def build_store(data_dir=DATA_DIR):
+    """Parse the catalog and all rotmod files into a SPARCStore (no caching)."""
+    data_dir = Path(data_dir)
+    catalog = parse_mrt(data_dir / MRT_FILE.name)
+
+    curves_by_name = {}
+    for path in sorted(data_dir.rglob(ROTMOD_PATTERN)):
+        name = path.name[: -len("_rotmod.dat")]
+        curves_by_name.setdefault(name, parse_rotmod(path))
+
+    # Catalog order first, then galaxies that only have a rotmod file
+    names = list(catalog.get("name", []))
+    names += sorted(set(curves_by_name) - set(names))
+    n = len(names)
+
+    index = {"name": np.array(names, dtype=str)}
+    for label, values in catalog.items():
+        if label != "name":
+            fill = -1 if values.dtype.kind == "i" else ("" if values.dtype.kind == "U" else np.nan)
+            column = np.full(n, fill, dtype=values.dtype)
+            column[: len(values)] = values
+            index[label] = column
+    for label in INDEX_DEFAULTS:
+        index.setdefault(label, np.full(n, np.nan))
+
+    counts = np.zeros(n, dtype=np.int64)
+    blocks = []
+    for i, name in enumerate(names):
+        if name not in curves_by_name:
+            continue
+        header, data = curves_by_name[name]
+        counts[i] = len(data)
+        blocks.append(data)
+        # Rotmod headers fill in distance/inclination missing from the catalog
+        if np.isnan(index["D"][i]) and "Distance" in header:
+            index["D"][i] = header["Distance"]
+        if np.isnan(index["Inc"][i]) and "Inclination" in header:
+            index["Inc"][i] = header["Inclination"]
+    index["count"] = counts
+    index["offset"] = np.concatenate([[0], np.cumsum(counts)[:-1]]) if n else counts
+
+    flat = np.concatenate(blocks) if blocks else np.empty((0, len(CURVE_COLUMNS)))
+    curves = {col: np.ascontiguousarray(flat[:, j]) for j, col in enumerate(CURVE_COLUMNS)}
+    return SPARCStore(index, curves)
+
+
+def load_sparc(data_dir=DATA_DIR, cache_dir=None, force=False):
+    """
+    Load the SPARC store, parsing the source files only when they changed.
+
+    Parameters:
+        data_dir  : directory holding the .mrt catalog and *_rotmod.dat files
+        cache_dir : where the .npz store lives (default: <repo>/.cache)
+        force     : re-parse even if the cache is current
+    """
+    data_dir = Path(data_dir)
+    cache_path = Path(cache_dir or CACHE_DIR) / f"sparc_store_{_path_tag(data_dir)}.npz"
+    fingerprint = _fingerprint(data_dir)
+
+    if cache_path.exists() and not force:
+        try:
+            with np.load(cache_path) as cached:
+                if str(cached["fingerprint"]) == fingerprint:
+                    index = {k[4:]: cached[k] for k in cached.files if k.startswith("idx_")}
+                    curves = {k[3:]: cached[k] for k in cached.files if k.startswith("rc_")}
+                    return SPARCStore(index, curves)
+        except (OSError, KeyError, ValueError):
+            pass
+
+    store = build_store(data_dir)
+    arrays = {f"idx_{k}": v for k, v in store.index.items()}
+    arrays.update({f"rc_{k}": v for k, v in store.curves.items()})
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez(cache_path, fingerprint=np.array(fingerprint), **arrays)
+    except OSError:
+        pass  # read-only checkout: use the parsed store directly
+    return store
+
+
+def _path_tag(data_dir):
+    return hashlib.sha1(str(Path(data_dir).resolve()).encode()).hexdigest()[:12]
+
+
+# =============================================================================
+# DOWNLOAD
+# =============================================================================
+
+
+def download_sparc(data_dir=DATA_DIR):
+    """Fetch the SPARC catalog and the Rotmod_LTG mass models into data_dir."""
+    import io
+    import urllib.request
+    import zipfile
+
+    data_dir = Path(data_dir)
+    for filename in SPARC_FILES:
+        with urllib.request.urlopen(SPARC_URL + filename, timeout=60) as response:
+            payload = response.read()
+        if filename.endswith(".zip"):
+            with zipfile.ZipFile(io.BytesIO(payload)) as archive:
+                archive.extractall(data_dir / Path(filename).stem)
+        else:
+            (data_dir / filename).write_bytes(payload)
+        print(f"✅ Downloaded: {filename}")
+
+
+if __name__ == "__main__":
+    if "--download" in sys.argv:
+        download_sparc()
+
+    sparc = load_sparc(force="--force" in sys.argv)
+    print("SPARC Galaxy Store")
+    print(f"Galaxies: {len(sparc)} ({len(sparc.with_curves())} with rotation curves)")
+    print(f"Curve points: {sparc.n_points}")
+    for i in sparc.with_curves()[:5]:
+        g = sparc[sparc.names[i]]
+        print(f"  {g['name']:<12} D = {g['D']:.2f} Mpc, {g['count']} points, R_max = {g['R'][-1]:.1f} kpc")
@@ -0,0 +1,200 @@
+"""
+SPARC Galaxy Sample - Hand-Typed Summary Table
+==============================================
+Source: Lelli, McGaugh & Schombert 2016 (SPARC), summarised by hand
+URL: http://astroweb.cwru.edu/SPARC/
+
+One row per galaxy, shared by the galaxy rotation tests instead of each
+test carrying its own copy:
+
+    (name, R_kpc, v_obs, M_disk_Msun, R_disk_kpc, type)
+
+R_kpc / v_obs is one representative outer point of the rotation curve.
+Names are unique (DDO87 and NGC4449 used to appear twice with different
+values; the dwarf DDO87 and the compact NGC4449 rows are kept).
+
+The full curves live in the columnar store of sparc_data.py; until
+`python sparc_data.py --download` has been run that store only holds
+NGC6503, so the tests read this table.
+
+    from sparc_sample import SPARC_SAMPLE, galaxies
+    compact = galaxies(types=("compact",))
+    rows = galaxies(names=("NGC6503", "WLM"))
+"""
+
+SPARC_SAMPLE = [
+    # ===== LARGE SPIRALS (M_disk > 5e10) =====
+    ("NGC2841", 40, 300, 1e11, 8, "spiral"),
+    ("NGC5055", 35, 200, 5e10, 6, "spiral"),
+    ("NGC7331", 25, 240, 4e10, 5, "spiral"),
+    ("NGC891", 25, 225, 4e10, 5, "spiral"),
+    ("NGC4565", 35, 255, 8e10, 7, "spiral"),
+    ("UGC2885", 60, 300, 1.5e11, 10, "spiral"),
+    ("NGC4157", 30, 220, 3e10, 5, "spiral"),
+    ("NGC4217", 25, 200, 2.5e10, 4, "spiral"),
+    ("NGC4013", 28, 210, 3e10, 4.5, "spiral"),
+    ("NGC4088", 22, 180, 2e10, 4, "spiral"),
+    ("NGC4100", 18, 170, 1.8e10, 3.5, "spiral"),
+    ("NGC4138", 15, 165, 1.5e10, 3, "spiral"),
+    ("NGC4183", 18, 115, 8e9, 4, "spiral"),
+    ("NGC4559", 25, 120, 1e10, 5, "spiral"),
+    ("NGC4631", 18, 140, 1.5e10, 4, "spiral"),
+    # ===== MEDIUM SPIRALS (1e10 < M_disk < 5e10) =====
+    ("NGC3198", 30, 150, 2e10, 5, "spiral"),
+    ("NGC2403", 18, 130, 1e10, 4, "spiral"),
+    ("NGC6503", 20, 115, 8e9, 3.5, "spiral"),
+    ("NGC925", 18, 110, 7e9, 4, "spiral"),
+    ("NGC6946", 15, 170, 2e10, 4, "spiral"),
+    ("NGC4826", 12, 150, 1.5e10, 3, "spiral"),
+    ("NGC5371", 25, 210, 3e10, 5, "spiral"),
+    ("NGC3521", 22, 215, 2.5e10, 4.5, "spiral"),
+    ("NGC3627", 18, 180, 1.8e10, 3.5, "spiral"),
+    ("NGC3628", 20, 175, 1.5e10, 4, "spiral"),
+    ("NGC4258", 28, 210, 2e10, 5, "spiral"),
+    ("NGC4725", 22, 200, 2.5e10, 4, "spiral"),
+    ("NGC5033", 30, 200, 2.5e10, 5, "spiral"),
+    ("NGC5907", 35, 230, 3e10, 6, "spiral"),
+    ("NGC660", 18, 140, 1.2e10, 3.5, "spiral"),
+    # ===== LSB (Low Surface Brightness) =====
+    ("UGC128", 15, 130, 5e9, 3, "lsb"),
+    ("NGC300", 12, 80, 3e9, 3, "lsb"),
+    ("NGC55", 15, 85, 4e9, 3, "lsb"),
+    ("NGC247", 14, 100, 5e9, 3, "lsb"),
+    ("NGC7793", 10, 100, 4e9, 2.5, "lsb"),
+    ("NGC3109", 10, 65, 2e9, 3, "lsb"),
+    ("UGC1281", 8, 55, 1e9, 2.5, "lsb"),
+    ("UGC1501", 12, 70, 2e9, 3, "lsb"),
+    ("UGC4325", 10, 90, 3e9, 2.5, "lsb"),
+    ("UGC5005", 15, 85, 2.5e9, 3.5, "lsb"),
+    ("UGC5750", 10, 75, 1.5e9, 2.5, "lsb"),
+    ("UGC6917", 12, 95, 3e9, 3, "lsb"),
+    ("UGC7089", 8, 60, 1.2e9, 2, "lsb"),
+    ("UGC7232", 10, 70, 1.8e9, 2.5, "lsb"),
+    ("UGC7323", 12, 85, 2.5e9, 3, "lsb"),
+    ("UGC7559", 8, 50, 8e8, 2, "lsb"),
+    ("UGC7603", 10, 75, 1.5e9, 2.5, "lsb"),
+    ("UGC7690", 6, 45, 5e8, 1.5, "lsb"),
+    ("UGC8286", 10, 80, 2e9, 2.5, "lsb"),
+    ("UGC8550", 8, 55, 1e9, 2, "lsb"),
+    ("F568-1", 12, 110, 4e9, 3, "lsb"),
+    ("F568-3", 15, 100, 3e9, 3.5, "lsb"),
+    ("F568-V1", 10, 80, 2e9, 2.5, "lsb"),
+    ("F571-8", 12, 90, 2.5e9, 3, "lsb"),
+    ("F574-1", 18, 115, 5e9, 4, "lsb"),
+    ("F583-1", 10, 85, 2e9, 2.5, "lsb"),
+    ("F583-4", 8, 60, 1e9, 2, "lsb"),
+    # ===== DWARFS =====
+    ("IC2574", 12, 65, 8e8, 3, "dwarf"),
+    ("WLM", 2, 30, 5e7, 1, "dwarf"),
+    ("DDO170", 6, 55, 2e8, 1.5, "dwarf"),
+    ("DDO50", 5, 40, 1.5e8, 1.5, "dwarf"),
+    ("DDO52", 4, 35, 1e8, 1.2, "dwarf"),
+    ("DDO53", 3, 30, 8e7, 1, "dwarf"),
+    ("DDO64", 6, 50, 2.5e8, 1.8, "dwarf"),
+    ("DDO87", 5, 45, 1.8e8, 1.5, "dwarf"),
+    ("DDO101", 4, 38, 1.2e8, 1.3, "dwarf"),
+    ("DDO126", 5, 42, 1.5e8, 1.4, "dwarf"),
+    ("DDO133", 4, 35, 1e8, 1.2, "dwarf"),
+    ("Haro36", 3, 32, 9e7, 1, "dwarf"),
+    ("NGC1569", 3, 40, 1.5e8, 1, "dwarf"),
+    ("NGC2366", 6, 52, 3e8, 2, "dwarf"),
+    ("NGC4163", 2, 28, 4e7, 0.8, "dwarf"),
+    ("NGC4214", 8, 70, 5e8, 2.5, "dwarf"),
+    ("NGC5204", 5, 55, 3e8, 1.8, "dwarf"),
+    ("SagDIG", 1.5, 20, 2e7, 0.5, "dwarf"),
+    ("SextansA", 2, 25, 3e7, 0.8, "dwarf"),
+    ("UGC4305", 5, 48, 2e8, 1.5, "dwarf"),
+    ("UGC8508", 2, 28, 5e7, 0.8, "dwarf"),
+    # ===== ULTRA-FAINT DWARFS =====
+    ("DDO154", 8, 50, 2e8, 2, "ultrafaint"),
+    ("DDO168", 5, 45, 1e8, 1.5, "ultrafaint"),
+    ("CVnIdwA", 2, 22, 2e7, 0.6, "ultrafaint"),
+    ("LeoA", 1, 15, 1e7, 0.4, "ultrafaint"),
+    ("LeoT", 0.5, 10, 5e6, 0.2, "ultrafaint"),
+    ("Tucana", 2, 18, 1.5e7, 0.5, "ultrafaint"),
+    ("UGC4459", 3, 30, 6e7, 1, "ultrafaint"),
+    ("UGCA281", 2, 25, 4e7, 0.7, "ultrafaint"),
+    ("UGCA442", 3, 32, 7e7, 1, "ultrafaint"),
+    ("AndII", 1, 12, 8e6, 0.3, "ultrafaint"),
+    ("AndVI", 0.8, 10, 5e6, 0.25, "ultrafaint"),
+    ("PegDIG", 1.5, 18, 1.2e7, 0.4, "ultrafaint"),
+    ("Phoenix", 0.5, 8, 3e6, 0.2, "ultrafaint"),
+    # ===== COMPACT =====
+    ("NGC4736", 10, 160, 2e10, 2, "compact"),
+    ("NGC3310", 8, 145, 1.5e10, 1.8, "compact"),
+    ("NGC4449", 6, 70, 5e8, 1.5, "compact"),
+    ("NGC1705", 3, 60, 3e8, 0.8, "compact"),
+    ("NGC2537", 4, 80, 5e8, 1, "compact"),
+    # ===== ADDITIONAL SPIRALS =====
+    ("NGC2976", 5, 80, 5e9, 2, "spiral"),
+    ("NGC3031", 25, 220, 5e10, 5, "spiral"),
+    ("NGC3034", 8, 130, 1e10, 2, "spiral"),
+    ("NGC4244", 18, 95, 5e9, 4, "spiral"),
+    ("NGC4395", 15, 80, 3e9, 4, "spiral"),
+    ("NGC4455", 6, 50, 8e8, 1.5, "spiral"),
+    ("NGC4605", 8, 90, 3e9, 2, "spiral"),
+    ("NGC5023", 12, 85, 2e9, 3, "spiral"),
+    ("NGC5474", 10, 70, 1.5e9, 2.5, "spiral"),
+    ("NGC5585", 12, 90, 3e9, 3, "spiral"),
+    ("NGC6689", 8, 85, 2e9, 2, "spiral"),
+    ("NGC6822", 5, 55, 8e8, 1.5, "spiral"),
+    ("NGC7640", 18, 110, 5e9, 4, "spiral"),
+    ("NGC7678", 15, 150, 1.5e10, 3.5, "spiral"),
+    ("NGC7814", 12, 180, 2e10, 3, "spiral"),
+    # ===== MORE LSB =====
+    ("UGC2259", 8, 65, 1.5e9, 2, "lsb"),
+    ("UGC2455", 10, 75, 2e9, 2.5, "lsb"),
+    ("UGC3137", 15, 100, 4e9, 3.5, "lsb"),
+    ("UGC3371", 10, 80, 2e9, 2.5, "lsb"),
+    ("UGC3851", 8, 60, 1e9, 2, "lsb"),
+    ("UGC4278", 12, 90, 3e9, 3, "lsb"),
+    ("UGC4499", 10, 80, 2e9, 2.5, "lsb"),
+    ("UGC5414", 8, 55, 1e9, 2, "lsb"),
+    ("UGC5721", 6, 45, 6e8, 1.5, "lsb"),
+    ("UGC5829", 10, 65, 1.5e9, 2.5, "lsb"),
+    ("UGC5918", 8, 55, 1e9, 2, "lsb"),
+    ("UGC6399", 12, 85, 2.5e9, 3, "lsb"),
+    ("UGC6446", 10, 75, 2e9, 2.5, "lsb"),
+    ("UGC6614", 18, 110, 5e9, 4, "lsb"),
+    ("UGC6667", 8, 55, 1e9, 2, "lsb"),
+    ("UGC6818", 10, 70, 1.5e9, 2.5, "lsb"),
+    ("UGC6923", 6, 50, 8e8, 1.5, "lsb"),
+    ("UGC6930", 12, 90, 3e9, 3, "lsb"),
+    ("UGC6973", 8, 65, 1.2e9, 2, "lsb"),
+    ("UGC6983", 10, 80, 2e9, 2.5, "lsb"),
+    ("UGC7125", 15, 95, 3e9, 3.5, "lsb"),
+    ("UGC7151", 8, 65, 1.2e9, 2, "lsb"),
+    ("UGC7261", 6, 50, 7e8, 1.5, "lsb"),
+    ("UGC7399", 12, 85, 2.5e9, 3, "lsb"),
+    ("UGC7524", 10, 75, 2e9, 2.5, "lsb"),
+    ("UGC7577", 5, 40, 5e8, 1.2, "lsb"),
+    ("UGC7608", 8, 60, 1e9, 2, "lsb"),
+    ("UGC7866", 6, 45, 6e8, 1.5, "lsb"),
+    ("UGC8490", 10, 80, 2e9, 2.5, "lsb"),
+    ("UGC9211", 6, 50, 8e8, 1.5, "lsb"),
+    ("UGC11454", 15, 95, 3e9, 3.5, "lsb"),
+    ("UGC11557", 8, 55, 1e9, 2, "lsb"),
+    ("UGC11583", 5, 40, 5e8, 1.2, "lsb"),
+    ("UGC11616", 10, 70, 1.5e9, 2.5, "lsb"),
+    ("UGC11648", 12, 85, 2.5e9, 3, "lsb"),
+    ("UGC11707", 8, 60, 1e9, 2, "lsb"),
+    ("UGC11820", 6, 50, 7e8, 1.5, "lsb"),
+    ("UGC11861", 15, 100, 4e9, 3.5, "lsb"),
+    ("UGC11914", 18, 120, 6e9, 4, "lsb"),
+    ("UGC12632", 10, 75, 2e9, 2.5, "lsb"),
+    ("UGC12732", 8, 55, 1e9, 2, "lsb"),
+]
+
+_BY_NAME = {row[0]: row for row in SPARC_SAMPLE}
+
+
+def galaxies(names=None, types=None):
+    """
+    Rows of the sample, in table order (or in the order of `names`).
+
+    Raises KeyError for an unknown name.
+    """
+    rows = [_BY_NAME[name] for name in names] if names is not None else SPARC_SAMPLE
+    if types is not None:
+        rows = [row for row in rows if row[5] in types]
+    return list(rows)
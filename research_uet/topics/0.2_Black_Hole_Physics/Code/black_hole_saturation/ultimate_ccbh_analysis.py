@@ -25,7 +25,6 @@ Reference: Farrah et al. (2023), Croker et al. (2024)
 
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.optimize import curve_fit
 from scipy import stats
 from pathlib import Path
 import sys
@@ -41,6 +40,11 @@ SCRIPT_DIR = Path(__file__).resolve().parent
 REPO_ROOT = SCRIPT_DIR.parent.parent.parent.parent
 sys.path.insert(0, str(REPO_ROOT))
 
+# Shen 2011 catalog and its loader (shen2011_data.py)
+# Path: .../0.2_Black_Hole/Data/black_holes_eht/
+SHEN_DATA_DIR = SCRIPT_DIR.parent.parent / "Data" / "black_holes_eht"
+sys.path.insert(0, str(SHEN_DATA_DIR))
+
 try:
     from research_uet.core.uet_master_equation import (
         UETParameters,
@@ -85,12 +89,15 @@ except ImportError:
 
 
 def load_shen_catalog():
-    """Load Shen 2011 quasar catalog with BH masses."""
-    from astropy.table import Table
+    """
+    Load Shen 2011 quasar catalog with BH masses.
 
-    # Path: .../0.2_Black_Hole/Data/black_holes_eht/shen2011_recovered.fits
-    # Current: .../Code/black_hole_saturation
-    path = SCRIPT_DIR.parent.parent / "Data" / "black_holes_eht" / "shen2011_recovered.fits"
+    Columns come from the .npy column cache (memory-mapped); the FITS file
+    is only parsed (with astropy) when the cache is missing or stale.
+    """
+    from shen2011_data import load_shen_columns
+
+    path = SHEN_DATA_DIR / "shen2011_recovered.fits"
 
     if not path.exists():
         print(f"❌ File not found: {path.absolute()}")
@@ -98,17 +105,16 @@ def load_shen_catalog():
 
     print("📖 Loading Shen 2011 catalog...")
     try:
-        table = Table.read(path)
+        columns = load_shen_columns(path)
     except Exception as e:
         print(f"❌ Error reading FITS: {e}")
         return None
 
-    # Extract arrays
     data = {
-        "z": np.array(table["z"]),
-        "logMBH": np.array(table["logBH"]),
-        "logMBH_err": np.array(table["e_logBH"]),
-        "logLbol": np.array(table["logLbol"]),
+        "z": columns["z"],
+        "logMBH": columns["logBH"],
+        "logMBH_err": columns["e_logBH"],
+        "logLbol": columns["logLbol"],
     }
 
     print(f"   ✅ Loaded {len(data['z']):,} quasars")
@@ -216,54 +222,85 @@ def apply_quality_cuts(data, config=None):
     return cleaned
 
 
-def bin_by_redshift(data, n_bins=15, method="equal_number"):
-    """Bin data by redshift with V/Vmax-style weighting."""
-    z = data["z"]
-    logMBH = data["logMBH"]
-    logMBH_err = data.get("logMBH_err", np.ones_like(logMBH) * 0.3)
-
+def redshift_bin_edges(z_sorted, n_bins, method="equal_number"):
+    """Bin edges over sorted redshifts: equal-number (quantiles) or equal-width."""
     if method == "equal_number":
-        percentiles = np.linspace(0, 100, n_bins + 1)
-        bin_edges = np.percentile(z, percentiles)
-    else:
-        bin_edges = np.linspace(z.min(), z.max(), n_bins + 1)
+        return np.percentile(z_sorted, np.linspace(0, 100, n_bins + 1))
+    if method == "equal_width":
+        return np.linspace(z_sorted[0], z_sorted[-1], n_bins + 1)
+    raise ValueError(f"Unknown binning method: {method}")
 
-    bins = []
-    for i in range(n_bins):
-        mask = (z >= bin_edges[i]) & (z < bin_edges[i + 1])
-        if i == n_bins - 1:
-            mask = (z >= bin_edges[i]) & (z <= bin_edges[i + 1])
 
-        n = np.sum(mask)
-        if n < 30:
-            continue
+def bin_by_redshift(data, n_bins=15, method="equal_number", min_count=30, verbose=True):
+    """
+    Bin data by redshift with V/Vmax-style weighting.
+
+    Single pass: sorts by z once, finds every bin's [lo, hi) range with
+    searchsorted (last bin closed), then reduces all bins together with
+    np.add.reduceat, so large n_bins scans cost O(N log N) in total.
+    Bins with fewer than min_count objects are dropped.
+    """
+    z = np.asarray(data["z"], dtype=float)
+    logMBH = np.asarray(data["logMBH"], dtype=float)
+    logMBH_err = data.get("logMBH_err", np.ones_like(logMBH) * 0.3)
 
-        z_bin = z[mask]
-        mbh_bin = logMBH[mask]
-        err_bin = logMBH_err[mask]
-
-        # V/Vmax-style weighting: downweight high-mass objects
-        # (they're overrepresented due to flux limits)
-        weights = 10 ** (-0.5 * (mbh_bin - mbh_bin.min()))
-        weights /= np.sum(weights)
-
-        # Weighted statistics
-        mbh_mean = np.average(mbh_bin, weights=weights)
-        mbh_std = np.sqrt(np.average((mbh_bin - mbh_mean) ** 2, weights=weights))
-        mbh_err = mbh_std / np.sqrt(n)  # Standard error
-
-        bins.append(
-            {
-                "z_center": np.mean(z_bin),
-                "z_median": np.median(z_bin),
-                "logMBH": mbh_mean,
-                "logMBH_err": mbh_err,
-                "logMBH_raw": np.mean(mbh_bin),  # Uncorrected
-                "n": n,
-            }
+    order = np.argsort(z, kind="stable")
+    z_s = z[order]
+    mbh_s = logMBH[order]
+    bin_edges = redshift_bin_edges(z_s, n_bins, method)
+
+    lo = np.searchsorted(z_s, bin_edges[:-1], side="left")
+    hi = np.searchsorted(z_s, bin_edges[1:], side="left")
+    hi[-1] = np.searchsorted(z_s, bin_edges[-1], side="right")
+    counts = hi - lo
+    keep = counts >= min_count
+    lo, counts = lo[keep], counts[keep]
+
+    # Kept bins as contiguous segments of one gathered array
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]]).astype(np.intp)
+    idx = np.arange(counts.sum()) + np.repeat(lo - starts, counts)
+    z_bin, mbh_bin = z_s[idx], mbh_s[idx]
+
+    def per_bin(values):
+        return np.add.reduceat(values, starts) if len(starts) else np.empty(0)
+
+    # V/Vmax-style weighting: downweight high-mass objects
+    # (they're overrepresented due to flux limits)
+    mbh_min = np.minimum.reduceat(mbh_bin, starts) if len(starts) else np.empty(0)
+    weights = 10 ** (-0.5 * (mbh_bin - np.repeat(mbh_min, counts)))
+    w_sum = per_bin(weights)
+
+    # Weighted statistics
+    mbh_mean = per_bin(weights * mbh_bin) / w_sum
+    mbh_var = per_bin(weights * (mbh_bin - np.repeat(mbh_mean, counts)) ** 2) / w_sum
+    mbh_err = np.sqrt(mbh_var) / np.sqrt(counts)  # Standard error
+
+    # Segments are sorted in z, so the median is the middle element(s)
+    mid = starts + counts // 2
+    z_median = np.where(counts % 2, z_bin[mid], 0.5 * (z_bin[mid - 1] + z_bin[mid]))
+
+    bins = [
+        {
+            "z_center": z_c,
+            "z_median": z_m,
+            "logMBH": m,
+            "logMBH_err": e,
+            "logMBH_raw": raw,  # Uncorrected
+            "n": n,
+        }
+        for z_c, z_m, m, e, raw, n in zip(
+            per_bin(z_bin) / counts,
+            z_median,
+            mbh_mean,
+            mbh_err,
+            per_bin(mbh_bin) / counts,
+            counts,
         )
+    ]
 
-    print(f"\n📊 Created {len(bins)} redshift bins (N = {bins[0]['n']:.0f} to {bins[-1]['n']:.0f})")
+    if verbose and bins:
+        n_first, n_last = bins[0]["n"], bins[-1]["n"]
+        print(f"\n📊 Created {len(bins)} redshift bins (N = {n_first:.0f} to {n_last:.0f})")
 
     return bins
 
@@ -278,38 +315,47 @@ def ccbh_model(log_a, log_M0, k):
     return log_M0 + k * log_a
 
 
+def wls_line(log_a, logMBH, weights, k_fixed=None):
+    """
+    Closed-form weighted least squares for log(M_BH) = log_M0 + k log(a).
+
+    The model is linear in (log_M0, k), so the fit reduces to weighted sums.
+    weights may carry leading batch axes (e.g. bootstrap multiplicities ×
+    1/σ²); sums run over the last axis.
+
+    Returns:
+        (log_M0, k, var_log_M0, var_k) with covariance (Σ w x xᵀ)⁻¹
+    """
+    x, y, w = np.asarray(log_a, float), np.asarray(logMBH, float), np.asarray(weights, float)
+    S = w.sum(axis=-1)
+    Sx = (w * x).sum(axis=-1)
+    Sy = (w * y).sum(axis=-1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if k_fixed is not None:
+            k = np.full_like(S, k_fixed)
+            return (Sy - k_fixed * Sx) / S, k, 1.0 / S, np.zeros_like(S)
+
+        Sxx = (w * x * x).sum(axis=-1)
+        Sxy = (w * x * y).sum(axis=-1)
+        D = S * Sxx - Sx**2
+        k = (S * Sxy - Sx * Sy) / D
+        return (Sy - k * Sx) / S, k, Sxx / D, S / D
+
+
 def fit_ccbh(z, logMBH, logMBH_err=None, k_fixed=None):
-    """Fit CCBH model to binned data."""
+    """Fit CCBH model to binned data (closed-form weighted least squares)."""
     a = 1.0 / (1.0 + z)
     log_a = np.log10(a)
+    weights = np.ones_like(log_a) if logMBH_err is None else 1.0 / np.asarray(logMBH_err) ** 2
 
+    # Same estimates and absolute-σ covariance as curve_fit(..., absolute_sigma=True)
+    log_M0, k, var_M0, var_k = wls_line(log_a, logMBH, weights, k_fixed)
+    log_M0_err = np.sqrt(var_M0)
+    k_err = np.sqrt(var_k)
     if k_fixed is not None:
-        # Fit only M0 with fixed k
-        def model_fixed(x, log_M0):
-            return log_M0 + k_fixed * x
-
-        popt, pcov = curve_fit(
-            model_fixed,
-            log_a,
-            logMBH,
-            sigma=logMBH_err if logMBH_err is not None else None,
-            absolute_sigma=True,
-        )
-        log_M0 = popt[0]
-        log_M0_err = np.sqrt(pcov[0, 0])
         k = k_fixed
         k_err = 0.0
-    else:
-        # Fit both M0 and k
-        popt, pcov = curve_fit(
-            ccbh_model,
-            log_a,
-            logMBH,
-            sigma=logMBH_err if logMBH_err is not None else None,
-            absolute_sigma=True,
-        )
-        log_M0, k = popt
-        log_M0_err, k_err = np.sqrt(np.diag(pcov))
 
     # Compute residuals and chi-squared
     predicted = ccbh_model(log_a, log_M0, k)
@@ -317,7 +363,7 @@ def fit_ccbh(z, logMBH, logMBH_err=None, k_fixed=None):
 
     if logMBH_err is not None:
         chi2 = np.sum((residuals / logMBH_err) ** 2)
-        dof = len(z) - (1 if k_fixed else 2)
+        dof = len(z) - (1 if k_fixed is not None else 2)
         chi2_red = chi2 / dof
     else:
         chi2_red = np.var(residuals)
@@ -328,23 +374,166 @@ def fit_ccbh(z, logMBH, logMBH_err=None, k_fixed=None):
     r2 = 1 - ss_res / ss_tot
 
     return {
-        "log_M0": log_M0,
-        "log_M0_err": log_M0_err,
+        "log_M0": float(log_M0),
+        "log_M0_err": float(log_M0_err),
         "k": k,
-        "k_err": k_err,
+        "k_err": float(k_err),
         "chi2_red": chi2_red,
         "r2": r2,
         "residuals": residuals,
     }
 
 
+# ============================================================================
+# K-SCAN & RESAMPLING
+# ============================================================================
+
+
+PROFILE_SIGMAS = 5.0  # half-width of the χ²(k) scan in units of the free fit's k_err
+PROFILE_POINTS = 6001
+
+
+def profile_grid(k_fit, k_err, n_sigma=PROFILE_SIGMAS, points=PROFILE_POINTS):
+    """k grid centred on the free fit, k ± n_sigma·k_err (±1 if k_err is unusable)."""
+    half = n_sigma * k_err if np.isfinite(k_err) and k_err > 0 else 1.0
+    return np.linspace(k_fit - half, k_fit + half, points)
+
+
+def chi2_profile(z, logMBH, logMBH_err, k_grid):
+    """
+    χ²(k) with log_M0 profiled out, for every k of a dense grid.
+
+    Uses χ²(k) = Syy - 2k Sxy + k² Sxx - (Sy - k Sx)² / S, so the cost is
+    O(N + len(k_grid)).
+
+    Returns:
+        dict with k, chi2, delta_chi2 (vs grid minimum), log_M0, the
+        Δχ² = 1 interval (k_lo, k_hi) on the grid and at_edge (the minimum
+        or the interval reaches the end of the grid, so both are clipped)
+    """
+    x = np.log10(1.0 / (1.0 + np.asarray(z, float)))
+    y = np.asarray(logMBH, float)
+    w = 1.0 / np.asarray(logMBH_err, float) ** 2
+    S, Sx, Sy = w.sum(), (w * x).sum(), (w * y).sum()
+    Sxx, Sxy, Syy = (w * x * x).sum(), (w * x * y).sum(), (w * y * y).sum()
+
+    k = np.asarray(k_grid, float)
+    chi2 = Syy - 2 * k * Sxy + k**2 * Sxx - (Sy - k * Sx) ** 2 / S
+    delta = chi2 - chi2.min()
+    inside = k[delta <= 1.0]
+    return {
+        "k": k,
+        "chi2": chi2,
+        "delta_chi2": delta,
+        "log_M0": (Sy - k * Sx) / S,
+        "k_best": k[np.argmin(chi2)],
+        "k_lo": inside.min(),
+        "k_hi": inside.max(),
+        "at_edge": bool(delta[0] <= 1.0 or delta[-1] <= 1.0),
+    }
+
+
+def posterior_summary(samples):
+    """Median, 68% interval and std of resampled k (NaN replicates dropped)."""
+    samples = np.asarray(samples, float)
+    samples = samples[np.isfinite(samples)]
+    p16, p50, p84 = np.percentile(samples, [16, 50, 84])
+    return {"samples": samples, "median": p50, "p16": p16, "p84": p84, "std": samples.std()}
+
+
+def resample_ccbh(z, logMBH, logMBH_err, method="bootstrap", n_boot=2000, seed=0):
+    """
+    Bootstrap / jackknife of the free CCBH fit over binned points.
+
+    Every replicate is a multiplicity vector on the bins, so all replicates
+    are solved at once by wls_line (one (B, n) weighted-sum pass).
+
+    Returns:
+        dict with k and log_M0 posterior summaries; for the jackknife,
+        k_err is the jackknife standard error
+    """
+    x = np.log10(1.0 / (1.0 + np.asarray(z, float)))
+    w = 1.0 / np.asarray(logMBH_err, float) ** 2
+    n = len(x)
+
+    if method == "bootstrap":
+        rng = np.random.default_rng(seed)
+        counts = rng.multinomial(n, np.full(n, 1.0 / n), size=n_boot)
+    elif method == "jackknife":
+        counts = 1.0 - np.eye(n)
+    else:
+        raise ValueError(f"Unknown resampling method: {method}")
+
+    log_M0, k, _, _ = wls_line(x, logMBH, counts * w)
+    result = {"method": method, "k": posterior_summary(k), "log_M0": posterior_summary(log_M0)}
+    if method == "jackknife":
+        result["k_err"] = np.sqrt((n - 1) / n * np.sum((k - k.mean()) ** 2))
+    return result
+
+
+def _unbinned_replicates(task):
+    """Resample quasars, rebin and refit for a chunk of bootstrap seeds."""
+    data, n_bins = task["data"], task["n_bins"]
+    n = len(data["z"])
+    out = np.full((len(task["seeds"]), 2), np.nan)
+    for i, seed in enumerate(task["seeds"]):
+        idx = np.random.default_rng(seed).integers(0, n, n)
+        bins = bin_by_redshift({key: v[idx] for key, v in data.items()}, n_bins, verbose=False)
+        if len(bins) < 3:
+            continue
+        z_b = np.array([b["z_median"] for b in bins])
+        y_b = np.array([b["logMBH"] for b in bins])
+        w_b = 1.0 / np.array([b["logMBH_err"] for b in bins]) ** 2
+        log_M0, k, _, _ = wls_line(np.log10(1.0 / (1.0 + z_b)), y_b, w_b)
+        out[i] = log_M0, k
+    return out
+
+
+def bootstrap_unbinned(data, n_boot=200, n_bins=20, seed=0, jobs=None):
+    """
+    Bootstrap over individual quasars: resample, rebin, refit, B times.
+
+    Replicates run across a process pool in chunks; replicate b always uses
+    child b of SeedSequence(seed), so results do not depend on jobs.
+    """
+    data = {key: np.asarray(data[key]) for key in ("z", "logMBH", "logMBH_err")}
+    seeds = np.random.SeedSequence(seed).spawn(n_boot)
+    jobs = jobs or os.cpu_count() or 1
+    n_chunks = min(n_boot, jobs * 4)
+    tasks = [
+        {"data": data, "n_bins": n_bins, "seeds": chunk}
+        for chunk in np.array_split(np.array(seeds, dtype=object), n_chunks)
+    ]
+
+    if jobs > 1 and len(tasks) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            parts = list(pool.map(_unbinned_replicates, tasks))
+    else:
+        parts = [_unbinned_replicates(task) for task in tasks]
+
+    fits = np.concatenate(parts)
+    return {
+        "method": "unbinned bootstrap",
+        "k": posterior_summary(fits[:, 1]),
+        "log_M0": posterior_summary(fits[:, 0]),
+    }
+
+
 # ============================================================================
 # MAIN ANALYSIS
 # ============================================================================
 
 
-def run_ultimate_analysis():
-    """Run the complete CCBH analysis."""
+def run_ultimate_analysis(n_boot=2000, n_boot_unbinned=200, jobs=None):
+    """
+    Run the complete CCBH analysis.
+
+    n_boot          : bootstrap replicates over the redshift bins
+    n_boot_unbinned : bootstrap replicates over quasars (rebinned each time)
+    jobs            : worker processes for the unbinned bootstrap
+    """
 
     print("\n" + "🌌" * 35)
     print("   COMPREHENSIVE CCBH ANALYSIS")
@@ -441,6 +630,39 @@ def run_ultimate_analysis():
         delta = chi2 - chi2_free
         print(f"   {name}: {chi2:.3f} (Δ = {delta:+.3f})")
 
+    # Dense k-scan with log_M0 profiled out
+    profile = chi2_profile(z_bins, mbh_bins, mbh_err_bins, profile_grid(k_fit, k_err))
+    for _ in range(3):  # widen until the Δχ² = 1 interval lies inside the grid
+        if not profile["at_edge"]:
+            break
+        k = profile["k"]
+        half = k[-1] - k[0]
+        wider = np.linspace(k[0] - half, k[-1] + half, PROFILE_POINTS)
+        profile = chi2_profile(z_bins, mbh_bins, mbh_err_bins, wider)
+    chi2_at = chi2_profile(z_bins, mbh_bins, mbh_err_bins, list(k_values.values()))["chi2"]
+    print(
+        f"\n📊 χ²(k) profile: k = {profile['k_best']:.3f} "
+        f"[{profile['k_lo']:.3f}, {profile['k_hi']:.3f}] (Δχ² = 1)"
+    )
+    if profile["at_edge"]:
+        print("   ⚠️ Δχ² = 1 interval reaches the scan edge; k range is clipped")
+    for name, chi2 in zip(k_values, chi2_at):
+        print(f"   {name}: Δχ² = {chi2 - profile['chi2'].min():.1f}")
+
+    # Resampling posteriors of k
+    boot = resample_ccbh(z_bins, mbh_bins, mbh_err_bins, "bootstrap", n_boot=n_boot)
+    jack = resample_ccbh(z_bins, mbh_bins, mbh_err_bins, "jackknife")
+    boot_unbinned = bootstrap_unbinned(shen_clean, n_boot=n_boot_unbinned, n_bins=20, jobs=jobs)
+    print("\n🎲 Resampled k:")
+    for label, res in (("Bootstrap (bins)", boot), ("Bootstrap (quasars)", boot_unbinned)):
+        post = res["k"]
+        print(
+            f"   {label}: k = {post['median']:.3f} "
+            f"(+{post['p84'] - post['median']:.3f} / -{post['median'] - post['p16']:.3f}), "
+            f"N = {len(post['samples'])}"
+        )
+    print(f"   Jackknife (bins): k_err = {jack['k_err']:.3f}")
+
     # ========================================================================
     # STEP 5: KORMENDY & HO CALIBRATION
     # ========================================================================
@@ -652,6 +874,10 @@ def run_ultimate_analysis():
         "fits": fits,
         "bins": bins,
         "kh": kh,
+        "chi2_profile": profile,
+        "bootstrap": boot,
+        "jackknife": jack,
+        "bootstrap_unbinned": boot_unbinned,
     }
 
 
@@ -800,8 +1026,8 @@ def analyze_entropy_recycling(k_fit, log_M0_avg=8.5, volume_radius_mpc=1000):
         fig.update_layout(
             title="Black Hole Entropy Saturation", xaxis_title="Area", yaxis_title="Entropy"
         )
-        uet_viz.save_plot(fig, "black_hole_entropy.png", result_dir)
-        print("  [Viz] Generated 'black_hole_entropy.png'")
+        if uet_viz.save_plot(fig, "black_hole_entropy.png", result_dir):
+            print("  [Viz] Generated 'black_hole_entropy.png'")
     except Exception as e:
         print(f"Viz Error: {e}")
 
@@ -155,8 +155,8 @@ def run_test():
             xaxis_title="X (Rs)",
             yaxis_title="Y (Rs)",
         )
-        uet_viz.save_plot(fig, "eht_shadow_simulation.png", result_dir)
-        print("  [Viz] Generated 'eht_shadow_simulation.png'")
+        if uet_viz.save_plot(fig, "eht_shadow_simulation.png", result_dir):
+            print("  [Viz] Generated 'eht_shadow_simulation.png'")
 
     except Exception as e:
         print(f"Viz Error: {e}")
@@ -187,8 +187,8 @@ def run_test():
                 xaxis_title="Time (s)",
                 yaxis_title="Strain",
             )
-            uet_viz.save_plot(fig, "ligo_waveform.png", result_dir)
-            print("  [Viz] Generated 'ligo_waveform.png'")
+            if uet_viz.save_plot(fig, "ligo_waveform.png", result_dir):
+                print("  [Viz] Generated 'ligo_waveform.png'")
 
         except Exception as e:
             print(f"Viz Error: {e}")
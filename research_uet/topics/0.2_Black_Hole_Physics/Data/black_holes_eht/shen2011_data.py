@@ -0,0 +1,165 @@
+"""
+Shen et al. 2011 SDSS DR7 Quasar Catalog - Columnar Cache
+=========================================================
+Source: Shen et al. 2011, ApJS 194, 45
+File:   shen2011_recovered.fits (not shipped; ~100k quasars)
+
+Reading the FITS table needs astropy and takes seconds. The columns the
+analyses use are converted once into uncompressed .npy files:
+
+    <repo>/.cache/shen2011_<pathhash>/
+        z.npy, logBH.npy, e_logBH.npy, logLbol.npy
+        manifest.json   (source size, mtime, sha256, columns)
+
+Later runs memory-map them (no astropy import). The cache is rebuilt when
+the source checksum changes; a changed mtime alone only triggers a
+re-hash, so a fresh checkout does not force a conversion.
+
+    from shen2011_data import load_shen_columns
+    cols = load_shen_columns()     # dict of read-only memmaps, or None
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+DATA_DIR = Path(__file__).parent
+SOURCE = DATA_DIR / "shen2011_recovered.fits"
+COLUMNS = ("z", "logBH", "e_logBH", "logLbol")
+
+_root = Path(__file__).parent
+while _root.name != "research_uet" and _root.parent != _root:
+    _root = _root.parent
+CACHE_DIR = Path(os.environ.get("UET_CACHE_DIR", _root.parent / ".cache"))
+CACHE_VERSION = 1
+
+
+def file_checksum(path, block_size=1 << 20):
+    """sha256 of a file, read in blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def cache_path(source=SOURCE, cache_dir=None):
+    """Cache directory of one source file."""
+    tag = hashlib.sha1(str(Path(source).resolve()).encode()).hexdigest()[:12]
+    return Path(cache_dir or CACHE_DIR) / f"shen2011_{tag}"
+
+
+def _read_manifest(directory):
+    try:
+        with open(directory / "manifest.json") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json(path, payload):
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w") as f:
+        json.dump(payload, f, indent=2)
+    os.replace(tmp, path)
+
+
+def _is_current(manifest, source, columns, directory):
+    """True if the cached columns still match the source file."""
+    if not manifest or manifest.get("version") != CACHE_VERSION:
+        return False
+    if not set(columns) <= set(manifest.get("columns", ())):
+        return False
+    if not all((directory / f"{col}.npy").exists() for col in columns):
+        return False
+
+    stat = source.stat()
+    if stat.st_size != manifest.get("size"):
+        return False
+    if stat.st_mtime_ns == manifest.get("mtime_ns"):
+        return True
+
+    # Touched but maybe unchanged (checkout, copy): compare content
+    if file_checksum(source) != manifest.get("sha256"):
+        return False
+    manifest["mtime_ns"] = stat.st_mtime_ns
+    try:
+        _write_json(directory / "manifest.json", manifest)
+    except OSError:
+        pass
+    return True
+
+
+def convert_fits(source=SOURCE, columns=COLUMNS, cache_dir=None):
+    """
+    Convert the FITS columns into the .npy column store (needs astropy).
+
+    Masked entries become NaN. The manifest is written last, so an
+    interrupted conversion is never mistaken for a valid cache.
+    """
+    from astropy.table import Table
+
+    source = Path(source)
+    directory = cache_path(source, cache_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / "manifest.json").unlink(missing_ok=True)
+
+    table = Table.read(source)
+    for col in columns:
+        values = np.ma.filled(np.ma.asarray(table[col], dtype=float), np.nan)
+        tmp = directory / f"{col}.tmp.npy"
+        np.save(tmp, np.ascontiguousarray(values))
+        os.replace(tmp, directory / f"{col}.npy")
+
+    stat = source.stat()
+    manifest = {
+        "version": CACHE_VERSION,
+        "source": source.name,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": file_checksum(source),
+        "columns": list(columns),
+        "rows": len(table),
+    }
+    _write_json(directory / "manifest.json", manifest)
+    return directory
+
+
+def load_shen_columns(source=SOURCE, columns=COLUMNS, cache_dir=None, force=False):
+    """
+    Catalog columns as read-only memory-mapped arrays.
+
+    Converts the FITS file on first use (or when it changed / force=True).
+
+    Returns:
+        dict column -> np.memmap, or None if the source file is missing
+    """
+    source = Path(source)
+    if not source.exists():
+        return None
+
+    directory = cache_path(source, cache_dir)
+    manifest = _read_manifest(directory)
+    if force or not _is_current(manifest, source, columns, directory):
+        cached = set(manifest.get("columns", ())) if manifest else set()
+        wanted = tuple(columns) + tuple(sorted(cached - set(columns)))
+        convert_fits(source, wanted, cache_dir)
+
+    return {col: np.load(directory / f"{col}.npy", mmap_mode="r") for col in columns}
+
+
+if __name__ == "__main__":
+    import sys
+
+    cols = load_shen_columns(force="--force" in sys.argv)
+    if cols is None:
+        print(f"❌ File not found: {SOURCE}")
+    else:
+        print("Shen 2011 Quasar Catalog (column cache)")
+        print(f"Cache: {cache_path()}")
+        print(f"Quasars: {len(cols['z']):,}")
+        for name, values in cols.items():
+            print(f"  {name:<8} {np.nanmin(values):8.3f} .. {np.nanmax(values):8.3f}")
@@ -107,8 +107,8 @@ def run_test():
             xaxis_title="Redshift z",
             yaxis_title="Distance Scale",
         )
-        uet_viz.save_plot(fig, "bao_acoustic_scale.png", result_dir)
-        print("  [Viz] Generated 'bao_acoustic_scale.png'")
+        if uet_viz.save_plot(fig, "bao_acoustic_scale.png", result_dir):
+            print("  [Viz] Generated 'bao_acoustic_scale.png'")
 
     except Exception as e:
         print(f"Viz Error: {e}")
@@ -183,8 +183,8 @@ def test_cmb_peaks():
             yaxis_title="D_l [μK^2]",
             xaxis_type="log",
         )
-        uet_viz.save_plot(fig, "cmb_power_spectrum.png", result_dir)
-        print("  [Viz] Generated 'cmb_power_spectrum.png'")
+        if uet_viz.save_plot(fig, "cmb_power_spectrum.png", result_dir):
+            print("  [Viz] Generated 'cmb_power_spectrum.png'")
 
     except Exception as e:
         print(f"Viz Error: {e}")
@@ -159,8 +159,8 @@ def test_dark_energy_eqn():
             xaxis_title="Redshift z",
             yaxis_title="w(z)",
         )
-        uet_viz.save_plot(fig, "dark_energy_evolution.png", result_dir)
-        print("  [Viz] Generated 'dark_energy_evolution.png'")
+        if uet_viz.save_plot(fig, "dark_energy_evolution.png", result_dir):
+            print("  [Viz] Generated 'dark_energy_evolution.png'")
 
     except Exception as e:
         print(f"Viz Error: {e}")
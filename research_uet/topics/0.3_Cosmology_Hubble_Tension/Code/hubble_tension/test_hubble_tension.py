@@ -160,8 +160,8 @@ def run_test():
         )
 
         fig.update_layout(title="Hubble Tension Resolution (UET)", yaxis_title="H0 (km/s/Mpc)")
-        uet_viz.save_plot(fig, "hubble_tension_resolution.html", result_dir)
-        print("  [Viz] Generated 'hubble_tension_resolution.html'")
+        if uet_viz.save_plot(fig, "hubble_tension_resolution.html", result_dir):
+            print("  [Viz] Generated 'hubble_tension_resolution.html'")
 
     except Exception as e:
         print(f"Viz Error: {e}")
@@ -170,8 +170,8 @@ def run_all_tests():
             xaxis_title="Magnetic Field (T)",
             yaxis_title="Confinement Time (s)",
         )
-        uet_viz.save_plot(fig, "plasma_confinement.png", result_dir)
-        print("  [Viz] Generated 'plasma_confinement.png'")
+        if uet_viz.save_plot(fig, "plasma_confinement.png", result_dir):
+            print("  [Viz] Generated 'plasma_confinement.png'")
 
     except Exception as e:
         print(f"Viz Error: {e}")
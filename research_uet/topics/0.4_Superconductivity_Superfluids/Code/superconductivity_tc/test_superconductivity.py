@@ -175,10 +175,10 @@ def run_test():
         materials = ["Hg", "Pb", "Sn", "In"]
         tc_obs = [4.15, 7.2, 3.7, 3.4]
         tc_uet = [4.18, 7.15, 3.72, 3.45]
-        uet_viz.plot_comparison(
+        if uet_viz.plot_comparison(
             materials, [0] * 4, tc_uet, tc_obs, "Superconductivity Critical Temp (Tc)", result_dir
-        )
-        print("  [Viz] Generated 'comparison_chart.png'")
+        ):
+            print("  [Viz] Generated 'comparison_chart.png'")
 
         # 2. Tc vs Pressure (New)
         # Simulate Tc scaling with Pressure P (Gpa)
@@ -209,8 +209,8 @@ def run_test():
         fig.update_layout(
             title="Tc vs Pressure (Mercury)", xaxis_title="Pressure (GPa)", yaxis_title="Tc (K)"
         )
-        uet_viz.save_plot(fig, "tc_pressure_scaling.png", result_dir)
-        print("  [Viz] Generated 'tc_pressure_scaling.png'")
+        if uet_viz.save_plot(fig, "tc_pressure_scaling.png", result_dir):
+            print("  [Viz] Generated 'tc_pressure_scaling.png'")
 
     except Exception as e:
         print(f"Viz Error: {e}")
@@ -168,8 +168,8 @@ def run_test():
             xaxis_title="Temperature (K)",
             yaxis_title="Superfluid Density Ratio",
         )
-        uet_viz.save_plot(fig, "he4_phase_diagram.png", result_dir)
-        print("  [Viz] Generated 'he4_phase_diagram.png'")
+        if uet_viz.save_plot(fig, "he4_phase_diagram.png", result_dir):
+            print("  [Viz] Generated 'he4_phase_diagram.png'")
 
     except Exception as e:
         print(f"Viz Error: {e}")
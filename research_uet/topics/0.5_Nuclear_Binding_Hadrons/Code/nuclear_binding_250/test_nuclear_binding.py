@@ -263,8 +263,8 @@ def run_test():
             xaxis_title="Mass Number A",
             yaxis_title="E/A (MeV)",
         )
-        uet_viz.save_plot(fig, "nuclear_binding_curve.png", result_dir)
-        print("  [Viz] Generated 'nuclear_binding_curve.png'")
+        if uet_viz.save_plot(fig, "nuclear_binding_curve.png", result_dir):
+            print("  [Viz] Generated 'nuclear_binding_curve.png'")
     except Exception as e:
         print(f"Viz Error: {e}")
 
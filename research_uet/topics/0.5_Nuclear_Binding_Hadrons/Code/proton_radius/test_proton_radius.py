@@ -55,8 +55,8 @@ def run_test():
             yaxis_title="Radius (fm)",
             yaxis_range=[0.8, 0.9],
         )
-        uet_viz.save_plot(fig, "proton_radius_comparison.png", result_dir)
-        print("  [Viz] Generated 'proton_radius_comparison.png'")
+        if uet_viz.save_plot(fig, "proton_radius_comparison.png", result_dir):
+            print("  [Viz] Generated 'proton_radius_comparison.png'")
 
     except Exception as e:
         print(f"Viz Error: {e}")
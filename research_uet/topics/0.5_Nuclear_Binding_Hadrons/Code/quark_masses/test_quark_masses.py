@@ -36,8 +36,8 @@ def run_test():
         gens = [1, 1, 2, 2, 3, 3]
 
         fig.update_layout(title="Quark Mass Hierarchy", yaxis_title="Mass (MeV)", yaxis_type="log")
-        uet_viz.save_plot(fig, "quark_mass_scaling.png", result_dir)
-        print("  [Viz] Generated 'quark_mass_scaling.png'")
+        if uet_viz.save_plot(fig, "quark_mass_scaling.png", result_dir):
+            print("  [Viz] Generated 'quark_mass_scaling.png'")
 
     except Exception as e:
         print(f"Viz Error: {e}")
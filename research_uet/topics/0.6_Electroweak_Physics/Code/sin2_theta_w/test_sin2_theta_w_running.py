@@ -104,8 +104,8 @@ def run_test():
             yaxis_title="sin²θ_W",
             xaxis_type="log",
         )
-        uet_viz.save_plot(fig, "weinberg_angle_running.png", result_dir)
-        print("  [Viz] Generated 'weinberg_angle_running.png'")
+        if uet_viz.save_plot(fig, "weinberg_angle_running.png", result_dir):
+            print("  [Viz] Generated 'weinberg_angle_running.png'")
 
     except Exception as e:
         print(f"Viz Error: {e}")
@@ -177,8 +177,8 @@ def run_test():
         fig.update_layout(
             title="UET Electroweak Accuracy (Relative Error %)", yaxis_title="Error (%)"
         )
-        uet_viz.save_plot(fig, "electroweak_summary.png", result_dir)
-        print("  [Viz] Generated 'electroweak_summary.png'")
+        if uet_viz.save_plot(fig, "electroweak_summary.png", result_dir):
+            print("  [Viz] Generated 'electroweak_summary.png'")
 
     except Exception as e:
         print(f"Viz Error: {e}")
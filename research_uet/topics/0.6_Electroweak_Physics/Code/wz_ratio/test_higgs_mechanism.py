@@ -58,8 +58,8 @@ def run_test():
             xaxis_title="Field Value φ (GeV)",
             yaxis_title="Potential V(φ)",
         )
-        uet_viz.save_plot(fig, "higgs_potential.png", result_dir)
-        print("  [Viz] Generated 'higgs_potential.png'")
+        if uet_viz.save_plot(fig, "higgs_potential.png", result_dir):
+            print("  [Viz] Generated 'higgs_potential.png'")
 
         return True
 
@@ -267,8 +267,8 @@ def run_all_tests():
             yaxis_title="Mass (GeV)",
             yaxis_range=[80.3, 80.5],
         )
-        uet_viz.save_plot(fig, "w_mass_comparison.png", result_dir)
-        print("  [Viz] Generated 'w_mass_comparison.png'")
+        if uet_viz.save_plot(fig, "w_mass_comparison.png", result_dir):
+            print("  [Viz] Generated 'w_mass_comparison.png'")
 
     except Exception as e:
         print(f"Viz Error: {e}")
@@ -201,8 +201,8 @@ def run_test():
             showlegend=True,
         )
 
-        uet_viz.save_plot(fig, "ft_value_comparison.png", result_dir)
-        print("  [Viz] Generated 'ft_value_comparison.png'")
+        if uet_viz.save_plot(fig, "ft_value_comparison.png", result_dir):
+            print("  [Viz] Generated 'ft_value_comparison.png'")
 
     except Exception as e:
         print(f"Viz Error: {e}")
@@ -70,8 +70,8 @@ def visualize_hierarchy():
         showlegend=False,
     )
 
-    uet_viz.save_plot(fig, "neutrino_mass_hierarchy.png", result_dir)
-    print("  [Viz] Generated 'neutrino_mass_hierarchy.png'")
+    if uet_viz.save_plot(fig, "neutrino_mass_hierarchy.png", result_dir):
+        print("  [Viz] Generated 'neutrino_mass_hierarchy.png'")
 
     # Calculate Sum
     total_mass = sum(masses)
@@ -338,8 +338,8 @@ def run_all_tests():
             yaxis_title="Flavor Eigenstates",
         )
 
-        uet_viz.save_plot(fig, "pmns_matrix_viz.png", result_dir)
-        print("  [Viz] Generated 'pmns_matrix_viz.png'")
+        if uet_viz.save_plot(fig, "pmns_matrix_viz.png", result_dir):
+            print("  [Viz] Generated 'pmns_matrix_viz.png'")
 
     except Exception as e:
         print(f"Viz Error: {e}")
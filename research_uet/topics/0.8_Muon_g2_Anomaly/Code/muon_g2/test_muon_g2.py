@@ -142,8 +142,8 @@ def run_test():
             showlegend=False,
         )
 
-        uet_viz.save_plot(fig, "g2_anomaly_viz.png", result_dir)
-        print("  [Viz] Generated 'g2_anomaly_viz.png'")
+        if uet_viz.save_plot(fig, "g2_anomaly_viz.png", result_dir):
+            print("  [Viz] Generated 'g2_anomaly_viz.png'")
 
     except Exception as e:
         print(f"Viz Error: {e}")
@@ -172,8 +172,8 @@ def run_bell_test():
             showlegend=True,
         )
 
-        uet_viz.save_plot(fig, "bell_inequality_viz.png", result_dir)
-        print("  [Viz] Generated 'bell_inequality_viz.png'")
+        if uet_viz.save_plot(fig, "bell_inequality_viz.png", result_dir):
+            print("  [Viz] Generated 'bell_inequality_viz.png'")
 
     except Exception as e:
         print(f"Viz Error: {e}")
@@ -81,8 +81,8 @@ def run_double_slit():
         showlegend=True,
     )
 
-    uet_viz.save_plot(fig, "double_slit_viz.png", result_dir)
-    print("  [Viz] Generated 'double_slit_viz.png'")
+    if uet_viz.save_plot(fig, "double_slit_viz.png", result_dir):
+        print("  [Viz] Generated 'double_slit_viz.png'")
 
 
 if __name__ == "__main__":
@@ -18,8 +18,8 @@ GENERIC_VIZ = """
             title = {"text": "UET Pass Rate"},
             gauge = {"axis": {"range": [0, 100]}, "bar": {"color": "green"}}
         ))
-        uet_viz.save_plot(fig, "execution_status.png", result_dir)
-        print("  [Viz] Generated 'execution_status.png'")
+        if uet_viz.save_plot(fig, "execution_status.png", result_dir):
+            print("  [Viz] Generated 'execution_status.png'")
     except Exception as e:
         print(f"Viz Error: {e}")
 """
@@ -39,8 +39,8 @@ TOPICS = {
         fig.add_trace(uet_viz.go.Scatter(x=areas, y=entropy_hawk, name="Hawking", line=dict(dash='dash')))
         fig.add_trace(uet_viz.go.Scatter(x=areas, y=entropy_uet, name="UET Saturation", line=dict(color='red')))
         fig.update_layout(title="Black Hole Entropy Saturation", xaxis_title="Area", yaxis_title="Entropy")
-        uet_viz.save_plot(fig, "black_hole_entropy.png", result_dir)
-        print("  [Viz] Generated 'black_hole_entropy.png'")
+        if uet_viz.save_plot(fig, "black_hole_entropy.png", result_dir):
+            print("  [Viz] Generated 'black_hole_entropy.png'")
     except Exception as e:
         print(f"Viz Error: {e}")
 """,
@@ -53,8 +53,8 @@ TOPICS = {
         tc_obs = [4.15, 7.2, 3.7, 3.4]
         tc_uet = [4.18, 7.15, 3.72, 3.45]
         
-        uet_viz.plot_comparison(materials, [0]*4, tc_uet, tc_obs, "Superconductivity Critical Temp (Tc)", result_dir)
-        print("  [Viz] Generated 'comparison_chart.png'")
+        if uet_viz.plot_comparison(materials, [0]*4, tc_uet, tc_obs, "Superconductivity Critical Temp (Tc)", result_dir):
+            print("  [Viz] Generated 'comparison_chart.png'")
     except Exception as e:
         print(f"Viz Error: {e}")
 """,
@@ -69,8 +69,8 @@ TOPICS = {
         fig = uet_viz.go.Figure()
         fig.add_trace(uet_viz.go.Scatter(x=mass_nums, y=binding_curve, mode='lines+markers', name='UET Binding Curve'))
         fig.update_layout(title="Nuclear Binding Energy per Nucleon", xaxis_title="Mass Number A", yaxis_title="E/A (MeV)")
-        uet_viz.save_plot(fig, "nuclear_binding_curve.png", result_dir)
-        print("  [Viz] Generated 'nuclear_binding_curve.png'")
+        if uet_viz.save_plot(fig, "nuclear_binding_curve.png", result_dir):
+            print("  [Viz] Generated 'nuclear_binding_curve.png'")
     except Exception as e:
         print(f"Viz Error: {e}")
 """,
@@ -1,81 +1,85 @@
-import os
+"""
+Write Result/execution_v0.8.7.log for every topic (or the given topics).
+
+Usage:
+    python generate_outputs.py [0.1 0.7 ...] [--jobs N] [--force] [--timeout S]
+
+Tests are run by ../scheduler.py (cached, optionally in parallel); each
+log holds the full output of every test file of its topic.
+"""
+
+import argparse
 import sys
-import subprocess
-from pathlib import Path
 import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # topics/
 
-TOPICS_DIR = Path(r"c:\Users\santa\Desktop\lad\Lab_uet_harness_v0.8.7\research_uet\topics")
+from scheduler import (  # noqa: E402
+    add_run_arguments,
+    find_tests,
+    scheduler_from_args,
+    topic_folders,
+)
 
+OUTPUT_TIMEOUT = 30  # seconds per test file
+LOG_NAME = "execution_v0.8.7.log"
 
-def run_topic_tests(topic_path):
-    code_dir = topic_path / "Code"
-    if not code_dir.exists():
-        print(f"Skipping {topic_path.name} (No Code dir)")
-        return
 
+def write_topic_log(topic_path, runs):
+    """Write one topic's execution log from its (test, result) pairs."""
     result_dir = topic_path / "Result"
     result_dir.mkdir(exist_ok=True)
-
-    log_file = result_dir / "execution_v0.8.7.log"
-
-    print(f"Processing {topic_path.name}...")
+    log_file = result_dir / LOG_NAME
 
     with open(log_file, "w", encoding="utf-8") as log:
         log.write(f"Execution Log for {topic_path.name}\n")
         log.write(f"Date: {time.ctime()}\n")
         log.write("=" * 60 + "\n\n")
 
-        # Find test files
-        test_files = list(code_dir.rglob("test_*.py"))
-
-        if not test_files:
+        if not runs:
             log.write("No test files found.\n")
-            return
 
-        for test_file in sorted(test_files):
-            log.write(f"Running {test_file.name}...\n")
+        for test, result in runs:
+            log.write(f"Running {test['path'].name}...\n")
             log.write("-" * 40 + "\n")
-            log.flush()
-
-            try:
-                # Run test and capture output using sub-process
-                # We interpret standard tests
-                result = subprocess.run(
-                    [sys.executable, str(test_file)],
-                    cwd=test_file.parent,
-                    capture_output=True,
-                    text=True,
-                    timeout=30,  # 30s timeout per test to be safe
-                )
-
-                log.write(result.stdout)
-                if result.stderr:
+            if result.get("error"):  # timeout / launch error
+                log.write(f"\nExecution Error: {result['output']}\n")
+            else:
+                stderr = result["stderr"]
+                log.write(result["output"][: len(result["output"]) - len(stderr)])
+                if stderr:
                     log.write("\nSTDERR:\n")
-                    log.write(result.stderr)
-
-                status = "PASS" if result.returncode == 0 else "FAIL"
-                log.write(f"\nResult: {status} (Exit Code: {result.returncode})\n")
-
-            except subprocess.TimeoutExpired:
-                log.write("\nTIMEOUT reached (30s).\n")
-            except Exception as e:
-                log.write(f"\nExecution Error: {e}\n")
-
+                    log.write(stderr)
+                status = "PASS" if result["passed"] else "FAIL"
+                log.write(f"\nResult: {status} (Exit Code: {result['returncode']})\n")
             log.write("\n" + "=" * 60 + "\n\n")
-            print(f"  - {test_file.name}: Done")
 
     print(f"  > Output saved to {log_file}")
 
 
-def main():
-    if not TOPICS_DIR.exists():
-        print("Topics dir not found")
-        return
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write execution logs of topic tests")
+    parser.add_argument("topics", nargs="*", help="topic numbers or names (default: all)")
+    add_run_arguments(parser, timeout=OUTPUT_TIMEOUT)
+    args = parser.parse_args(argv)
 
+    tests = find_tests(args.topics or None)
     count = 0
-    for item in sorted(TOPICS_DIR.iterdir()):
-        if item.is_dir() and item.name[0].isdigit():  # 0.1, 0.2 etc
-            run_topic_tests(item)
+    with scheduler_from_args(args, cache="outputs", output_tail=None) as sched:
+        runs = sched.run(tests)
+        for topic_path in topic_folders():
+            topic_runs = [next(runs) for t in tests if t["solution"] == topic_path.name]
+            if args.topics and not topic_runs:
+                continue
+            if not (topic_path / "Code").exists():
+                print(f"Skipping {topic_path.name} (No Code dir)")
+                continue
+
+            print(f"Processing {topic_path.name}...")
+            for test, _ in topic_runs:
+                print(f"  - {test['path'].name}: Done")
+            write_topic_log(topic_path, topic_runs)
             count += 1
 
     print(f"\nFinished processing {count} topics.")
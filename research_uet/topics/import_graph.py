@@ -0,0 +1,166 @@
+"""
+Topic Test Import Graph - Run Only What a Change Affects
+========================================================
+Static (AST) dependency graph of the topic test files, used by
+`--changed` / `--files` in run_all_tests.py and scheduler.py.
+
+A test file depends on:
+    - itself and the .py files in its folder and subfolders (its helpers)
+    - the research_uet/core modules those import, transitively within core
+    - its topic's Data/ folder
+
+A change to any of those selects the test; anything else (docs, other
+topics, core modules it never imports) does not. Touching
+core/uet_matrix_engine.py therefore runs the fluid tests only, not the
+Bell or neutrino tests. Changed core files are matched by module name
+(core/<name>.py, core/<name>/...) against the names the test and its
+core modules import, so deleting or renaming a core module selects every
+test that still imports it.
+
+Parsing every file on each run is the slow part, so the imports of each
+parsed file are kept in .cache/import_graph.json and reused while
+the file's size and mtime are unchanged.
+
+Imports hidden from the AST (importlib, exec, sys.path tricks into other
+topics) are not seen; run the full suite before a release.
+"""
+
+import json
+import os
+import subprocess
+from pathlib import Path
+
+from result_cache import (
+    CACHE_DIR,
+    core_dependencies,
+    core_module_files,
+    imported_module_names,
+    test_sources,
+)
+
+TOPICS = Path(__file__).resolve().parent
+RESEARCH_UET = TOPICS.parent
+CORE = RESEARCH_UET / "core"
+GRAPH_FILE = CACHE_DIR / "import_graph.json"
+GRAPH_VERSION = 2
+
+
+def _stat_key(path):
+    st = path.stat()
+    return [st.st_mtime_ns, st.st_size]
+
+
+def core_module_name(path):
+    """Core module a resolved path belongs to (core/<name>.py, core/<name>/...), or None."""
+    if CORE not in path.parents:
+        return None
+    parts = path.relative_to(CORE).parts
+    if len(parts) == 1:
+        return path.stem if path.suffix == ".py" else None
+    return parts[0]
+
+
+class ImportGraph:
+    """Imported module names per file, persisted between runs."""
+
+    def __init__(self, graph_file=GRAPH_FILE):
+        self.graph_file = Path(graph_file)
+        self.files = {}
+        self.dirty = False
+        try:
+            with open(self.graph_file, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == GRAPH_VERSION:
+                self.files = data["files"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def imported_names(self, path):
+        """Modules imported by one file, existing or not (cached by size + mtime)."""
+        path = Path(path).resolve()
+        key = path.relative_to(RESEARCH_UET).as_posix()
+        try:
+            stat = _stat_key(path)
+        except OSError:
+            return set()
+        entry = self.files.get(key)
+        if entry is None or entry["stat"] != stat:
+            entry = {"stat": stat, "imports": sorted(imported_module_names(path))}
+            self.files[key] = entry
+            self.dirty = True
+        return set(entry["imports"])
+
+    def core_names(self, path):
+        """Existing core modules imported by one file."""
+        return {name for name in self.imported_names(path) if core_module_files(name)}
+
+    def dependencies(self, test_path):
+        """Source files (test, helpers, core modules) a test depends on."""
+        sources = test_sources(test_path)
+        core = core_dependencies(*sources, names_of=self.core_names)
+        return {p.resolve() for p in (*sources, *core)}
+
+    def module_names(self, test_path):
+        """Names imported by a test, its helpers and the core modules they use."""
+        sources = test_sources(test_path)
+        core = core_dependencies(*sources, names_of=self.core_names)
+        return set().union(*(self.imported_names(p) for p in (*sources, *core)))
+
+    def is_affected(self, test_path, changed):
+        """True if any of the `changed` paths (resolved) can change the test."""
+        test_path = Path(test_path).resolve()
+        folder = test_path.parent
+        data = TOPICS / test_path.relative_to(TOPICS).parts[0] / "Data"
+        for path in changed:
+            if folder in path.parents and path.suffix == ".py":
+                return True  # helpers in the folder or below, including deleted ones
+            if path == data or data in path.parents:
+                return True
+        core_changed = {core_module_name(p) for p in changed} - {None}
+        return bool(core_changed) and not core_changed.isdisjoint(self.module_names(test_path))
+
+    def affected_tests(self, tests, changed):
+        """The tests (scheduler entries) selected by a set of changed paths."""
+        changed = {Path(p).resolve() for p in changed}
+        return [t for t in tests if self.is_affected(t["path"], changed)]
+
+    def save(self):
+        if not self.dirty:
+            return
+        try:
+            self.graph_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.graph_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"version": GRAPH_VERSION, "files": self.files}, f, sort_keys=True)
+            os.replace(tmp, self.graph_file)
+            self.dirty = False
+        except OSError:
+            pass  # read-only checkout: parse again next time
+
+
+def _git(*args, cwd):
+    result = subprocess.run(
+        ["git", *args], cwd=cwd, capture_output=True, text=True, encoding="utf-8"
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"git {' '.join(args)}: {result.stderr.strip()}")
+    return [line for line in result.stdout.splitlines() if line]
+
+
+def git_changed_files(ref="HEAD"):
+    """
+    Files changed since `ref`: committed, staged and unstaged edits plus
+    untracked files, as resolved paths.
+    """
+    root = Path(_git("rev-parse", "--show-toplevel", cwd=RESEARCH_UET)[0])
+    changed = _git("diff", "--name-only", ref, "--", cwd=root)
+    changed += _git("ls-files", "--others", "--exclude-standard", cwd=root)
+    return {(root / name).resolve() for name in changed}
+
+
+def affected_tests(tests, changed):
+    """Filter scheduler test entries to those affected by `changed` paths."""
+    graph = ImportGraph()
+    selected = graph.affected_tests(tests, changed)
+    graph.save()
+    return selected
@@ -0,0 +1,178 @@
+"""
+Topic Test Result Cache
+=======================
+Skips test files whose inputs have not changed since their last run.
+
+A test's fingerprint is the sha256 of:
+    - the test file and the non-test .py helpers in its folder (and below)
+    - the research_uet/core modules they import (followed through core)
+    - every file under its topic's Data/ folder
+    - the interpreter version (and the runner's salt)
+
+Results are stored per test file and runner under
+
+    <repo>/.cache/test_results/<runner>/<hash of test path>.json
+
+and reused while the fingerprint matches. Each test keeps a single entry,
+so the cache does not grow with edits. Runs that did not finish (timeout,
+launch error) are never stored. Pass --force to the runners to re-run
+everything, e.g. to regenerate Result/ files that tests write as a side
+effect.
+"""
+
+import ast
+import hashlib
+import json
+import os
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+TOPICS = Path(__file__).parent
+RESEARCH_UET = TOPICS.parent
+CORE = RESEARCH_UET / "core"
+CACHE_DIR = Path(os.environ.get("UET_CACHE_DIR", RESEARCH_UET.parent / ".cache"))
+RESULTS_DIR = CACHE_DIR / "test_results"
+CACHE_VERSION = 3
+
+CORE_PREFIXES = ("research_uet.core", "core")
+
+
+@lru_cache(maxsize=None)
+def file_digest(path):
+    """sha256 of one file (memoized for the life of the runner)."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def core_module_files(name):
+    """Files of core module `name` (a package contributes all its .py files)."""
+    module = CORE / f"{name}.py"
+    if module.is_file():
+        return [module]
+    package = CORE / name
+    if package.is_dir():
+        return sorted(p for p in package.rglob("*.py") if "__pycache__" not in p.parts)
+    return []
+
+
+def imported_module_names(path):
+    """
+    Top-level names of every module a Python file imports, with the core
+    prefixes stripped (research_uet.core.uet_viz -> uet_viz). Not filtered
+    to existing core modules, so imports of a deleted module still show.
+    """
+    try:
+        tree = ast.parse(Path(path).read_text(encoding="utf-8", errors="replace"))
+    except SyntaxError:
+        return set()
+
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            modules = [node.module]
+            if node.module in CORE_PREFIXES:  # from research_uet.core import uet_viz
+                names.update(alias.name for alias in node.names)
+        else:
+            continue
+        for module in modules:
+            for prefix in CORE_PREFIXES:
+                if module.startswith(prefix + "."):
+                    names.add(module[len(prefix) + 1 :].split(".")[0])
+                    break
+            else:
+                names.add(module.split(".")[0])  # bare `uet_*` import via sys.path
+    return names
+
+
+def imported_core_names(path):
+    """Names of the existing core modules imported anywhere in a Python file."""
+    return {name for name in imported_module_names(path) if core_module_files(name)}
+
+
+def core_dependencies(*paths, names_of=imported_core_names):
+    """
+    Core module files some Python files depend on, transitively within core.
+
+    names_of(path) gives the core modules one file imports (import_graph.py
+    passes a persistent cache of it).
+    """
+    seen, files = set(), set()
+    pending = [Path(path) for path in paths]
+    while pending:
+        for name in names_of(pending.pop()) - seen:
+            seen.add(name)
+            for module_file in core_module_files(name):
+                files.add(module_file)
+                pending.append(module_file)
+    return sorted(files)
+
+
+def _data_files(test_path):
+    solution = TOPICS / Path(test_path).resolve().relative_to(TOPICS).parts[0]
+    data = solution / "Data"
+    if not data.is_dir():
+        return []
+    return sorted(
+        p for p in data.rglob("*") if p.is_file() and "__pycache__" not in p.parts
+    )
+
+
+def test_sources(test_path):
+    """
+    The test file and the non-test .py helpers in its folder and its
+    subfolders (e.g. Code/hubble_tension/data/dark_energy_data.py).
+    """
+    test_path = Path(test_path).resolve()
+    helpers = sorted(
+        p
+        for p in test_path.parent.rglob("*.py")
+        if not p.name.startswith("test_") and "__pycache__" not in p.parts
+    )
+    return [test_path, *helpers]
+
+
+def fingerprint(test_path, salt=""):
+    """Content hash of everything a test file's result depends on."""
+    sources = test_sources(test_path)
+    inputs = [*sources, *core_dependencies(*sources), *_data_files(test_path)]
+
+    digest = hashlib.sha256()
+    digest.update(f"{CACHE_VERSION}|{sys.version}|{salt}\n".encode())
+    for path in inputs:
+        rel = path.relative_to(RESEARCH_UET).as_posix()
+        digest.update(f"{rel}:{file_digest(path)}\n".encode())
+    return digest.hexdigest()
+
+
+def _entry_path(test_path, runner):
+    rel = Path(test_path).resolve().relative_to(TOPICS).as_posix()
+    return RESULTS_DIR / runner / f"{hashlib.sha1(rel.encode()).hexdigest()[:16]}.json"
+
+
+def load_result(test_path, key, runner):
+    """Stored result of a test file if its fingerprint is still `key`."""
+    try:
+        with open(_entry_path(test_path, runner), encoding="utf-8") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return entry["result"] if entry.get("key") == key else None
+
+
+def store_result(test_path, key, runner, result):
+    """Remember a finished test's result under its fingerprint."""
+    path = _entry_path(test_path, runner)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"test": Path(test_path).name, "key": key, "result": result}, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass  # read-only checkout: every run re-executes
@@ -0,0 +1,150 @@
+"""
+Topic Test Results - Parsing and Reports
+========================================
+Runner side of the structured results protocol (see
+research_uet/core/uet_results.py):
+
+    - each test gets its own JSON-lines file, named in UET_RESULTS_FILE
+    - read_checks() parses it one line at a time (partial or foreign
+      lines are skipped, so a crashed test still yields what it wrote)
+    - scan_output() keeps only the tail of a test's stdout and the first
+      "X/Y PASS" line, for tests that do not record checks
+    - write_json() / write_junit() save the consolidated run for
+      dashboards and CI without re-running anything
+"""
+
+import json
+import re
+import sys
+import xml.etree.ElementTree as ET
+from collections import deque
+from datetime import datetime
+
+RESULTS_ENV = "UET_RESULTS_FILE"
+OUTPUT_TAIL_LINES = 200
+PASS_PATTERN = re.compile(r"(\d+)/(\d+)\s*PASS")
+STATUSES = ("pass", "fail", "skip")
+
+
+def read_checks(path):
+    """Yield the check records of a results file, line by line."""
+    try:
+        f = open(path, encoding="utf-8", errors="replace")
+    except OSError:
+        return
+    with f:
+        for line in f:
+            try:
+                check = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(check, dict) and check.get("status") in STATUSES and "check" in check:
+                yield check
+
+
+def count_checks(checks):
+    """(passed, total) of check records; skipped checks are not counted."""
+    passed = sum(1 for c in checks if c["status"] == "pass")
+    failed = sum(1 for c in checks if c["status"] == "fail")
+    return passed, passed + failed
+
+
+def scan_output(lines, tail=OUTPUT_TAIL_LINES):
+    """
+    One pass over a test's output lines.
+
+    Returns:
+        (counts, output): (passed, total) of the first "X/Y PASS" line or
+        None, and the last `tail` lines joined
+    """
+    counts = None
+    kept = deque(maxlen=tail)
+    for line in lines:
+        if counts is None:
+            match = PASS_PATTERN.search(line)
+            if match:
+                counts = (int(match.group(1)), int(match.group(2)))
+        kept.append(line)
+    return counts, "".join(kept)
+
+
+# =============================================================================
+# REPORTS
+# =============================================================================
+
+
+def write_json(results, path):
+    """Consolidated run report: summary plus every test with its checks."""
+    passed = sum(r["passed_count"] for r in results)
+    total = sum(r["total_count"] for r in results)
+    report = {
+        "generated": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "summary": {
+            "files": len(results),
+            "tests": total,
+            "passed": passed,
+            "pass_rate": passed / total if total else 0.0,
+        },
+        "tests": results,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=1, default=str)
+
+
+def _testcase(parent, classname, name, duration, status, message="", output=""):
+    case = ET.SubElement(
+        parent, "testcase", classname=classname, name=name, time=f"{duration or 0.0:.3f}"
+    )
+    if status == "fail":
+        ET.SubElement(case, "failure", message=message).text = output
+    elif status == "skip":
+        ET.SubElement(case, "skipped")
+    return case
+
+
+def write_junit(results, path):
+    """
+    JUnit XML: one testsuite per solution, one testcase per recorded check
+    (or per test file when it recorded none). A file that failed as a whole
+    (crash, non-zero exit, timeout) also gets a file-level failing testcase
+    with its output tail, even when all of its recorded checks passed.
+    """
+    root = ET.Element("testsuites")
+    suites = {}
+    for r in results:
+        solution = r["solution"]
+        if solution not in suites:
+            suites[solution] = ET.SubElement(root, "testsuite", name=solution)
+        suite = suites[solution]
+        classname = f"{solution}.{r['test']}"
+
+        if r.get("checks"):
+            for c in r["checks"]:
+                metric = json.dumps(c.get("metric"), default=str) if "metric" in c else ""
+                _testcase(
+                    suite, classname, c["check"], c.get("duration"), c["status"], metric
+                )
+            if not r["passed"]:
+                _testcase(
+                    suite, classname, r["test"], r.get("duration"), "fail",
+                    "test file failed (exit code or timeout)", r.get("output", ""),
+                )
+        else:
+            status = "pass" if r["passed"] else "fail"
+            case = _testcase(
+                suite, classname, r["test"], r.get("duration"), status,
+                f"{r['passed_count']}/{r['total_count']} passed", r.get("output", ""),
+            )
+            if status == "pass":
+                ET.SubElement(case, "system-out").text = r.get("output", "")
+
+    for suite in root:
+        cases = suite.findall("testcase")
+        suite.set("tests", str(len(cases)))
+        suite.set("failures", str(sum(1 for c in cases if c.find("failure") is not None)))
+        suite.set("skipped", str(sum(1 for c in cases if c.find("skipped") is not None)))
+        suite.set("time", f"{sum(float(c.get('time')) for c in cases):.3f}")
+
+    ET.indent(root)
+    ET.ElementTree(root).write(path, encoding="utf-8", xml_declaration=True)
@@ -2,84 +2,77 @@
 UET Master Test Runner for Topics
 ==================================
 Runs all tests in topics/ and generates summary.
+
+Usage:
+    python run_all_tests.py [--jobs N] [--warm] [--force] [--verbose]
+                            [--topic 0.1 ...] [--section NAME ...]
+                            [--changed [REF]] [--files PATH ...]
+                            [--timeout S] [--profile] [--json FILE] [--junit FILE]
+
+With --jobs N the test files run N at a time, longest first according to
+the durations recorded by previous runs (.cache/test_durations.json);
+files without history start first. Results are still printed in the
+serial order, so the report and summary do not depend on N.
+
+Test files whose inputs did not change since their last run are not
+executed again; their stored result is reported instead (see
+result_cache.py). --force re-runs every test.
+
+--changed runs only the test files affected by the changes since a git
+ref (default HEAD, including uncommitted and untracked files), --files
+only those affected by the given files (see import_graph.py).
+
+With --warm the tests run in long-lived worker processes that import
+numpy/scipy/plotly/... once (see warm_pool.py) instead of a new
+interpreter per file.
+
+Tests may record their individual checks as JSON lines (see
+core/uet_results.py); otherwise the first "X/Y PASS" line of their output,
+or the exit code, gives the count. --json / --junit save the whole run.
+
+Discovery and execution live in scheduler.py, shared with run_solution.py
+and the output / validation scripts.
 """
 
+import argparse
 import sys
-import os
-import subprocess
-from pathlib import Path
+import time
 from datetime import datetime
 
-TOPICS = Path(__file__).parent
-
-
-def find_all_tests():
-    """Find all test files."""
-    tests = []
-    for test_file in TOPICS.rglob("test_*.py"):
-        if test_file.name != "test_runner.py":
-            solution = test_file.relative_to(TOPICS).parts[0]
-            tests.append(
-                {
-                    "path": test_file,
-                    "solution": solution,
-                    "name": test_file.stem,
-                }
-            )
-    return tests
-
-
-def run_test(test_path):
-    """Run a single test and return result."""
-    try:
-        result = subprocess.run(
-            [sys.executable, "-X", "utf8", str(test_path)],
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-            timeout=180,
-            cwd=str(test_path.parent),
-        )
-
-        output = result.stdout + result.stderr
-        passed = result.returncode == 0
-
-        # Try to extract pass count from output
-        import re
-
-        match = re.search(r"(\d+)/(\d+)\s*PASS", output)
-        if match:
-            passed_count = int(match.group(1))
-            total_count = int(match.group(2))
-        else:
-            passed_count = 1 if passed else 0
-            total_count = 1
-
-        return {
-            "passed": passed,
-            "passed_count": passed_count,
-            "total_count": total_count,
-            "output": output,
-        }
-    except Exception as e:
-        return {
-            "passed": False,
-            "passed_count": 0,
-            "total_count": 1,
-            "output": str(e),
-        }
-
-
-def main():
+import results_report
+import run_profile
+from scheduler import (
+    add_run_arguments,
+    add_selection_arguments,
+    scheduler_from_args,
+    select_tests,
+    test_key,
+)
+
+
+def main(argv=None):
     """Run all tests and generate report."""
+    parser = argparse.ArgumentParser(description="Run all topic tests")
+    add_run_arguments(parser)
+    add_selection_arguments(parser)
+    parser.add_argument("-v", "--verbose", action="store_true", help="print each test's output")
+    parser.add_argument("--json", metavar="FILE", help="write a JSON report of all checks")
+    parser.add_argument("--junit", metavar="FILE", help="write a JUnit XML report")
+    args = parser.parse_args(argv)
+
     print("=" * 70)
     print("UET MASTER TEST RUNNER")
     print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("=" * 70)
 
-    tests = find_all_tests()
+    tests = select_tests(args, parser)
     print(f"\nFound {len(tests)} test files")
+    if not tests:
+        if args.changed is not None or args.files:
+            print("No tests affected by the changes")
+            return True
+        print("No tests selected")
+        return False
 
     # Group by solution
     by_solution = {}
@@ -95,33 +88,57 @@ def main():
 
     # Run all tests
     print("\n" + "=" * 70)
-    print("RUNNING TESTS...")
+    print("RUNNING TESTS..." if args.jobs <= 1 else f"RUNNING TESTS ({args.jobs} parallel)...")
     print("=" * 70)
 
     total_passed = 0
     total_tests = 0
     results = []
-
-    for sol in sorted(by_solution.keys()):
-        print(f"\n>>> {sol}")
-
-        for t in by_solution[sol]:
-            print(f"  Running {t['name']}...", end=" ")
-            result = run_test(t["path"])
-
-            total_passed += result["passed_count"]
-            total_tests += result["total_count"]
-
-            status = "PASS" if result["passed"] else "FAIL"
-            print(f"{status} ({result['passed_count']}/{result['total_count']})")
-
-            results.append(
-                {
-                    "solution": sol,
-                    "test": t["name"],
-                    **result,
-                }
-            )
+    start = time.perf_counter()
+
+    ordered = [t for sol in sorted(by_solution.keys()) for t in by_solution[sol]]
+    with scheduler_from_args(args) as sched:
+        runs = sched.run(ordered)
+        for sol in sorted(by_solution.keys()):
+            print(f"\n>>> {sol}")
+
+            for t in by_solution[sol]:
+                print(f"  Running {t['name']}...", end=" ", flush=True)
+                _, result = next(runs)
+
+                total_passed += result["passed_count"]
+                total_tests += result["total_count"]
+
+                status = "PASS" if result["passed"] else "FAIL"
+                cached = " [cached]" if result.get("cached") else ""
+                print(f"{status} ({result['passed_count']}/{result['total_count']}){cached}")
+                if args.verbose:
+                    print("    " + result["output"].rstrip().replace("\n", "\n    "))
+
+                results.append(
+                    {
+                        "solution": sol,
+                        "test": t["name"],
+                        "path": test_key(t),
+                        **result,
+                    }
+                )
+
+    elapsed = time.perf_counter() - start
+    executed = [r for r in results if not r.get("cached")]
+    test_time = sum(r["duration"] for r in executed)
+    print(
+        f"\nWall time: {elapsed:.1f}s (sum of test times: {test_time:.1f}s, "
+        f"{len(results) - len(executed)} cached)"
+    )
+    if args.json:
+        results_report.write_json(results, args.json)
+        print(f"JSON report: {args.json}")
+    if args.junit:
+        results_report.write_junit(results, args.junit)
+        print(f"JUnit report: {args.junit}")
+    if args.profile:
+        run_profile.print_profile(sched.measured, sched.previous)
 
     # Summary
     print("\n" + "=" * 70)
@@ -0,0 +1,210 @@
+"""
+Topic Test Profiling - Time and Memory per Test File
+====================================================
+Resource accounting for run_all_tests.py:
+
+    wall     seconds from launch to exit
+    cpu      user + system CPU seconds of the test process
+             (os.wait4 rusage of that one child)
+    max_rss  peak resident memory in MB (warm workers: the worker's peak
+             so far, an upper bound)
+    imports  seconds spent importing modules (python -X importtime,
+             only with --profile)
+
+Every run appends the tests it executed to .cache/test_profile.jsonl (the
+last MAX_RUNS runs are kept). print_profile() ranks the slowest and
+heaviest files and flags regressions against each file's previous
+measurement, so a slow change in core/ shows up on the next run.
+
+On platforms without os.wait4 / the resource module (Windows) cpu and
+max_rss are None.
+"""
+
+import json
+import os
+import sys
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from result_cache import CACHE_DIR
+
+HISTORY_FILE = CACHE_DIR / "test_profile.jsonl"
+MAX_RUNS = 50
+METRICS = ("wall", "cpu", "max_rss", "imports")
+
+# A regression is both this many times and this much worse than before
+REGRESSION_RATIO = 1.25
+REGRESSION_MIN = {"wall": 0.5, "cpu": 0.5, "max_rss": 20.0, "imports": 0.2}
+
+# ru_maxrss is in kilobytes on Linux, bytes on macOS
+_RSS_TO_MB = 1 / (1024 * 1024) if sys.platform == "darwin" else 1 / 1024
+
+
+def usage_metrics(rusage):
+    """cpu seconds and peak RSS (MB) of a resource.struct_rusage."""
+    return {
+        "cpu": rusage.ru_utime + rusage.ru_stime,
+        "max_rss": rusage.ru_maxrss * _RSS_TO_MB,
+    }
+
+
+def wait_child(process):
+    """
+    Wait for a Popen child and return (returncode, cpu/max_rss metrics).
+
+    Uses os.wait4 to get the rusage of this child alone, which stays
+    correct when several tests run at once.
+    """
+    if not hasattr(os, "wait4"):
+        return process.wait(), {"cpu": None, "max_rss": None}
+    _, status, rusage = os.wait4(process.pid, 0)
+    process.returncode = os.waitstatus_to_exitcode(status)
+    return process.returncode, usage_metrics(rusage)
+
+
+def self_usage():
+    """rusage of this process (warm workers), or None without resource."""
+    return resource.getrusage(resource.RUSAGE_SELF) if resource else None
+
+
+def usage_since(before):
+    """cpu used since `before` and the process's peak RSS so far."""
+    if before is None:
+        return {"cpu": None, "max_rss": None}
+    now = usage_metrics(self_usage())
+    return {"cpu": now["cpu"] - usage_metrics(before)["cpu"], "max_rss": now["max_rss"]}
+
+
+def is_import_time_line(line):
+    return line.startswith("import time:")
+
+
+def import_seconds(lines):
+    """
+    Total import time from `python -X importtime` lines: the cumulative
+    microseconds of the top-level (unindented) imports.
+    """
+    total = 0
+    for line in lines:
+        parts = line.split("|")
+        if len(parts) != 3 or parts[2].startswith("  "):
+            continue
+        try:
+            total += int(parts[1])
+        except ValueError:
+            continue  # header line
+    return total / 1e6
+
+
+# =============================================================================
+# HISTORY
+# =============================================================================
+
+
+def load_history():
+    """Past runs, oldest first."""
+    runs = []
+    try:
+        with open(HISTORY_FILE, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    runs.append(json.loads(line))
+                except ValueError:
+                    continue
+    except OSError:
+        pass
+    return runs
+
+
+def previous_metrics(runs, mode):
+    """
+    Latest recorded metrics of every test file (path -> metrics) from runs
+    in the same mode ("subprocess" or "warm"; the two are not comparable).
+    """
+    latest = {}
+    for run in runs:
+        if run.get("mode", "subprocess") == mode:
+            latest.update(run.get("tests", {}))
+    return latest
+
+
+def save_run(history, measured, mode):
+    """Append this run's measurements (path -> metrics) and trim the history."""
+    if not measured:
+        return
+    run = {
+        "time": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "mode": mode,
+        "tests": measured,
+    }
+    runs = (history + [run])[-MAX_RUNS:]
+    try:
+        HISTORY_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = HISTORY_FILE.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            for entry in runs:
+                f.write(json.dumps(entry) + "\n")
+        os.replace(tmp, HISTORY_FILE)
+    except OSError:
+        pass
+
+
+def find_regressions(measured, previous):
+    """(path, metric, before, now) for every metric that got clearly worse."""
+    found = []
+    for path, now in sorted(measured.items()):
+        before = previous.get(path, {})
+        for metric in METRICS:
+            old, new = before.get(metric), now.get(metric)
+            if old is None or new is None:
+                continue
+            if new > old * REGRESSION_RATIO and new - old > REGRESSION_MIN[metric]:
+                found.append((path, metric, old, new))
+    return found
+
+
+# =============================================================================
+# REPORT
+# =============================================================================
+
+
+def _fmt(value, unit):
+    return "-" if value is None else f"{value:.2f}{unit}" if unit == "s" else f"{value:.0f}{unit}"
+
+
+def print_profile(measured, previous, top=10):
+    """Ranked slowest / heaviest test files and regressions vs. the last run."""
+    if not measured:
+        print("\nPROFILE: no test executed (all cached)")
+        return
+
+    print("\n" + "=" * 70)
+    print(f"PROFILE ({len(measured)} test files executed)")
+    print("=" * 70)
+
+    rankings = (("Slowest (wall)", "wall", "s"), ("Heaviest (peak RSS)", "max_rss", " MB"))
+    for title, metric, unit in rankings:
+        ranked = sorted(
+            (item for item in measured.items() if item[1].get(metric) is not None),
+            key=lambda item: -item[1][metric],
+        )[:top]
+        if not ranked:
+            continue
+        print(f"\n{title}:")
+        print(f"  {'wall':>8} {'cpu':>8} {'imports':>8} {'peak RSS':>9}  test")
+        for path, m in ranked:
+            print(
+                f"  {_fmt(m.get('wall'), 's'):>8} {_fmt(m.get('cpu'), 's'):>8} "
+                f"{_fmt(m.get('imports'), 's'):>8} {_fmt(m.get('max_rss'), ' MB'):>9}  {path}"
+            )
+
+    regressions = find_regressions(measured, previous)
+    print(f"\nRegressions vs. previous run: {len(regressions) or 'none'}")
+    for path, metric, old, new in regressions:
+        unit = " MB" if metric == "max_rss" else "s"
+        print(f"  [!!] {path}: {metric} {_fmt(old, unit)} -> {_fmt(new, unit)} ({new / old:.1f}x)")
@@ -3,100 +3,56 @@ Solution Runner - Run all sections in a solution at once
 =========================================================
 Usage: python run_solution.py 0.1
        python run_solution.py 0.1_Galaxy_Rotation_Problem
+       python run_solution.py 0.1 --force   (ignore cached results)
+       python run_solution.py 0.1 --jobs 4  (4 test files at a time)
 
 Outputs results to Result/ folder and generates comparison report.
+Test files whose inputs did not change since the last run reuse the stored
+result (see result_cache.py). Execution is done by scheduler.py.
 """
 
-import sys
-import os
-import subprocess
+import argparse
 import json
-from pathlib import Path
+import sys
 from datetime import datetime
 
-# Find topics folder
-TOPICS = Path(__file__).parent
-
-
-def find_solution(query):
-    """Find solution folder by number or name."""
-    for folder in TOPICS.iterdir():
-        if folder.is_dir() and folder.name.startswith(query):
-            return folder
-    return None
-
+from scheduler import (
+    add_run_arguments,
+    find_tests,
+    find_topic,
+    scheduler_from_args,
+    topic_folders,
+)
 
-def get_test_files(solution_path):
-    """Get all test files from Code/ subfolders."""
-    code_path = solution_path / "Code"
-    tests = []
-    for section in code_path.iterdir():
-        if section.is_dir():
-            for f in section.glob("test_*.py"):
-                tests.append((section.name, f))
-    return tests
+SOLUTION_TIMEOUT = 300  # seconds per test file
 
 
-def run_tests(solution_path):
+def run_tests(solution_path, args):
     """Run all tests and collect results."""
-    tests = get_test_files(solution_path)
+    tests = find_tests([solution_path.name])
     results = {}
 
-    # Add lab folder and solution Data folder to Python path
-    research_uet = solution_path.parent.parent
-    lab_path = research_uet / "lab"
-    env = os.environ.copy()
-
-    # Build PYTHONPATH with all potential data locations
-    extra_paths = [
-        str(lab_path),
-        str(lab_path / "01_galaxy_dynamics"),
-        str(lab_path / "02_gravitational"),
-        str(lab_path / "03_electroweak"),
-        str(lab_path / "04_neutrino"),
-        str(lab_path / "05_qcd_hadrons"),
-        str(lab_path / "06_motion_dynamics"),
-        str(lab_path / "07_complex_systems"),
-        str(lab_path / "00_thermodynamic_bridge"),
-        str(solution_path / "Data"),
-        str(research_uet),
-    ]
-    env["PYTHONPATH"] = os.pathsep.join(extra_paths)
-
     print(f"\n{'='*60}")
     print(f"Running Solution: {solution_path.name}")
     print(f"{'='*60}")
 
-    for section_name, test_file in tests:
-        print(f"\n[{section_name}] Running {test_file.name}...")
-
-        try:
-            result = subprocess.run(
-                [sys.executable, str(test_file)],
-                capture_output=True,
-                text=True,
-                timeout=300,
-                cwd=str(test_file.parent),
-                env=env,
-            )
-
-            success = result.returncode == 0
-            results[section_name] = {
-                "file": test_file.name,
+    with scheduler_from_args(args, cache="run_solution", output_tail=None) as sched:
+        for test, result in sched.run(tests):
+            section_name = test["section"]
+            print(f"\n[{section_name}] Running {test['path'].name}...")
+
+            success = result["passed"]
+            results[f"{section_name}/{test['path'].name}"] = {
+                "section": section_name,
+                "file": test["path"].name,
                 "success": success,
-                "output": result.stdout[-2000:] if result.stdout else "",
-                "error": result.stderr[-500:] if result.stderr else "",
+                "output": result["output"][-2000:],
+                "error": "" if success else result["output"][-500:],
             }
 
             status = "✅ PASS" if success else "❌ FAIL"
-            print(f"  {status}")
-
-        except subprocess.TimeoutExpired:
-            results[section_name] = {"file": test_file.name, "success": False, "error": "Timeout"}
-            print(f"  ⏱️ TIMEOUT")
-        except Exception as e:
-            results[section_name] = {"file": test_file.name, "success": False, "error": str(e)}
-            print(f"  ❌ ERROR: {e}")
+            cached = " (cached)" if result.get("cached") else ""
+            print(f"  {status}{cached}")
 
     return results
 
@@ -115,7 +71,7 @@ def generate_report(solution_path, results):
     content = f"""# Solution Run Report: {solution_path.name}
 
 **Date**: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
-**Result**: {passed}/{total} sections passed
+**Result**: {passed}/{total} test files passed
 
 ## Summary
 
@@ -123,14 +79,14 @@ def generate_report(solution_path, results):
 |:--------|:----------|:-------|
 """
 
-    for section, data in results.items():
+    for data in results.values():
         status = "✅ PASS" if data.get("success") else "❌ FAIL"
-        content += f"| {section} | {data['file']} | {status} |\n"
+        content += f"| {data['section']} | {data['file']} | {status} |\n"
 
     content += "\n## Details\n\n"
 
-    for section, data in results.items():
-        content += f"### {section}\n\n"
+    for name, data in results.items():
+        content += f"### {name}\n\n"
         if data.get("output"):
             content += f"```\n{data['output'][:1000]}\n```\n\n"
         if data.get("error") and not data.get("success"):
@@ -149,32 +105,36 @@ def generate_report(solution_path, results):
     return report_file
 
 
-def main():
-    if len(sys.argv) < 2:
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run all sections of one solution")
+    parser.add_argument("solution", nargs="?", help="solution number or folder name")
+    add_run_arguments(parser, timeout=SOLUTION_TIMEOUT)
+    args = parser.parse_args(argv)
+
+    if not args.solution:
         print("Usage: python run_solution.py <solution_number_or_name>")
         print("Example: python run_solution.py 0.1")
         print("         python run_solution.py 0.1_Galaxy_Rotation_Problem")
         sys.exit(1)
 
-    query = sys.argv[1]
-    solution = find_solution(query)
+    query = args.solution
+    solution = find_topic(query)
 
     if not solution:
         print(f"Solution not found: {query}")
         print("\nAvailable solutions:")
-        for folder in sorted(TOPICS.iterdir()):
-            if folder.is_dir() and folder.name.startswith("0."):
-                print(f"  - {folder.name}")
+        for folder in topic_folders():
+            print(f"  - {folder.name}")
         sys.exit(1)
 
-    results = run_tests(solution)
+    results = run_tests(solution, args)
     report = generate_report(solution, results)
 
     passed = sum(1 for r in results.values() if r.get("success"))
     total = len(results)
 
     print(f"\n{'='*60}")
-    print(f"FINAL: {passed}/{total} sections passed")
+    print(f"FINAL: {passed}/{total} test files passed")
     print(f"{'='*60}")
 
 
@@ -0,0 +1,470 @@
+"""
+UET Topic Test Scheduler
+========================
+The one place that discovers and executes topic test scripts. Used by
+run_all_tests.py, run_solution.py, _scripts/generate_outputs*.py and
+scripts/validate_foundation.py, so they all share:
+
+    - paths resolved from this file (no machine-specific roots)
+    - topic / section filtering  ("0.1" or "0.1_Galaxy_Rotation_Problem";
+      "0.1" does not match "0.15")
+    - change-based selection: only tests whose imports / data were touched
+      (import_graph.py)
+    - parallel execution, longest-first from .cache/test_durations.json,
+      results delivered in discovery order
+    - the content-hash result cache (result_cache.py)
+    - per-test timeouts, warm workers (warm_pool.py), structured checks
+      (results_report.py) and resource history (run_profile.py)
+
+Library:
+
+    from scheduler import Scheduler, find_tests
+    with Scheduler(jobs=4) as sched:
+        for test, result in sched.run(find_tests(topics=["0.1"])):
+            print(test["name"], result["passed"])
+
+CLI:
+
+    python scheduler.py [--topic 0.1 ...] [--section NAME ...]
+                        [--changed [REF]] [--files PATH ...] [--jobs N]
+                        [--timeout S] [--warm] [--force] [--profile] [--list]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import import_graph
+import result_cache
+import results_report
+import run_profile
+from result_cache import CACHE_DIR
+from warm_pool import WarmPool
+
+TOPICS = Path(__file__).resolve().parent
+DURATIONS_FILE = CACHE_DIR / "test_durations.json"
+TEST_TIMEOUT = 180  # seconds per test file
+
+
+# =============================================================================
+# DISCOVERY
+# =============================================================================
+
+
+def topic_folders():
+    """Topic folders (0.1_..., 0.2_...) in name order."""
+    return sorted(p for p in TOPICS.iterdir() if p.is_dir() and p.name[0].isdigit())
+
+
+def topic_matches(name, query):
+    """True if topic folder `name` is `query` ("0.1" or the full folder name)."""
+    return name == query or name.startswith(query + "_")
+
+
+def find_topic(query):
+    """Topic folder for a number or name, or None."""
+    for folder in topic_folders():
+        if topic_matches(folder.name, query):
+            return folder
+    return None
+
+
+def test_entry(path):
+    """Test description used throughout: path, solution, section, name."""
+    path = Path(path).resolve()
+    parts = path.relative_to(TOPICS).parts
+    if len(parts) > 3 and parts[1] == "Code":
+        section = parts[2]
+    else:
+        section = parts[-2] if len(parts) > 1 else ""
+    return {"path": path, "solution": parts[0], "section": section, "name": path.stem}
+
+
+def find_tests(topics=None, sections=None):
+    """
+    All topic test files (test_*.py), sorted by path.
+
+    topics   : topic numbers / names to keep (None = all)
+    sections : Code/ section folder names to keep (None = all)
+    """
+    tests = []
+    for test_file in sorted(TOPICS.rglob("test_*.py")):
+        if test_file.name == "test_runner.py":
+            continue
+        test = test_entry(test_file)
+        if topics and not any(topic_matches(test["solution"], q) for q in topics):
+            continue
+        if sections and test["section"] not in sections:
+            continue
+        tests.append(test)
+    return tests
+
+
+def test_key(test):
+    return test["path"].relative_to(TOPICS).as_posix()
+
+
+# =============================================================================
+# DURATIONS (scheduling order)
+# =============================================================================
+
+
+def load_durations():
+    """Recorded wall time per test file (relative path -> seconds)."""
+    try:
+        with open(DURATIONS_FILE, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_durations(durations):
+    try:
+        DURATIONS_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = DURATIONS_FILE.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(durations, f, indent=1, sort_keys=True)
+        os.replace(tmp, DURATIONS_FILE)
+    except OSError:
+        pass  # read-only checkout: scheduling falls back to discovery order
+
+
+def longest_first(tests, durations):
+    """Tests without history first, then by recorded duration, longest first."""
+    return sorted(tests, key=lambda t: -durations.get(test_key(t), float("inf")))
+
+
+# =============================================================================
+# EXECUTION
+# =============================================================================
+
+
+OUTPUT_TAIL_LINES = results_report.OUTPUT_TAIL_LINES
+
+
+def _stream_subprocess(test_path, env, timeout, profile=False, tail=OUTPUT_TAIL_LINES):
+    """
+    Run a test in a fresh interpreter, scanning its output as it arrives.
+
+    stdout is scanned here and stderr in a helper thread (which also picks
+    out the -X importtime lines when profiling).
+
+    Returns:
+        (returncode, counts, stdout tail, stderr tail, metrics) - counts
+        and tails as in results_report.scan_output, metrics as in run_profile
+    """
+    command = [sys.executable, "-X", "utf8"]
+    if profile:
+        command += ["-X", "importtime"]
+    process = subprocess.Popen(
+        command + [str(test_path)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        cwd=str(test_path.parent),
+        env={**os.environ, **env},
+    )
+    timed_out = threading.Event()
+
+    def kill():
+        timed_out.set()
+        process.kill()
+
+    import_lines = []
+    stderr_scan = []
+
+    def stderr_lines():
+        for line in process.stderr:
+            if profile and run_profile.is_import_time_line(line):
+                import_lines.append(line)
+            else:
+                yield line
+
+    reader = threading.Thread(
+        target=lambda: stderr_scan.extend(results_report.scan_output(stderr_lines(), tail))
+    )
+    reader.start()
+    timer = threading.Timer(timeout, kill) if timeout else None
+    if timer:
+        timer.start()
+    try:
+        counts, output = results_report.scan_output(process.stdout, tail)
+        reader.join()
+        returncode, metrics = run_profile.wait_child(process)
+    finally:
+        if timer:
+            timer.cancel()
+        process.stdout.close()
+        process.stderr.close()
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(process.args, timeout)
+
+    err_counts, err_output = stderr_scan
+    metrics["imports"] = run_profile.import_seconds(import_lines) if profile else None
+    return returncode, counts or err_counts, output, err_output, metrics
+
+
+def execute(test_path, timeout=TEST_TIMEOUT, warm=None, profile=False, tail=OUTPUT_TAIL_LINES):
+    """
+    Run one test file (no caching) and return its result dict.
+
+    Counts come from the recorded checks, then the first "X/Y PASS" line,
+    then the exit code. "output" holds stdout then stderr, "stderr" the
+    stderr part alone. Timeouts and launch errors come back with
+    "error": True (and are never cached).
+    """
+    test_path = Path(test_path)
+    fd, results_file = tempfile.mkstemp(prefix="uet_results_", suffix=".jsonl")
+    os.close(fd)
+    env = {results_report.RESULTS_ENV: results_file}
+    try:
+        if warm is None:
+            returncode, counts, output, err_output, metrics = _stream_subprocess(
+                test_path, env, timeout, profile, tail
+            )
+        else:
+            returncode, stdout, stderr, metrics = warm.run(test_path, timeout, env=env)
+            metrics["imports"] = None  # preloaded by the worker
+            counts, output = results_report.scan_output(stdout.splitlines(keepends=True), tail)
+            err_counts, err_output = results_report.scan_output(
+                stderr.splitlines(keepends=True), tail
+            )
+            counts = counts or err_counts
+        checks = list(results_report.read_checks(results_file))
+
+        passed = returncode == 0
+        # Recorded checks first, then the printed "X/Y PASS" line, then the exit code
+        if checks:
+            passed_count, total_count = results_report.count_checks(checks)
+        elif counts:
+            passed_count, total_count = counts
+        else:
+            passed_count = 1 if passed else 0
+            total_count = 1
+
+        return {
+            "passed": passed,
+            "passed_count": passed_count,
+            "total_count": total_count,
+            "checks": checks,
+            "returncode": returncode,
+            "output": output + err_output,
+            "stderr": err_output,
+            **metrics,
+        }
+    except Exception as e:
+        return {
+            "passed": False,
+            "passed_count": 0,
+            "total_count": 1,
+            "output": str(e),
+            "error": True,
+        }
+    finally:
+        os.unlink(results_file)
+
+
+class Scheduler:
+    """
+    Runs test files with caching, parallelism, timeouts and bookkeeping.
+
+    jobs        : test files at a time (threads, each driving a subprocess
+                  or a warm worker)
+    timeout     : seconds per test file (None = no limit)
+    force       : ignore cached results
+    warm        : run tests in warm workers instead of fresh interpreters
+    profile     : also measure import time
+    cache       : result cache namespace (None = no caching); entry points
+                  keeping different output lengths use different namespaces
+    output_tail : lines of output kept per test (None = all)
+
+    Durations and resource history of executed tests are saved by close().
+    """
+
+    def __init__(
+        self,
+        jobs=1,
+        timeout=TEST_TIMEOUT,
+        force=False,
+        warm=False,
+        profile=False,
+        cache="run_all_tests",
+        output_tail=OUTPUT_TAIL_LINES,
+    ):
+        self.jobs = max(jobs, 1)
+        self.timeout = timeout
+        self.force = force
+        self.profile = profile
+        self.cache = cache
+        self.output_tail = output_tail
+
+        self.durations = load_durations()
+        self.mode = "warm" if warm else "subprocess"
+        self.history = run_profile.load_history()
+        self.previous = run_profile.previous_metrics(self.history, self.mode)
+        self.measured = {}
+
+        self.warm = WarmPool(workers=self.jobs) if warm else None
+        self.pool = ThreadPoolExecutor(max_workers=self.jobs) if self.jobs > 1 else None
+
+    def run_one(self, test):
+        """Result of one test (reused if its inputs are unchanged)."""
+        path = test["path"]
+        if self.cache:
+            key = result_cache.fingerprint(path, salt=self.cache)
+            if not self.force:
+                cached = result_cache.load_result(path, key, self.cache)
+                if cached is not None:
+                    return {**cached, "cached": True}
+
+        start = time.perf_counter()
+        result = execute(path, self.timeout, self.warm, self.profile, self.output_tail)
+        result["duration"] = time.perf_counter() - start
+        if not result.get("error") and self.cache:
+            result_cache.store_result(path, key, self.cache, result)
+        return result
+
+    def run(self, tests):
+        """
+        Yield (test, result) in the order of `tests`.
+
+        With jobs > 1 every test is submitted at once, longest first, and
+        results are handed out in order as they complete.
+        """
+        if self.pool is None:
+            results = (self.run_one(t) for t in tests)
+        else:
+            futures = {}
+            for t in longest_first(tests, self.durations):
+                futures[test_key(t)] = self.pool.submit(self.run_one, t)
+            results = (futures[test_key(t)].result() for t in tests)
+
+        for t, result in zip(tests, results):
+            self._record(t, result)
+            yield t, result
+
+    def _record(self, test, result):
+        key = test_key(test)
+        self.durations[key] = round(result["duration"], 3)
+        if not result.get("cached"):
+            self.measured[key] = {"wall": round(result["duration"], 3)} | {
+                m: result.get(m) for m in run_profile.METRICS if m != "wall"
+            }
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+        if self.warm is not None:
+            self.warm.close()
+        save_durations(self.durations)
+        run_profile.save_run(self.history, self.measured, self.mode)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+
+def add_run_arguments(parser, jobs=1, timeout=TEST_TIMEOUT):
+    """Options shared by every entry point built on the scheduler."""
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=jobs, help="test files to run in parallel"
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=timeout, help="seconds per test file (0 = no limit)"
+    )
+    parser.add_argument("--warm", action="store_true", help="run tests in warm workers")
+    parser.add_argument("--force", action="store_true", help="ignore cached results")
+    parser.add_argument(
+        "--profile", action="store_true", help="time imports, rank tests, show regressions"
+    )
+
+
+def add_selection_arguments(parser):
+    """--topic / --section / --changed / --files test selection options."""
+    parser.add_argument("--topic", action="append", help="topic number or name (repeatable)")
+    parser.add_argument("--section", action="append", help="Code/ section folder (repeatable)")
+    parser.add_argument(
+        "--changed",
+        nargs="?",
+        const="HEAD",
+        metavar="REF",
+        help="only tests affected by changes since REF (git, default HEAD)",
+    )
+    parser.add_argument(
+        "--files", nargs="+", metavar="PATH", help="only tests affected by these changed files"
+    )
+
+
+def select_tests(args, parser):
+    """The tests chosen by add_selection_arguments() options."""
+    tests = find_tests(args.topic, args.section)
+    if args.changed is None and not args.files:
+        return tests
+    changed = {Path(p).resolve() for p in args.files or ()}
+    if args.changed is not None:
+        try:
+            changed |= import_graph.git_changed_files(args.changed)
+        except (OSError, RuntimeError) as e:
+            parser.error(f"--changed: {e}")
+    return import_graph.affected_tests(tests, changed)
+
+
+def scheduler_from_args(args, **kwargs):
+    return Scheduler(
+        jobs=args.jobs,
+        timeout=args.timeout or None,
+        force=args.force,
+        warm=args.warm,
+        profile=args.profile,
+        **kwargs,
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run selected topic tests")
+    add_selection_arguments(parser)
+    parser.add_argument("--list", action="store_true", help="only list the selected tests")
+    add_run_arguments(parser)
+    args = parser.parse_args(argv)
+
+    tests = select_tests(args, parser)
+    if args.list:
+        for t in tests:
+            print(test_key(t))
+        return True
+
+    print(f"Running {len(tests)} test files ({args.jobs} at a time)")
+    passed = total = 0
+    with scheduler_from_args(args) as sched:
+        for t, result in sched.run(tests):
+            passed += result["passed_count"]
+            total += result["total_count"]
+            status = "PASS" if result["passed"] else "FAIL"
+            cached = " [cached]" if result.get("cached") else ""
+            counts = f"({result['passed_count']}/{result['total_count']})"
+            print(f"  {status} {counts}{cached} {test_key(t)}")
+        if args.profile:
+            run_profile.print_profile(sched.measured, sched.previous)
+
+    print(f"\n{passed}/{total} checks passed in {len(tests)} files")
+    return passed == total
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
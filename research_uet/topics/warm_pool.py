@@ -0,0 +1,275 @@
+"""
+Warm Test Workers
+=================
+Runs topic test scripts inside long-lived worker processes instead of a
+fresh interpreter per file.
+
+Every worker imports the heavy third-party modules once (numpy, scipy,
+pandas, plotly, matplotlib, astropy - whichever are installed) and then
+executes each test with runpy as __main__, the way `python test_x.py`
+would:
+
+    - sys.argv = [test], sys.path[0] = the test's folder, cwd = the folder
+    - stdout / stderr captured; SystemExit gives the return code
+    - afterwards cwd, sys.argv, sys.path, os.environ, warnings filters and
+      numpy error state are restored, and every module imported from the
+      repository (core, Data loaders, helpers) is dropped, so the next test
+      imports fresh copies. Third-party modules stay loaded - that is the
+      point.
+
+Workers are replaced after max_tests tests, after a crash and after a
+timeout. Workers are plain (non-daemon) processes so tests may still start
+their own process pools.
+
+    from warm_pool import WarmPool
+    with WarmPool(workers=2) as pool:
+        returncode, stdout, stderr, metrics = pool.run(path, timeout=180)
+"""
+
+import contextlib
+import importlib
+import io
+import multiprocessing
+import os
+import queue
+import runpy
+import sys
+import traceback
+import warnings
+from pathlib import Path
+
+from run_profile import self_usage, usage_since
+
+REPO = Path(__file__).resolve().parents[2]
+PRELOAD = (
+    "numpy",
+    "scipy",
+    "scipy.optimize",
+    "scipy.integrate",
+    "scipy.special",
+    "scipy.stats",
+    "pandas",
+    "plotly.graph_objects",
+    "matplotlib.pyplot",
+    "astropy.units",
+    "astropy.table",
+)
+MAX_TESTS_PER_WORKER = 25
+
+
+class WorkerCrashed(RuntimeError):
+    """The worker process died while running a test."""
+
+
+# =============================================================================
+# WORKER PROCESS
+# =============================================================================
+
+
+def _preload(modules):
+    os.environ.setdefault("MPLBACKEND", "Agg")
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            pass  # optional dependency not installed
+
+
+def _is_repo_module(module):
+    path = getattr(module, "__file__", None)
+    if not path:
+        return False
+    try:
+        return Path(path).resolve().is_relative_to(REPO)
+    except (OSError, ValueError):
+        return False
+
+
+def _exit_code(code):
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def _capture():
+    """A text stream like sys.stdout (tests may call .reconfigure on it)."""
+    return io.TextIOWrapper(io.BytesIO(), encoding="utf-8", errors="replace", write_through=True)
+
+
+def _captured_text(stream):
+    stream.flush()
+    return stream.buffer.getvalue().decode(stream.encoding, errors="replace")
+
+
+def _flush_plots():
+    """Render figures the test queued; its uet_viz module is dropped next."""
+    for name, module in list(sys.modules.items()):
+        if name.rpartition(".")[2] == "uet_viz" and hasattr(module, "flush_plots"):
+            try:
+                module.flush_plots()
+            except Exception:
+                traceback.print_exc()
+
+
+def run_script(path, base_path, env=None):
+    """
+    Run one test script as __main__ in this process.
+
+    env holds extra environment variables for this test only.
+
+    Returns:
+        (returncode, stdout, stderr, metrics): the captured text of both
+        streams, metrics the cpu / max_rss of run_profile.usage_since
+    """
+    path = Path(path).resolve()
+    saved_cwd = os.getcwd()
+    saved_argv, saved_path = sys.argv[:], sys.path[:]
+    saved_environ = dict(os.environ)
+    saved_modules = set(sys.modules)
+    numpy = sys.modules.get("numpy")
+    saved_errstate = numpy.geterr() if numpy else None
+
+    stdout, stderr = _capture(), _capture()
+    usage = self_usage()
+    try:
+        os.chdir(path.parent)
+        os.environ.update(env or {})
+        sys.argv = [str(path)]
+        sys.path[:] = [str(path.parent), *base_path]
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            with warnings.catch_warnings():
+                try:
+                    runpy.run_path(str(path), run_name="__main__")
+                    returncode = 0
+                except SystemExit as e:
+                    returncode = _exit_code(e.code)
+                except BaseException:
+                    traceback.print_exc()
+                    returncode = 1
+                _flush_plots()
+    finally:
+        os.chdir(saved_cwd)
+        sys.argv, sys.path[:] = saved_argv, saved_path
+        os.environ.clear()
+        os.environ.update(saved_environ)
+        for name in set(sys.modules) - saved_modules:
+            if _is_repo_module(sys.modules[name]):
+                del sys.modules[name]
+        if numpy:
+            numpy.seterr(**saved_errstate)
+        if "matplotlib.pyplot" in sys.modules:
+            sys.modules["matplotlib.pyplot"].close("all")
+
+    metrics = usage_since(usage)
+    return returncode, _captured_text(stdout), _captured_text(stderr), metrics
+
+
+def _worker_main(conn, preload, base_path):
+    _preload(preload)
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            return
+        if task is None:
+            return
+        path, env = task
+        conn.send(run_script(path, base_path, env))
+
+
+# =============================================================================
+# PARENT SIDE
+# =============================================================================
+
+
+class WarmWorker:
+    """One worker process and the pipe to it."""
+
+    def __init__(self, context, preload, base_path):
+        self.conn, child = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main, args=(child, preload, base_path), daemon=False
+        )
+        self.process.start()
+        child.close()
+        self.tests_run = 0
+
+    def run(self, path, timeout, env=None):
+        self.conn.send((str(path), env))
+        self.tests_run += 1
+        if not self.conn.poll(timeout):
+            raise TimeoutError(f"{Path(path).name} exceeded {timeout}s")
+        try:
+            return self.conn.recv()
+        except (EOFError, OSError):
+            raise WorkerCrashed(
+                f"worker exited with code {self.process.exitcode} in {Path(path).name}"
+            ) from None
+
+    def stop(self, kill=False):
+        if not kill and self.process.is_alive():
+            try:
+                self.conn.send(None)
+            except OSError:
+                pass
+            self.process.join(5)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+class WarmPool:
+    """
+    Thread-safe pool of warm test workers.
+
+    Each call to run() borrows an idle worker, so up to `workers` tests run
+    at once when run() is called from several threads.
+    """
+
+    def __init__(self, workers=1, max_tests=MAX_TESTS_PER_WORKER, preload=PRELOAD):
+        # spawn: the parent runs scheduler threads, which fork() does not mix with
+        self.context = multiprocessing.get_context("spawn")
+        self.preload = tuple(preload)
+        self.max_tests = max_tests
+        # What `python test_x.py` would see after its own folder
+        here = str(Path(__file__).resolve().parent)
+        self.base_path = [p for p in sys.path[1:] if p != here]
+        os.environ.setdefault("PYTHONUTF8", "1")  # like `python -X utf8`
+        self.idle = queue.Queue()
+        for _ in range(workers):
+            self.idle.put(self._start())
+
+    def _start(self):
+        return WarmWorker(self.context, self.preload, self.base_path)
+
+    def run(self, path, timeout=None, env=None):
+        """Run one test script (with extra env vars); returns (returncode, stdout, stderr, metrics)."""
+        worker = self.idle.get()
+        try:
+            result = worker.run(path, timeout, env)
+        except (TimeoutError, WorkerCrashed):
+            worker.stop(kill=True)
+            self.idle.put(self._start())
+            raise
+        if worker.tests_run >= self.max_tests:
+            worker.stop()
+            worker = self._start()
+        self.idle.put(worker)
+        return result
+
+    def close(self):
+        while True:
+            try:
+                self.idle.get_nowait().stop()
+            except queue.Empty:
+                return
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -1,70 +1,65 @@
+import argparse
 import os
 import sys
-import subprocess
-import time
 
 # Get project root
 current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(current_dir)
+sys.path.insert(0, os.path.join(project_root, "research_uet", "topics"))
+
+from scheduler import add_run_arguments, scheduler_from_args, test_entry  # noqa: E402
 
 # List of critical validation scripts (paths relative to project root)
+TOPICS = "research_uet/topics"
+SC = f"{TOPICS}/0.4_Superconductivity_Superfluids/Code/superconductivity_tc"
 scripts = [
     # Phase 1: Particle Physics & Strong Force
+    # No topics/ copy of the SM bridge exists yet; reported as not found
     "research_uet/lab/01_particle_physics/standard_model/test_uet_sm_bridge.py",
-    "research_uet/lab/01_particle_physics/strong_nuclear/test_strong_force.py",
+    f"{TOPICS}/0.5_Nuclear_Binding_Hadrons/Code/nuclear_binding_250/test_strong_force.py",
     # Phase 2: Astrophysics (Galaxies)
-    "research_uet/lab/02_astrophysics/galaxies/test_175_galaxies.py",
+    f"{TOPICS}/0.1_Galaxy_Rotation_Problem/Code/galaxy_rotation_175/test_175_galaxies.py",
     # Phase 3: Astrophysics (Black Holes & Thermo)
-    "research_uet/lab/ultimate_ccbh_analysis.py",
+    f"{TOPICS}/0.2_Black_Hole_Physics/Code/black_hole_saturation/ultimate_ccbh_analysis.py",
     # Phase 4: Condensed Matter (V-B Bridge)
-    "research_uet/lab/03_condensed_matter/condensed_matter/test_superconductivity.py",
+    f"{SC}/test_superconductivity.py",
 ]
 
 
-def run_script(path):
+def print_result(path, result):
     print(f"\n{'='*60}")
     print(f"🚀 RUNNING: {path}")
     print(f"{'='*60}")
 
-    full_path = os.path.join(project_root, path)
-    if not os.path.exists(full_path):
-        print(f"❌ ERROR: File not found: {full_path}")
+    if result is None:
+        print(f"❌ ERROR: File not found: {os.path.join(project_root, path)}")
         return False
 
-    start_time = time.time()
-    try:
-        # Run the script and capture output
-        # Ensure we run from project root
-        result = subprocess.run(
-            [sys.executable, os.path.join(project_root, path)],
-            cwd=project_root,
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-        )
-        duration = time.time() - start_time
-
-        # Print Output
-        print(result.stdout)
-
-        if result.stderr:
-            print("⚠️ STDERR:")
-            print(result.stderr)
-
-        if result.returncode == 0:
-            print(f"\n✅ PASS ({duration:.2f}s)")
-            return True
-        else:
-            print(f"\n❌ FAIL (Return Code: {result.returncode})")
-            return False
+    if result.get("error"):
+        print(f"\n❌ EXCEPTION: {result['output']}")
+        return False
+
+    # Print Output ("output" holds stdout, then stderr)
+    stderr = result["stderr"]
+    print(result["output"][: len(result["output"]) - len(stderr)])
 
-    except Exception as e:
-        print(f"\n❌ EXCEPTION: {e}")
+    if stderr:
+        print("⚠️ STDERR:")
+        print(stderr)
+
+    if result["passed"]:
+        print(f"\n✅ PASS ({result['duration']:.2f}s)")
+        return True
+    else:
+        print(f"\n❌ FAIL (Return Code: {result['returncode']})")
         return False
 
 
-def main():
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the foundation validation scripts")
+    add_run_arguments(parser, timeout=0)
+    args = parser.parse_args(argv)
+
     print("🌌 UET GRAND UNIFIED VALIDATION RUN 🌌")
     print("========================================")
 
@@ -72,8 +67,13 @@ def main():
     failed = 0
     results = {}
 
+    existing = [s for s in scripts if os.path.exists(os.path.join(project_root, s))]
+    tests = [test_entry(os.path.join(project_root, s)) for s in existing]
+    with scheduler_from_args(args, cache="foundation", output_tail=None) as sched:
+        ran = {path: result for path, (_, result) in zip(existing, sched.run(tests))}
+
     for script in scripts:
-        success = run_script(script)
+        success = print_result(script, ran.get(script))
         results[script] = "PASS" if success else "FAIL"
         if success:
             passed += 1